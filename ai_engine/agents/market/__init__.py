@@ -1,11 +1,12 @@
 """Market subgraph package."""
 
 from .graph import create_market_subgraph
-from .schema import MarketSubgraphState, MarketWorkerOutput, MarketEvaluation
+from .schema import MarketSubgraphState, MarketSubgraphStateInternal, MarketWorkerOutput, MarketEvaluation
 
 __all__ = [
     "create_market_subgraph",
     "MarketSubgraphState",
+    "MarketSubgraphStateInternal",
     "MarketWorkerOutput",
     "MarketEvaluation",
 ]
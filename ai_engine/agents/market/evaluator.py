@@ -1,60 +1,36 @@
 """Market evaluator - LLM-based validation of market analysis."""
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
 
-from ...utils.llm_v2 import get_llm, LLMConfig
-from ...utils.logger import get_logger
-from ...utils.json_fixer import fix_json_string
-from .schema import MarketSubgraphState, MarketEvaluation
+from ...utils.llm_v2 import get_evaluator_llm, cacheable_system_message, acall_with_backoff, LLMConfig
+from ...utils.aio import run_sync
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import EvaluationCache
+from .fast_check import fast_validate
+from .schema import MarketSubgraphStateInternal, MarketEvaluation
 
 logger = get_logger(__name__)
 
+# Nearby ticks with the same quantized indicators reuse one evaluation
+_EVAL_CACHE = EvaluationCache(
+    MarketEvaluation,
+    quantize={
+        "rsi": 1.0,
+        "volume_ratio": 0.01,
+        "trend_strength": 0.05,
+    },
+    # EMAs scale with price: 5 bps bins
+    relative={
+        "ema_short": 0.0005,
+        "ema_long": 0.0005,
+    },
+)
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            # Try normal parsing first
-            return super().parse(text)
-        except OutputParserException as e:
-            # Try fixing JSON
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                # Re-raise original error if fix didn't work
-                raise e
-
-
-def market_evaluator(state: MarketSubgraphState) -> MarketSubgraphState:
-    """Evaluate market worker output using LLM.
-    
-    Single responsibility: Judge quality and confidence of market analysis.
-    Does NOT make trading decisions - only evaluates data quality.
-    
-    Uses LCEL: prompt | llm | parser
-    
-    Args:
-        state: State with worker_output to evaluate
-        
-    Returns:
-        Updated state with evaluation populated
-    """
-    try:
-        if not state.worker_output:
-            raise ValueError("No worker output to evaluate")
-        
-        logger.info(f"Market evaluator validating {state.symbol}")
-        
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=MarketEvaluation)
-        
-        # Create prompt
-        system_message = """You are a technical analysis quality evaluator.
+
+SYSTEM_MESSAGE = """You are a technical analysis quality evaluator.
 
 Your job is to assess the QUALITY and CONSISTENCY of market indicator data.
 You do NOT make trading decisions - only evaluate data quality.
@@ -70,11 +46,9 @@ Provide:
 - quality_score: overall data quality (0.0-1.0)
 - issues: list any problems or inconsistencies
 - summary: brief market condition summary
-- recommendation: what this data suggests (NOT a trading decision)
-
-{format_instructions}"""
+- recommendation: what this data suggests (NOT a trading decision)"""
 
-        human_message = """Symbol: {symbol}
+HUMAN_MESSAGE = """Symbol: {symbol}
 
 Market Indicators:
 - RSI: {rsi:.1f} ({rsi_signal})
@@ -84,45 +58,79 @@ Market Indicators:
 
 Evaluate this market analysis."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
+# Built once at import. The system block is kept first and byte-identical so
+# providers can serve it from their prompt-prefix cache; only the human
+# message varies per call. No format instructions: the schema is enforced
+# by the provider's structured-output mode.
+_PROMPT = ChatPromptTemplate.from_messages([
+    cacheable_system_message(SYSTEM_MESSAGE, LLMConfig.EVALUATORS.get("provider")),
+    ("human", HUMAN_MESSAGE),
+])
+
+
+@lru_cache(maxsize=1)
+def _get_chain() -> Runnable:
+    """Build the evaluator LCEL chain once, on first use.
+    
+    The provider enforces the MarketEvaluation schema; a configured draft model is
+    tried first.
+    """
+    return _PROMPT | get_evaluator_llm(MarketEvaluation)
+
+
+async def amarket_evaluator(state: MarketSubgraphStateInternal) -> dict:
+    """Evaluate market worker output using LLM.
+    
+    Single responsibility: Judge quality and confidence of market analysis.
+    Does NOT make trading decisions - only evaluates data quality.
+    
+    Uses LCEL: prompt | structured llm
+    
+    Args:
+        state: State with worker_output to evaluate
         
-        # Build LCEL chain with retry
-        llm = get_llm(**LLMConfig.EVALUATORS)  # Use configured evaluator LLM
-        chain = prompt | llm | parser
+    Returns:
+        Partial state update with evaluation populated
+    """
+    try:
+        if not state.worker_output:
+            raise ValueError("No worker output to evaluate")
+        
+        # Unambiguous outputs are validated by rules; no LLM call needed
+        evaluation = fast_validate(state.worker_output)
+        if evaluation is not None:
+            logger.info("Market evaluator fast path for %s: signals consistent", state.symbol)
+            return {
+                "evaluation": evaluation,
+                "evaluator_feedback": None,
+                "completed": True,
+                "error": None,
+            }
         
-        # Invoke with retry logic (up to 3 attempts)
-        max_retries = 3
-        last_error = None
+        logger.info("Market evaluator validating %s", state.symbol)
         
-        for attempt in range(max_retries):
-            try:
-                evaluation = chain.invoke({
-                    "symbol": state.symbol,
-                    "rsi": state.worker_output.rsi,
-                    "rsi_signal": state.worker_output.rsi_signal,
-                    "ema_short": state.worker_output.ema_short,
-                    "ema_long": state.worker_output.ema_long,
-                    "ema_signal": state.worker_output.ema_signal,
-                    "volume_ratio": state.worker_output.volume_ratio,
-                    "volume_signal": state.worker_output.volume_signal,
-                    "trend_direction": state.worker_output.trend_direction,
-                    "trend_strength": state.worker_output.trend_strength,
-                    "format_instructions": parser.get_format_instructions(),
-                })
-                break  # Success, exit retry loop
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"Market evaluator attempt {attempt + 1}/{max_retries} failed: {last_error}")
-                if attempt < max_retries - 1:
-                    # Add error feedback to prompt for retry
-                    human_message += f"\n\n[Previous attempt failed with error: {last_error}. Please provide valid JSON with all required fields.]"
+        inputs = {
+            "symbol": state.symbol,
+            "rsi": state.worker_output.rsi,
+            "rsi_signal": state.worker_output.rsi_signal,
+            "ema_short": state.worker_output.ema_short,
+            "ema_long": state.worker_output.ema_long,
+            "ema_signal": state.worker_output.ema_signal,
+            "volume_ratio": state.worker_output.volume_ratio,
+            "volume_signal": state.worker_output.volume_signal,
+            "trend_direction": state.worker_output.trend_direction,
+            "trend_strength": state.worker_output.trend_strength,
+        }
+        
+        # Output is schema-valid by construction; only network/rate-limit
+        # errors are retried, with backoff
+        evaluation = await acall_with_backoff(
+            lambda: _EVAL_CACHE.aget_or_call(inputs, lambda: _get_chain().ainvoke(inputs))
+        )
         
         logger.info(
-            f"Market evaluator completed: valid={evaluation.is_valid}, "
-            f"confidence={evaluation.confidence:.2f}, quality={evaluation.quality_score:.2f}"
+            "Market evaluator completed: valid=%s, confidence=%.2f, quality=%.2f",
+            evaluation.is_valid, evaluation.confidence, evaluation.quality_score,
         )
         
         # Prepare feedback for worker retry if validation failed
@@ -136,29 +144,20 @@ Evaluate this market analysis."""
             )
             new_retry_count = state.retry_count + 1
         
-        return MarketSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=state.worker_output,
-            evaluation=evaluation,
-            retry_count=new_retry_count,
-            max_retries=state.max_retries,
-            evaluator_feedback=evaluator_feedback,
-            completed=evaluation.is_valid,  # Only complete if validation passed
-            error=None,
-        )
+        return {
+            "evaluation": evaluation,
+            "retry_count": new_retry_count,
+            "evaluator_feedback": evaluator_feedback,
+            "completed": evaluation.is_valid,  # Only complete if validation passed
+            "error": None,
+        }
         
     except Exception as e:
-        logger.error(f"Market evaluator error: {e}", exc_info=True)
+        logger.error("Market evaluator error: %s", e, exc_info=debug_exc_info(logger))
         
         # Return with default evaluation on error
-        return MarketSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=state.worker_output,
-            evaluation=MarketEvaluation(
+        return {
+            "evaluation": MarketEvaluation(
                 is_valid=False,
                 confidence=0.0,
                 quality_score=0.0,
@@ -166,6 +165,11 @@ Evaluate this market analysis."""
                 summary="Evaluation error",
                 recommendation="Unable to evaluate - treat with caution",
             ),
-            completed=True,
-            error=f"Evaluator failed: {str(e)}",
-        )
+            "completed": True,
+            "error": f"Evaluator failed: {str(e)}",
+        }
+
+
+def market_evaluator(state: MarketSubgraphStateInternal) -> dict:
+    """Sync entry point for amarket_evaluator (used by graph.invoke)."""
+    return run_sync(amarket_evaluator(state))
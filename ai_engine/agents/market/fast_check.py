@@ -0,0 +1,60 @@
+"""Market fast check - rule-based validation that skips the LLM evaluator.
+
+When every indicator points the same way there is nothing for the LLM to
+arbitrate, so a high-confidence evaluation is synthesized directly. Only
+ambiguous or contradictory outputs fall through to the LLM evaluator.
+"""
+
+from typing import Optional
+
+from .schema import MarketWorkerOutput, MarketEvaluation
+
+# (rsi_signal, ema_signal, volume_signal, trend_direction) combinations where
+# the indicators agree: RSI not at an extreme, EMA crossover matching the
+# trend, and volume confirming rather than drying up.
+_CONSISTENT_SIGNALS = frozenset({
+    ("neutral", "bullish", "normal", "bullish"),
+    ("neutral", "bullish", "high", "bullish"),
+    ("neutral", "bearish", "normal", "bearish"),
+    ("neutral", "bearish", "high", "bearish"),
+})
+
+
+def fast_validate(worker_output: MarketWorkerOutput) -> Optional[MarketEvaluation]:
+    """Validate obviously consistent market output without an LLM call.
+    
+    Args:
+        worker_output: Market worker output to check
+        
+    Returns:
+        High-confidence MarketEvaluation if the signals agree, else None
+    """
+    signals = (
+        worker_output.rsi_signal,
+        worker_output.ema_signal,
+        worker_output.volume_signal,
+        worker_output.trend_direction,
+    )
+    if signals not in _CONSISTENT_SIGNALS:
+        return None
+    
+    # Values must also be in range; anything odd goes to the LLM
+    if not (0.0 <= worker_output.rsi <= 100.0):
+        return None
+    if worker_output.ema_short <= 0 or worker_output.ema_long <= 0:
+        return None
+    if not (0.0 <= worker_output.trend_strength <= 1.0):
+        return None
+    
+    trend = worker_output.trend_direction
+    return MarketEvaluation(
+        is_valid=True,
+        confidence=0.9,
+        quality_score=0.9,
+        issues=[],
+        summary=(
+            f"Consistent {trend} setup: RSI {worker_output.rsi:.1f} neutral, "
+            f"EMA {worker_output.ema_signal}, volume {worker_output.volume_signal}"
+        ),
+        recommendation=f"Indicators agree on a {trend} trend",
+    )
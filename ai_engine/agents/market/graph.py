@@ -1,25 +1,32 @@
 """Market subgraph builder - worker → evaluator workflow."""
 
+from dataclasses import replace
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from ...utils.logger import get_logger
-from .schema import MarketSubgraphState
+from .schema import MarketSubgraphStateInternal
 from .worker import market_worker
-from .evaluator import market_evaluator
+from .evaluator import market_evaluator, amarket_evaluator
 
 logger = get_logger(__name__)
 
 
-def should_retry_worker(state: MarketSubgraphState) -> str:
+def should_retry_worker(state: MarketSubgraphStateInternal) -> str:
     """Decide if worker should retry based on evaluator feedback.
     
     Returns:
-        'worker' if evaluation failed and retries remain
+        'market' if evaluation failed and retries remain
         'END' if evaluation passed or max retries reached
     """
     if not state.evaluation:
         return END
     
+    # Worker/evaluator errors (e.g. no LLM configured) are not fixed by a retry
+    if state.error:
+        return END
+    
     # If evaluation is valid, we're done
     if state.evaluation.is_valid:
         return END
@@ -40,19 +47,37 @@ def should_retry_worker(state: MarketSubgraphState) -> str:
     
     # Retry with feedback
     logger.info(
-        f"Market worker retry {state.retry_count}/{state.max_retries} for {state.symbol}. "
-        f"Evaluator feedback: {state.evaluation.issues}"
+        "Market worker retry %d/%d for %s. Evaluator feedback: %s",
+        state.retry_count, state.max_retries, state.symbol, state.evaluation.issues,
     )
-    return "worker"
+    return "market"
 
 
-def create_market_subgraph() -> StateGraph:
-    """Create market analysis subgraph.
+def market_worker_and_evaluator(state: MarketSubgraphStateInternal) -> dict:
+    """Run worker then evaluator as one node (one state transition per attempt).
+    
+    The evaluator always consumes the worker output, so there is nothing to
+    gain from a graph edge between them.
+    """
+    worker_update = market_worker(state)
+    evaluator_update = market_evaluator(replace(state, **worker_update))
+    return {**worker_update, **evaluator_update}
+
+
+async def amarket_worker_and_evaluator(state: MarketSubgraphStateInternal) -> dict:
+    """Async variant of market_worker_and_evaluator."""
+    worker_update = market_worker(state)
+    evaluator_update = await amarket_evaluator(replace(state, **worker_update))
+    return {**worker_update, **evaluator_update}
+
+
+def _build() -> StateGraph:
+    """Build and compile the market analysis subgraph.
     
     Architecture:
-        START → worker → evaluator → [conditional]
+        START → market (worker + evaluator) → [conditional]
         If evaluator rejects (is_valid=False) and retry_count < max_retries:
-            → worker (with feedback)
+            → market (with feedback)
         Else:
             → END
         
@@ -64,24 +89,40 @@ def create_market_subgraph() -> StateGraph:
     """
     logger.info("Creating market subgraph")
     
-    # Create graph with MarketSubgraphState
-    graph = StateGraph(MarketSubgraphState)
+    # Create graph with the unvalidated dataclass state (MarketSubgraphState is
+    # converted with MarketSubgraphStateInternal.from_pydantic at the boundary)
+    graph = StateGraph(MarketSubgraphStateInternal)
     
-    # Add nodes
-    graph.add_node("worker", market_worker)
-    graph.add_node("evaluator", market_evaluator)
+    # Single fused node; async path lets concurrent subgraphs overlap their
+    # evaluator LLM calls on one event loop
+    graph.add_node("market", RunnableLambda(market_worker_and_evaluator, afunc=amarket_worker_and_evaluator))
     
-    # Define flow: worker → evaluator → conditional
-    graph.set_entry_point("worker")
-    graph.add_edge("worker", "evaluator")
+    # Define flow: market → conditional (market again on retry)
+    graph.set_entry_point("market")
     graph.add_conditional_edges(
-        "evaluator",
+        "market",
         should_retry_worker,
-        {"worker": "worker", END: END}
+        {"market": "market", END: END}
     )
     
-    # Compile
-    workflow = graph.compile()
+    # Compile without a checkpointer: the compiled graph holds no per-run
+    # state, so one instance is shared by every caller
+    workflow = graph.compile(checkpointer=None)
     
     logger.info("Market subgraph created successfully with retry logic")
     return workflow
+
+
+_MARKET_SUBGRAPH = _build()
+
+
+def create_market_subgraph() -> StateGraph:
+    """Return the shared compiled Market subgraph.
+    
+    The subgraph is compiled once at import; it is stateless with respect to
+    its input, so it is safe to reuse across requests and concurrent runs.
+    
+    Returns:
+        Compiled Market subgraph
+    """
+    return _MARKET_SUBGRAPH
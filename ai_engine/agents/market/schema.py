@@ -1,7 +1,10 @@
 """Market subgraph schema - Pydantic models for market analysis."""
 
+from dataclasses import dataclass, field, fields
 from typing import Optional
-from pydantic import BaseModel, Field
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MarketWorkerOutput(BaseModel):
@@ -46,10 +49,13 @@ class MarketEvaluation(BaseModel):
 class MarketSubgraphState(BaseModel):
     """State for market subgraph."""
     
+    # Nodes return partial dicts, so the price series is validated once on entry
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=False)
+    
     # Input
     symbol: str
-    prices: list[float]
-    volumes: list[float]
+    prices: np.ndarray = Field(..., repr=False)
+    volumes: np.ndarray = Field(..., repr=False)
     
     # Worker output
     worker_output: Optional[MarketWorkerOutput] = None
@@ -68,3 +74,39 @@ class MarketSubgraphState(BaseModel):
     # Combined output (for parent graph)
     completed: bool = False
     error: Optional[str] = None
+    
+    @field_validator("prices", "volumes", mode="before")
+    @classmethod
+    def _as_float_array(cls, value):
+        """Convert the series to a contiguous float64 array once, on entry."""
+        return np.ascontiguousarray(value, dtype=np.float64)
+
+
+@dataclass(slots=True, frozen=True)
+class MarketSubgraphStateInternal:
+    """Unvalidated mirror of MarketSubgraphState used as the LangGraph state.
+    
+    MarketSubgraphState validates the input once at the subgraph boundary; inside
+    the graph, node hops build this dataclass instead, so the price series
+    is not re-validated element by element on every step.
+    """
+    
+    symbol: str
+    prices: np.ndarray = field(repr=False)
+    volumes: np.ndarray = field(repr=False)
+    worker_output: Optional[MarketWorkerOutput] = None
+    evaluation: Optional[MarketEvaluation] = None
+    retry_count: int = 0
+    max_retries: int = 2
+    evaluator_feedback: Optional[str] = None
+    completed: bool = False
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_pydantic(cls, state: MarketSubgraphState) -> "MarketSubgraphStateInternal":
+        """Build from a validated MarketSubgraphState (no copying of the series)."""
+        return cls(**{f.name: getattr(state, f.name) for f in fields(cls)})
+    
+    def to_pydantic(self) -> MarketSubgraphState:
+        """Convert back to the validated Pydantic state."""
+        return MarketSubgraphState(**{f.name: getattr(self, f.name) for f in fields(self)})
@@ -1,18 +1,70 @@
 """Market worker - deterministic technical analysis."""
 
+import numpy as np
+
 from ...tools.market import (
     calculate_rsi,
     calculate_ema,
     get_trend_direction,
     get_market_indicators,
 )
-from ...utils.logger import get_logger
-from .schema import MarketSubgraphState, MarketWorkerOutput
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import LRUCache, series_digest
+from .schema import MarketSubgraphStateInternal, MarketWorkerOutput
 
 logger = get_logger(__name__)
 
+# Keyed by (symbol, content hash of prices+volumes)
+_OUTPUT_CACHE = LRUCache(maxsize=256)
+
+
+def _build_worker_output(symbol: str, prices: np.ndarray, volumes: np.ndarray) -> MarketWorkerOutput:
+    """Compute indicators and derived signals for one price/volume series."""
+    # Get all indicators (deterministic, vectorized over contiguous arrays)
+    indicators = get_market_indicators(symbol, prices, volumes)
+    
+    # Determine EMA signal
+    ema_20 = indicators.get("ema_20", 0)
+    ema_50 = indicators.get("ema_50", 0)
+    if ema_20 > ema_50:
+        ema_signal = "bullish"
+    elif ema_20 < ema_50:
+        ema_signal = "bearish"
+    else:
+        ema_signal = "neutral"
+    
+    # Determine volume signal
+    volume_current = indicators.get("volume_current", 0)
+    volume_avg = indicators.get("volume_avg", 1)
+    volume_ratio = volume_current / volume_avg if volume_avg > 0 else 1.0
+    
+    if volume_ratio > 1.5:
+        volume_signal = "high"
+    elif volume_ratio < 0.5:
+        volume_signal = "low"
+    else:
+        volume_signal = "normal"
+    
+    # Determine trend strength (based on price momentum)
+    trend = indicators.get("trend", "sideways")
+    price_change = abs(indicators.get("price_change_24h", 0))
+    trend_strength = min(price_change / 10.0, 1.0)  # Normalize to 0-1
+    
+    # Create structured output
+    return MarketWorkerOutput(
+        rsi=indicators["rsi"],
+        rsi_signal=indicators["rsi_signal"],
+        ema_short=ema_20,
+        ema_long=ema_50,
+        ema_signal=ema_signal,
+        volume_ratio=volume_ratio,
+        volume_signal=volume_signal,
+        trend_direction=trend,
+        trend_strength=trend_strength,
+    )
 
-def market_worker(state: MarketSubgraphState) -> MarketSubgraphState:
+
+def market_worker(state: MarketSubgraphStateInternal) -> dict:
     """Execute deterministic market analysis.
     
     Single responsibility: Calculate technical indicators.
@@ -25,81 +77,45 @@ def market_worker(state: MarketSubgraphState) -> MarketSubgraphState:
         state: Current subgraph state with symbol, prices, volumes
         
     Returns:
-        Updated state with worker_output populated
+        Partial state update with worker_output populated
     """
+    # Output prefetched by the parent graph while the supervisor was planning
+    if state.worker_output is not None and state.retry_count == 0:
+        return {"completed": False, "error": None}
+    
     try:
-        logger.info(f"Market worker analyzing {state.symbol}")
+        logger.info("Market worker analyzing %s", state.symbol)
         
         # If this is a retry, log the evaluator feedback
         if state.retry_count > 0:
             logger.warning(
-                f"Market worker retry attempt {state.retry_count}/{state.max_retries} for {state.symbol}. "
-                f"Evaluator feedback: {state.evaluator_feedback}"
+                "Market worker retry attempt %d/%d for %s. Evaluator feedback: %s",
+                state.retry_count, state.max_retries, state.symbol, state.evaluator_feedback,
             )
         
-        # Get all indicators (deterministic)
-        indicators = get_market_indicators(state.symbol, state.prices, state.volumes)
-        
-        # Determine EMA signal
-        ema_20 = indicators.get("ema_20", 0)
-        ema_50 = indicators.get("ema_50", 0)
-        if ema_20 > ema_50:
-            ema_signal = "bullish"
-        elif ema_20 < ema_50:
-            ema_signal = "bearish"
-        else:
-            ema_signal = "neutral"
-        
-        # Determine volume signal
-        volume_current = indicators.get("volume_current", 0)
-        volume_avg = indicators.get("volume_avg", 1)
-        volume_ratio = volume_current / volume_avg if volume_avg > 0 else 1.0
-        
-        if volume_ratio > 1.5:
-            volume_signal = "high"
-        elif volume_ratio < 0.5:
-            volume_signal = "low"
-        else:
-            volume_signal = "normal"
-        
-        # Determine trend strength (based on price momentum)
-        trend = indicators.get("trend", "sideways")
-        price_change = abs(indicators.get("price_change_24h", 0))
-        trend_strength = min(price_change / 10.0, 1.0)  # Normalize to 0-1
-        
-        # Create structured output
-        worker_output = MarketWorkerOutput(
-            rsi=indicators["rsi"],
-            rsi_signal=indicators["rsi_signal"],
-            ema_short=ema_20,
-            ema_long=ema_50,
-            ema_signal=ema_signal,
-            volume_ratio=volume_ratio,
-            volume_signal=volume_signal,
-            trend_direction=trend,
-            trend_strength=trend_strength,
-        )
+        # Worker is deterministic: retries on unchanged data reuse the cached output.
+        # The state already holds float64 arrays, so asarray does not copy.
+        prices = np.asarray(state.prices, dtype=np.float64)
+        volumes = np.asarray(state.volumes, dtype=np.float64)
+        cache_key = (state.symbol, series_digest(prices, volumes))
+        worker_output = _OUTPUT_CACHE.get(cache_key)
+        if worker_output is None:
+            worker_output = _build_worker_output(state.symbol, prices, volumes)
+            _OUTPUT_CACHE.set(cache_key, worker_output)
         
-        logger.info(f"Market worker completed: trend={worker_output.trend_direction}, rsi={worker_output.rsi:.1f}")
+        logger.info("Market worker completed: trend=%s, rsi=%.1f", worker_output.trend_direction, worker_output.rsi)
         
-        return MarketSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=worker_output,
-            evaluation=state.evaluation,
-            completed=False,
-            error=None,
-        )
+        return {
+            "worker_output": worker_output,
+            "completed": False,
+            "error": None,
+        }
         
     except Exception as e:
-        logger.error(f"Market worker error: {e}", exc_info=True)
-        return MarketSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=None,
-            evaluation=None,
-            completed=True,
-            error=f"Market worker failed: {str(e)}",
-        )
+        logger.error("Market worker error: %s", e, exc_info=debug_exc_info(logger))
+        return {
+            "worker_output": None,
+            "evaluation": None,
+            "completed": True,
+            "error": f"Market worker failed: {str(e)}",
+        }
@@ -1,11 +1,12 @@
 """ML subgraph package."""
 
 from .graph import create_ml_subgraph
-from .schema import MLSubgraphState, MLWorkerOutput, MLEvaluation
+from .schema import MLSubgraphState, MLSubgraphStateInternal, MLWorkerOutput, MLEvaluation
 
 __all__ = [
     "create_ml_subgraph",
     "MLSubgraphState",
+    "MLSubgraphStateInternal",
     "MLWorkerOutput",
     "MLEvaluation",
 ]
@@ -1,57 +1,30 @@
 """ML evaluator - LLM-based validation of ML predictions."""
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
 
-from ...utils.llm_v2 import get_llm, LLMConfig
-from ...utils.logger import get_logger
-from ...utils.json_fixer import fix_json_string
-from .schema import MLSubgraphState, MLEvaluation
+from ...utils.llm_v2 import get_evaluator_llm, cacheable_system_message, acall_with_backoff, LLMConfig
+from ...utils.aio import run_sync
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import EvaluationCache
+from .fast_check import fast_validate
+from .schema import MLSubgraphStateInternal, MLEvaluation
 
 logger = get_logger(__name__)
 
+# Nearby ticks with the same quantized predictions reuse one evaluation
+_EVAL_CACHE = EvaluationCache(
+    MLEvaluation,
+    quantize={
+        "direction_confidence": 0.05,
+        "volatility_score": 0.05,
+    },
+)
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            return super().parse(text)
-        except OutputParserException as e:
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                raise e
-
-
-def ml_evaluator(state: MLSubgraphState) -> MLSubgraphState:
-    """Evaluate ML worker output using LLM.
-    
-    Single responsibility: Judge quality and reliability of ML predictions.
-    Does NOT make trading decisions - only evaluates prediction quality.
-    
-    Uses LCEL: prompt | llm | parser
-    
-    Args:
-        state: State with worker_output to evaluate
-        
-    Returns:
-        Updated state with evaluation populated
-    """
-    try:
-        if not state.worker_output:
-            raise ValueError("No worker output to evaluate")
-        
-        logger.info(f"ML evaluator validating {state.symbol}")
-        
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=MLEvaluation)
-        
-        # Create prompt
-        system_message = """You are an ML prediction quality evaluator.
+
+SYSTEM_MESSAGE = """You are an ML prediction quality evaluator.
 
 Your job is to assess the QUALITY and RELIABILITY of ML predictions.
 You do NOT make trading decisions - only evaluate prediction quality.
@@ -67,11 +40,9 @@ Provide:
 - quality_score: overall prediction quality (0.0-1.0)
 - issues: list any concerns about predictions
 - summary: brief prediction summary
-- recommendation: how to use these predictions
-
-{format_instructions}"""
+- recommendation: how to use these predictions"""
 
-        human_message = """Symbol: {symbol}
+HUMAN_MESSAGE = """Symbol: {symbol}
 
 ML Predictions:
 - Direction: {predicted_direction} (confidence: {direction_confidence:.2f})
@@ -80,47 +51,75 @@ ML Predictions:
 
 Evaluate these ML predictions."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
+# Built once at import. The system block is kept first and byte-identical so
+# providers can serve it from their prompt-prefix cache; only the human
+# message varies per call. No format instructions: the schema is enforced
+# by the provider's structured-output mode.
+_PROMPT = ChatPromptTemplate.from_messages([
+    cacheable_system_message(SYSTEM_MESSAGE, LLMConfig.EVALUATORS.get("provider")),
+    ("human", HUMAN_MESSAGE),
+])
+
+
+@lru_cache(maxsize=1)
+def _get_chain() -> Runnable:
+    """Build the evaluator LCEL chain once, on first use.
+    
+    The provider enforces the MLEvaluation schema; a configured draft model is
+    tried first.
+    """
+    return _PROMPT | get_evaluator_llm(MLEvaluation)
+
+
+async def aml_evaluator(state: MLSubgraphStateInternal) -> dict:
+    """Evaluate ML worker output using LLM.
+    
+    Single responsibility: Judge quality and reliability of ML predictions.
+    Does NOT make trading decisions - only evaluates prediction quality.
+    
+    Uses LCEL: prompt | structured llm
+    
+    Args:
+        state: State with worker_output to evaluate
         
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.EVALUATORS)  # Use configured evaluator LLM
-        chain = prompt | llm | parser
+    Returns:
+        Partial state update with evaluation populated
+    """
+    try:
+        if not state.worker_output:
+            raise ValueError("No worker output to evaluate")
+        
+        # Unambiguous outputs are validated by rules; no LLM call needed
+        evaluation = fast_validate(state.worker_output)
+        if evaluation is not None:
+            logger.info("ML evaluator fast path for %s: signals consistent", state.symbol)
+            return {
+                "evaluation": evaluation,
+                "evaluator_feedback": None,
+                "completed": True,
+                "error": None,
+            }
         
-        # Invoke with retry logic (up to 3 attempts)
-        max_retries = 3
-        last_error = None
+        logger.info("ML evaluator validating %s", state.symbol)
         
-        for attempt in range(max_retries):
-            try:
-                evaluation = chain.invoke({
-                    "symbol": state.symbol,
-                    "predicted_direction": state.worker_output.predicted_direction,
-                    "direction_confidence": state.worker_output.direction_confidence,
-                    "predicted_volatility": state.worker_output.predicted_volatility,
-                    "volatility_score": state.worker_output.volatility_score,
-                    "prediction_quality": state.worker_output.prediction_quality,
-                    "format_instructions": parser.get_format_instructions(),
-                })
-                break  # Success, exit retry loop
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"ML evaluator attempt {attempt + 1}/{max_retries} failed: {last_error[:200]}")
-                if attempt < max_retries - 1:
-                    # Update prompt with error feedback for next attempt
-                    prompt = ChatPromptTemplate.from_messages([
-                        ("system", system_message),
-                        ("human", human_message + f"\n\n[RETRY {attempt + 2}/{max_retries}] Previous attempt failed: {last_error[:300]}\nPlease provide valid JSON with ALL required fields."),
-                    ])
-                    chain = prompt | llm | parser
-                else:
-                    raise  # Re-raise on final attempt
+        inputs = {
+            "symbol": state.symbol,
+            "predicted_direction": state.worker_output.predicted_direction,
+            "direction_confidence": state.worker_output.direction_confidence,
+            "predicted_volatility": state.worker_output.predicted_volatility,
+            "volatility_score": state.worker_output.volatility_score,
+            "prediction_quality": state.worker_output.prediction_quality,
+        }
+        
+        # Output is schema-valid by construction; only network/rate-limit
+        # errors are retried, with backoff
+        evaluation = await acall_with_backoff(
+            lambda: _EVAL_CACHE.aget_or_call(inputs, lambda: _get_chain().ainvoke(inputs))
+        )
         
         logger.info(
-            f"ML evaluator completed: valid={evaluation.is_valid}, "
-            f"confidence={evaluation.confidence:.2f}, quality={evaluation.quality_score:.2f}"
+            "ML evaluator completed: valid=%s, confidence=%.2f, quality=%.2f",
+            evaluation.is_valid, evaluation.confidence, evaluation.quality_score,
         )
         
         # Prepare feedback for worker retry if validation failed
@@ -134,28 +133,19 @@ Evaluate these ML predictions."""
             )
             new_retry_count = state.retry_count + 1
         
-        return MLSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=state.worker_output,
-            evaluation=evaluation,
-            retry_count=new_retry_count,
-            max_retries=state.max_retries,
-            evaluator_feedback=evaluator_feedback,
-            completed=evaluation.is_valid,
-            error=None,
-        )
+        return {
+            "evaluation": evaluation,
+            "retry_count": new_retry_count,
+            "evaluator_feedback": evaluator_feedback,
+            "completed": evaluation.is_valid,
+            "error": None,
+        }
         
     except Exception as e:
-        logger.error(f"ML evaluator error: {e}", exc_info=True)
+        logger.error("ML evaluator error: %s", e, exc_info=debug_exc_info(logger))
         
-        return MLSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=state.worker_output,
-            evaluation=MLEvaluation(
+        return {
+            "evaluation": MLEvaluation(
                 is_valid=False,
                 confidence=0.0,
                 quality_score=0.0,
@@ -163,6 +153,11 @@ Evaluate these ML predictions."""
                 summary="Evaluation error",
                 recommendation="Unable to evaluate - use predictions with caution",
             ),
-            completed=True,
-            error=f"Evaluator failed: {str(e)}",
-        )
+            "completed": True,
+            "error": f"Evaluator failed: {str(e)}",
+        }
+
+
+def ml_evaluator(state: MLSubgraphStateInternal) -> dict:
+    """Sync entry point for aml_evaluator (used by graph.invoke)."""
+    return run_sync(aml_evaluator(state))
@@ -0,0 +1,51 @@
+"""ML fast check - rule-based validation that skips the LLM evaluator.
+
+Clear, confident predictions in a calm volatility regime need no LLM
+review, so a high-confidence evaluation is synthesized directly. Only
+weak or high-volatility predictions fall through to the LLM evaluator.
+"""
+
+from typing import Optional
+
+from .schema import MLWorkerOutput, MLEvaluation
+
+# (predicted_direction, predicted_volatility, prediction_quality) combinations
+# that are unambiguous: a definite direction, no volatility spike, and at
+# least moderate model confidence.
+_CONSISTENT_PREDICTIONS = frozenset(
+    (direction, volatility, quality)
+    for direction in ("up", "down")
+    for volatility in ("low", "medium")
+    for quality in ("strong", "moderate")
+)
+
+
+def fast_validate(worker_output: MLWorkerOutput) -> Optional[MLEvaluation]:
+    """Validate obviously reliable ML output without an LLM call.
+    
+    Args:
+        worker_output: ML worker output to check
+        
+    Returns:
+        High-confidence MLEvaluation if the predictions are clear, else None
+    """
+    predictions = (
+        worker_output.predicted_direction,
+        worker_output.predicted_volatility,
+        worker_output.prediction_quality,
+    )
+    if predictions not in _CONSISTENT_PREDICTIONS:
+        return None
+    
+    return MLEvaluation(
+        is_valid=True,
+        confidence=0.9,
+        quality_score=0.9,
+        issues=[],
+        summary=(
+            f"{worker_output.prediction_quality.capitalize()} {worker_output.predicted_direction} "
+            f"prediction (confidence {worker_output.direction_confidence:.2f}), "
+            f"{worker_output.predicted_volatility} volatility"
+        ),
+        recommendation=f"Predictions are clear enough to use for a {worker_output.predicted_direction} bias",
+    )
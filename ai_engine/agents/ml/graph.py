@@ -1,25 +1,32 @@
 """ML subgraph builder - worker → evaluator workflow."""
 
+from dataclasses import replace
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from ...utils.logger import get_logger
-from .schema import MLSubgraphState
+from .schema import MLSubgraphStateInternal
 from .worker import ml_worker
-from .evaluator import ml_evaluator
+from .evaluator import ml_evaluator, aml_evaluator
 
 logger = get_logger(__name__)
 
 
-def should_retry_worker(state: MLSubgraphState) -> str:
+def should_retry_worker(state: MLSubgraphStateInternal) -> str:
     """Decide if worker should retry based on evaluator feedback.
     
     Returns:
-        'worker' if evaluation failed and retries remain
+        'ml' if evaluation failed and retries remain
         'END' if evaluation passed or max retries reached
     """
     if not state.evaluation:
         return END
     
+    # Worker/evaluator errors (e.g. no LLM configured) are not fixed by a retry
+    if state.error:
+        return END
+    
     if state.evaluation.is_valid:
         return END
     
@@ -38,18 +45,36 @@ def should_retry_worker(state: MLSubgraphState) -> str:
         return END
     
     logger.info(
-        f"ML worker retry {state.retry_count}/{state.max_retries} for {state.symbol}. "
-        f"Feedback: {state.evaluation.issues}"
+        "ML worker retry %d/%d for %s. Feedback: %s",
+        state.retry_count, state.max_retries, state.symbol, state.evaluation.issues,
     )
-    return "worker"
+    return "ml"
 
 
-def create_ml_subgraph() -> StateGraph:
-    """Create ML prediction subgraph.
+def ml_worker_and_evaluator(state: MLSubgraphStateInternal) -> dict:
+    """Run worker then evaluator as one node (one state transition per attempt).
+    
+    The evaluator always consumes the worker output, so there is nothing to
+    gain from a graph edge between them.
+    """
+    worker_update = ml_worker(state)
+    evaluator_update = ml_evaluator(replace(state, **worker_update))
+    return {**worker_update, **evaluator_update}
+
+
+async def aml_worker_and_evaluator(state: MLSubgraphStateInternal) -> dict:
+    """Async variant of ml_worker_and_evaluator."""
+    worker_update = ml_worker(state)
+    evaluator_update = await aml_evaluator(replace(state, **worker_update))
+    return {**worker_update, **evaluator_update}
+
+
+def _build() -> StateGraph:
+    """Build and compile the ML prediction subgraph.
     
     Architecture:
-        START → worker → evaluator → [conditional]
-        If evaluator rejects: → worker (with feedback)
+        START → ml (worker + evaluator) → [conditional]
+        If evaluator rejects: → ml (with feedback)
         Else: → END
         
     Worker: Deterministic ML predictions
@@ -61,23 +86,38 @@ def create_ml_subgraph() -> StateGraph:
     logger.info("Creating ML subgraph")
     
     # Create graph
-    graph = StateGraph(MLSubgraphState)
+    graph = StateGraph(MLSubgraphStateInternal)
     
-    # Add nodes
-    graph.add_node("worker", ml_worker)
-    graph.add_node("evaluator", ml_evaluator)
+    # Single fused node; async path lets concurrent subgraphs overlap their
+    # evaluator LLM calls on one event loop
+    graph.add_node("ml", RunnableLambda(ml_worker_and_evaluator, afunc=aml_worker_and_evaluator))
     
-    # Define flow
-    graph.set_entry_point("worker")
-    graph.add_edge("worker", "evaluator")
+    # Define flow: ml → conditional (ml again on retry)
+    graph.set_entry_point("ml")
     graph.add_conditional_edges(
-        "evaluator",
+        "ml",
         should_retry_worker,
-        {"worker": "worker", END: END}
+        {"ml": "ml", END: END}
     )
     
-    # Compile
-    workflow = graph.compile()
+    # Compile without a checkpointer: the compiled graph holds no per-run
+    # state, so one instance is shared by every caller
+    workflow = graph.compile(checkpointer=None)
     
     logger.info("ML subgraph created successfully with retry logic")
     return workflow
+
+
+_ML_SUBGRAPH = _build()
+
+
+def create_ml_subgraph() -> StateGraph:
+    """Return the shared compiled ML subgraph.
+    
+    The subgraph is compiled once at import; it is stateless with respect to
+    its input, so it is safe to reuse across requests and concurrent runs.
+    
+    Returns:
+        Compiled ML subgraph
+    """
+    return _ML_SUBGRAPH
@@ -1,7 +1,10 @@
 """ML subgraph schema - Pydantic models for ML predictions."""
 
+from dataclasses import dataclass, field, fields
 from typing import Optional
-from pydantic import BaseModel, Field
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MLWorkerOutput(BaseModel):
@@ -41,10 +44,13 @@ class MLEvaluation(BaseModel):
 class MLSubgraphState(BaseModel):
     """State for ML subgraph."""
     
+    # Nodes return partial dicts, so the price series is validated once on entry
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=False)
+    
     # Input
     symbol: str
-    prices: list[float]
-    volumes: list[float]
+    prices: np.ndarray = Field(..., repr=False)
+    volumes: np.ndarray = Field(..., repr=False)
     
     # Worker output
     worker_output: Optional[MLWorkerOutput] = None
@@ -63,3 +69,39 @@ class MLSubgraphState(BaseModel):
     # Combined output
     completed: bool = False
     error: Optional[str] = None
+    
+    @field_validator("prices", "volumes", mode="before")
+    @classmethod
+    def _as_float_array(cls, value):
+        """Convert the series to a contiguous float64 array once, on entry."""
+        return np.ascontiguousarray(value, dtype=np.float64)
+
+
+@dataclass(slots=True, frozen=True)
+class MLSubgraphStateInternal:
+    """Unvalidated mirror of MLSubgraphState used as the LangGraph state.
+    
+    MLSubgraphState validates the input once at the subgraph boundary; inside
+    the graph, node hops build this dataclass instead, so the price series
+    is not re-validated element by element on every step.
+    """
+    
+    symbol: str
+    prices: np.ndarray = field(repr=False)
+    volumes: np.ndarray = field(repr=False)
+    worker_output: Optional[MLWorkerOutput] = None
+    evaluation: Optional[MLEvaluation] = None
+    retry_count: int = 0
+    max_retries: int = 2
+    evaluator_feedback: Optional[str] = None
+    completed: bool = False
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_pydantic(cls, state: MLSubgraphState) -> "MLSubgraphStateInternal":
+        """Build from a validated MLSubgraphState (no copying of the series)."""
+        return cls(**{f.name: getattr(state, f.name) for f in fields(cls)})
+    
+    def to_pydantic(self) -> MLSubgraphState:
+        """Convert back to the validated Pydantic state."""
+        return MLSubgraphState(**{f.name: getattr(self, f.name) for f in fields(self)})
@@ -1,13 +1,36 @@
 """ML worker - deterministic ML predictions."""
 
 from ...tools.ml import get_ml_predictions
-from ...utils.logger import get_logger
-from .schema import MLSubgraphState, MLWorkerOutput
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import LRUCache, series_digest
+from .schema import MLSubgraphStateInternal, MLWorkerOutput
 
 logger = get_logger(__name__)
 
+# Keyed by (symbol, content hash of prices+volumes)
+_OUTPUT_CACHE = LRUCache(maxsize=256)
 
-def ml_worker(state: MLSubgraphState) -> MLSubgraphState:
+
+def _build_worker_output(symbol: str, prices: list[float], volumes: list[float]) -> MLWorkerOutput:
+    """Run ML predictions for one price/volume series."""
+    # Get ML predictions (deterministic model inference)
+    predictions = get_ml_predictions(
+        symbol=symbol,
+        prices=prices,
+        market_data={"volumes": volumes}  # Minimal market data
+    )
+    
+    # Create structured output
+    return MLWorkerOutput(
+        predicted_direction=predictions["direction"],
+        direction_confidence=predictions["confidence"],
+        predicted_volatility=predictions["volatility_regime"],
+        volatility_score=predictions["volatility"],
+        prediction_quality=predictions["ml_signal"],
+    )
+
+
+def ml_worker(state: MLSubgraphStateInternal) -> dict:
     """Execute deterministic ML predictions.
     
     Single responsibility: Generate ML-based predictions.
@@ -20,57 +43,41 @@ def ml_worker(state: MLSubgraphState) -> MLSubgraphState:
         state: Current subgraph state with symbol, prices, volumes
         
     Returns:
-        Updated state with worker_output populated
+        Partial state update with worker_output populated
     """
     try:
-        logger.info(f"ML worker predicting {state.symbol}")
+        logger.info("ML worker predicting %s", state.symbol)
         
         # If this is a retry, log the evaluator feedback
         if state.retry_count > 0:
             logger.warning(
-                f"ML worker retry attempt {state.retry_count}/{state.max_retries} for {state.symbol}. "
-                f"Evaluator feedback: {state.evaluator_feedback}"
+                "ML worker retry attempt %d/%d for %s. Evaluator feedback: %s",
+                state.retry_count, state.max_retries, state.symbol, state.evaluator_feedback,
             )
         
-        # Get ML predictions (deterministic model inference)
-        predictions = get_ml_predictions(
-            symbol=state.symbol,
-            prices=state.prices,
-            market_data={"volumes": state.volumes}  # Minimal market data
-        )
-        
-        # Create structured output
-        worker_output = MLWorkerOutput(
-            predicted_direction=predictions["direction"],
-            direction_confidence=predictions["confidence"],
-            predicted_volatility=predictions["volatility_regime"],
-            volatility_score=predictions["volatility"],
-            prediction_quality=predictions["ml_signal"],
-        )
+        # Worker is deterministic: retries on unchanged data reuse the cached output
+        cache_key = (state.symbol, series_digest(state.prices, state.volumes))
+        worker_output = _OUTPUT_CACHE.get(cache_key)
+        if worker_output is None:
+            worker_output = _build_worker_output(state.symbol, state.prices, state.volumes)
+            _OUTPUT_CACHE.set(cache_key, worker_output)
         
         logger.info(
-            f"ML worker completed: direction={worker_output.predicted_direction}, "
-            f"confidence={worker_output.direction_confidence:.2f}"
+            "ML worker completed: direction=%s, confidence=%.2f",
+            worker_output.predicted_direction, worker_output.direction_confidence,
         )
         
-        return MLSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=worker_output,
-            evaluation=state.evaluation,
-            completed=False,
-            error=None,
-        )
+        return {
+            "worker_output": worker_output,
+            "completed": False,
+            "error": None,
+        }
         
     except Exception as e:
-        logger.error(f"ML worker error: {e}", exc_info=True)
-        return MLSubgraphState(
-            symbol=state.symbol,
-            prices=state.prices,
-            volumes=state.volumes,
-            worker_output=None,
-            evaluation=None,
-            completed=True,
-            error=f"ML worker failed: {str(e)}",
-        )
+        logger.error("ML worker error: %s", e, exc_info=debug_exc_info(logger))
+        return {
+            "worker_output": None,
+            "evaluation": None,
+            "completed": True,
+            "error": f"ML worker failed: {str(e)}",
+        }
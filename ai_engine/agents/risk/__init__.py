@@ -1,11 +1,12 @@
 """Risk subgraph package."""
 
 from .graph import create_risk_subgraph
-from .schema import RiskSubgraphState, RiskWorkerOutput, RiskEvaluation
+from .schema import RiskSubgraphState, RiskSubgraphStateInternal, RiskWorkerOutput, RiskEvaluation
 
 __all__ = [
     "create_risk_subgraph",
     "RiskSubgraphState",
+    "RiskSubgraphStateInternal",
     "RiskWorkerOutput",
     "RiskEvaluation",
 ]
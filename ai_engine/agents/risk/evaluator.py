@@ -1,57 +1,32 @@
 """Risk evaluator - LLM-based validation of risk checks."""
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+from dataclasses import replace
+from functools import lru_cache
+
 from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable
 
-from ...utils.llm_v2 import get_llm, LLMConfig
-from ...utils.logger import get_logger
-from ...utils.json_fixer import fix_json_string
-from .schema import RiskSubgraphState, RiskEvaluation
+from ...utils.llm_v2 import get_llm, acall_with_backoff, ainvoke_with_retry, LLMConfig
+from ...utils.aio import run_sync
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import EvaluationCache
+from ...utils.parser_cache import get_parser
+from ...utils.streaming_eval import astream_evaluation
+from .fast_check import fast_validate
+from .schema import RiskSubgraphStateInternal, RiskWorkerOutput, RiskEvaluation
 
 logger = get_logger(__name__)
 
+# Identical worker outputs (same checks, same price to the cent) reuse one
+# evaluation, e.g. when a backtest re-evaluates the same setup
+_EVAL_CACHE = EvaluationCache(RiskEvaluation, quantize={"price": 0.01}, maxsize=4096)
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            return super().parse(text)
-        except OutputParserException as e:
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                raise e
-
+# Shared parser (with JSON fixing) and precomputed format instructions
+_PARSER, _FORMAT_INSTRUCTIONS = get_parser(RiskEvaluation)
 
-def risk_evaluator(state: RiskSubgraphState) -> RiskSubgraphState:
-    """Evaluate risk worker output using LLM.
-    
-    Single responsibility: Judge quality and completeness of risk checks.
-    Does NOT make trading decisions - only evaluates risk validation.
-    
-    Uses LCEL: prompt | llm | parser
-    
-    Args:
-        state: State with worker_output to evaluate
-        
-    Returns:
-        Updated state with evaluation populated
-    """
-    try:
-        if not state.worker_output:
-            raise ValueError("No worker output to evaluate")
-        
-        logger.info(f"Risk evaluator validating {state.symbol}")
-        
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=RiskEvaluation)
-        
-        # Create prompt
-        system_message = """You are a risk management quality evaluator.
+SYSTEM_MESSAGE = """You are a risk management quality evaluator.
 
 Your job is to assess the COMPLETENESS and APPROPRIATENESS of risk checks.
 You do NOT make trading decisions - only evaluate risk analysis quality.
@@ -69,109 +44,208 @@ Provide:
 - summary: brief risk summary
 - recommendation: risk management advice
 
+Input legend: q=quantity, px=price; sl, ps, ex = stop-loss, position-size and
+exposure check passed (1/0); all = all checks passed; lvl = risk level.
+Failed checks are listed with their messages.
+
 {format_instructions}"""
 
-        human_message = """Symbol: {symbol}
-Action: {action} ({quantity} shares at ${price:.2f})
+# Compact encoding (legend in the system message) keeps prompt tokens low;
+# check messages are only included for checks that failed
+HUMAN_MESSAGE = """RISK:{symbol} {action} q={quantity} px={price:.2f} sl={stop_loss_check:d} ps={position_size_check:d} ex={exposure_check:d} all={all_checks_passed:d} lvl={risk_level}{failed_checks}
+
+Evaluate this risk analysis."""
 
-Risk Checks:
-- Stop Loss: {stop_loss_check} - {stop_loss_message}
-- Position Size: {position_size_check} - {position_size_message}
-- Exposure: {exposure_check} - {exposure_message}
+RETRY_MESSAGE = """[RETRY {attempt}/{max_retries}] Previous attempt failed: {last_error}
+Please provide valid JSON with ALL required fields."""
 
-Overall: {all_checks_passed}
-Risk Level: {risk_level}
+# Built once at import and shared by first attempts and retries. Retries
+# append a message through the retry_context placeholder, so the template is
+# never rebuilt and error text needs no brace escaping.
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_MESSAGE),
+    ("human", HUMAN_MESSAGE),
+    MessagesPlaceholder("retry_context", optional=True),
+]).partial(format_instructions=_FORMAT_INSTRUCTIONS)
 
-Evaluate this risk analysis."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
-        
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.EVALUATORS)  # Use configured evaluator LLM
-        chain = prompt | llm | parser
+@lru_cache(maxsize=2)
+def _get_chains(light: bool = False) -> tuple[Runnable, Runnable]:
+    """Build the (first attempt, retry) LCEL chains on first use.
+    
+    The first attempt is streamed and parsed incrementally, so its chain
+    stops at the LLM. Deferred because get_llm needs an API key, which may
+    not be set at import.
+    """
+    # Low-stakes validations go to the smaller configured model
+    llm = get_llm(**(LLMConfig.EVALUATORS_LIGHT if light else LLMConfig.EVALUATORS))
+    return _PROMPT | llm, _PROMPT | llm | _PARSER
+
+
+# Light-model verdicts are kept only when valid and above this confidence
+# (DraftVerifyLLM's acceptance bar); anything else goes to the main model
+_LIGHT_MIN_CONFIDENCE = 0.85
+
+
+def _needs_full_model(worker_output: RiskWorkerOutput) -> bool:
+    """Failed checks or high risk need the main evaluator; the rest use the light one."""
+    return not worker_output.all_checks_passed or worker_output.risk_level == "high"
+
+
+async def _ainvoke_with_feedback(inputs: dict, light: bool = False) -> RiskEvaluation:
+    """Run the evaluator chain, re-prompting with the error on parse failures."""
+    stream_chain, retry_chain = _get_chains(light)
+    
+    # Parse failures re-prompt with the error (up to 3 attempts); transient
+    # network/rate-limit errors are retried with backoff inside each attempt
+    max_retries = 3
+    
+    for attempt in range(max_retries):
+        try:
+            if attempt == 0:
+                # Stream the first reply and stop once the verdict is settled
+                return await acall_with_backoff(
+                    lambda: astream_evaluation(stream_chain, inputs, RiskEvaluation, _PARSER)
+                )
+            return await ainvoke_with_retry(retry_chain, inputs)
+        except OutputParserException as e:
+            if attempt == max_retries - 1:
+                raise  # Re-raise on final attempt
+            # Bounded once: parser errors can embed the whole raw reply
+            last_error = str(e)[:300]
+            logger.warning("Risk evaluator attempt %s/%s failed: %s", attempt + 1, max_retries, last_error)
+            
+            # Resend with error feedback for next attempt
+            retry_message = RETRY_MESSAGE.format(
+                attempt=attempt + 2,
+                max_retries=max_retries,
+                last_error=last_error,
+            )
+            inputs = {**inputs, "retry_context": [HumanMessage(content=retry_message)]}
+
+
+async def _aevaluate(inputs: dict, light: bool) -> RiskEvaluation:
+    """Evaluate on the light model when allowed, escalating unsure verdicts.
+    
+    A light-model rejection, a verdict at or below _LIGHT_MIN_CONFIDENCE, or
+    a light-model failure is re-evaluated by the main EVALUATORS model.
+    """
+    if light:
+        try:
+            evaluation = await _ainvoke_with_feedback(inputs, light=True)
+            if evaluation.is_valid and evaluation.confidence > _LIGHT_MIN_CONFIDENCE:
+                return evaluation
+            logger.info(
+                "Light risk evaluation unsure (valid=%s, confidence=%.2f), escalating",
+                evaluation.is_valid, evaluation.confidence,
+            )
+        except Exception as e:
+            logger.warning("Light risk evaluator failed, escalating: %s", e)
+    
+    return await _ainvoke_with_feedback(inputs)
+
+
+def _failed_checks(worker_output: RiskWorkerOutput) -> str:
+    """Messages of the failed checks, one per line (empty when all passed)."""
+    checks = (
+        ("sl", worker_output.stop_loss_check, worker_output.stop_loss_message),
+        ("ps", worker_output.position_size_check, worker_output.position_size_message),
+        ("ex", worker_output.exposure_check, worker_output.exposure_message),
+    )
+    return "".join(f"\n{name} failed: {message}" for name, passed, message in checks if not passed)
+
+
+def _evaluator_inputs(state: RiskSubgraphStateInternal) -> dict:
+    """Template variables for one symbol's risk checks."""
+    return {
+        "symbol": state.symbol,
+        "action": state.proposed_action,
+        "quantity": state.proposed_quantity,
+        "price": state.current_price,
+        "stop_loss_check": state.worker_output.stop_loss_check,
+        "position_size_check": state.worker_output.position_size_check,
+        "exposure_check": state.worker_output.exposure_check,
+        "all_checks_passed": state.worker_output.all_checks_passed,
+        "risk_level": state.worker_output.risk_level,
+        "failed_checks": _failed_checks(state.worker_output),
+    }
+
+
+def _with_evaluation(state: RiskSubgraphStateInternal, evaluation: RiskEvaluation) -> RiskSubgraphStateInternal:
+    """Apply an evaluation to the state, preparing retry feedback if it failed."""
+    logger.info(
+        "Risk evaluator completed: valid=%s, "
+        "confidence=%.2f, quality=%.2f",
+        evaluation.is_valid, evaluation.confidence, evaluation.quality_score
+    )
+    
+    # Prepare feedback for worker retry if validation failed
+    evaluator_feedback = None
+    new_retry_count = state.retry_count
+    
+    if not evaluation.is_valid:
+        evaluator_feedback = (
+            f"Validation failed (confidence={evaluation.confidence:.2f}, "
+            f"quality={evaluation.quality_score:.2f}). Issues: {', '.join(evaluation.issues)}"
+        )
+        new_retry_count = state.retry_count + 1
+    
+    return replace(
+        state,
+        evaluation=evaluation,
+        retry_count=new_retry_count,
+        evaluator_feedback=evaluator_feedback,
+        completed=evaluation.is_valid,
+        error=None,
+    )
+
+
+async def arisk_evaluator(state: RiskSubgraphStateInternal) -> RiskSubgraphStateInternal:
+    """Evaluate risk worker output using LLM.
+    
+    Single responsibility: Judge quality and completeness of risk checks.
+    Does NOT make trading decisions - only evaluates risk validation.
+    
+    Uses LCEL: prompt | llm | parser (awaited, so concurrent subgraphs
+    overlap their LLM calls)
+    
+    Args:
+        state: State with worker_output to evaluate
         
-        # Invoke with retry logic (up to 3 attempts)
-        max_retries = 3
-        last_error = None
+    Returns:
+        Updated state with evaluation populated
+    """
+    try:
+        if not state.worker_output:
+            raise ValueError("No worker output to evaluate")
         
-        for attempt in range(max_retries):
-            try:
-                evaluation = chain.invoke({
-                    "symbol": state.symbol,
-                    "action": state.proposed_action,
-                    "quantity": state.proposed_quantity,
-                    "price": state.current_price,
-                    "stop_loss_check": state.worker_output.stop_loss_check,
-                    "stop_loss_message": state.worker_output.stop_loss_message,
-                    "position_size_check": state.worker_output.position_size_check,
-                    "position_size_message": state.worker_output.position_size_message,
-                    "exposure_check": state.worker_output.exposure_check,
-                    "exposure_message": state.worker_output.exposure_message,
-                    "all_checks_passed": state.worker_output.all_checks_passed,
-                    "risk_level": state.worker_output.risk_level,
-                    "format_instructions": parser.get_format_instructions(),
-                })
-                break  # Success, exit retry loop
-            except Exception as e:
-                last_error = str(e).replace("{", "{{").replace("}", "}}")  # Escape braces for f-string
-                logger.warning(f"Risk evaluator attempt {attempt + 1}/{max_retries} failed: {last_error[:200]}")
-                if attempt < max_retries - 1:
-                    # Update prompt with error feedback for next attempt
-                    retry_message = f"\n\n[RETRY {attempt + 2}/{max_retries}] Previous attempt failed: {last_error[:300]}\nPlease provide valid JSON with ALL required fields."
-                    prompt = ChatPromptTemplate.from_messages([
-                        ("system", system_message),
-                        ("human", human_message + retry_message),
-                    ])
-                    chain = prompt | llm | parser
-                else:
-                    raise  # Re-raise on final attempt
+        # Unambiguous outputs are validated by rules; no LLM call needed
+        evaluation = fast_validate(state.worker_output)
+        if evaluation is not None:
+            logger.info("Risk evaluator fast path for %s", state.symbol)
+            return replace(
+                state,
+                evaluation=evaluation,
+                evaluator_feedback=None,
+                completed=True,
+                error=None,
+            )
         
-        logger.info(
-            f"Risk evaluator completed: valid={evaluation.is_valid}, "
-            f"confidence={evaluation.confidence:.2f}, quality={evaluation.quality_score:.2f}"
-        )
+        logger.info("Risk evaluator validating %s", state.symbol)
         
-        # Prepare feedback for worker retry if validation failed
-        evaluator_feedback = None
-        new_retry_count = state.retry_count
+        inputs = _evaluator_inputs(state)
         
-        if not evaluation.is_valid:
-            evaluator_feedback = (
-                f"Validation failed (confidence={evaluation.confidence:.2f}, "
-                f"quality={evaluation.quality_score:.2f}). Issues: {', '.join(evaluation.issues)}"
-            )
-            new_retry_count = state.retry_count + 1
+        # Repeated inputs are served from the cache; misses run the chain
+        light = not _needs_full_model(state.worker_output)
+        evaluation = await _EVAL_CACHE.aget_or_call(inputs, lambda: _aevaluate(inputs, light))
         
-        return RiskSubgraphState(
-            symbol=state.symbol,
-            current_price=state.current_price,
-            proposed_action=state.proposed_action,
-            proposed_quantity=state.proposed_quantity,
-            stop_loss=state.stop_loss,
-            take_profit=state.take_profit,
-            worker_output=state.worker_output,
-            evaluation=evaluation,
-            retry_count=new_retry_count,
-            max_retries=state.max_retries,
-            evaluator_feedback=evaluator_feedback,
-            completed=evaluation.is_valid,
-            error=None,
-        )
+        return _with_evaluation(state, evaluation)
         
     except Exception as e:
-        logger.error(f"Risk evaluator error: {e}", exc_info=True)
+        logger.error("Risk evaluator error: %s", e, exc_info=debug_exc_info(logger))
         
-        return RiskSubgraphState(
-            symbol=state.symbol,
-            current_price=state.current_price,
-            proposed_action=state.proposed_action,
-            proposed_quantity=state.proposed_quantity,
-            stop_loss=state.stop_loss,
-            take_profit=state.take_profit,
-            worker_output=state.worker_output,
+        return replace(
+            state,
             evaluation=RiskEvaluation(
                 is_valid=False,
                 confidence=0.0,
@@ -183,3 +257,8 @@ Evaluate this risk analysis."""
             completed=True,
             error=f"Evaluator failed: {str(e)}",
         )
+
+
+def risk_evaluator(state: RiskSubgraphStateInternal) -> RiskSubgraphStateInternal:
+    """Sync entry point for arisk_evaluator (used by graph.invoke)."""
+    return run_sync(arisk_evaluator(state))
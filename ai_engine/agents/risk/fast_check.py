@@ -0,0 +1,39 @@
+"""Risk fast check - rule-based validation that skips the LLM evaluator.
+
+When every deterministic risk check passed and the risk level is low there
+is nothing for the LLM to add, so a high-confidence evaluation is
+synthesized directly. Any failed check or elevated risk goes to the LLM.
+"""
+
+from typing import Optional
+
+from .schema import RiskWorkerOutput, RiskEvaluation
+
+
+def fast_validate(worker_output: RiskWorkerOutput) -> Optional[RiskEvaluation]:
+    """Validate clean, low-risk output without an LLM call.
+    
+    Args:
+        worker_output: Risk worker output to check
+        
+    Returns:
+        High-confidence RiskEvaluation if all checks passed at low risk, else None
+    """
+    checks = (
+        worker_output.stop_loss_check,
+        worker_output.position_size_check,
+        worker_output.exposure_check,
+    )
+    if not (worker_output.all_checks_passed and all(checks)):
+        return None
+    if worker_output.risk_level != "low":
+        return None
+    
+    return RiskEvaluation(
+        is_valid=True,
+        confidence=0.95,
+        quality_score=0.9,
+        issues=[],
+        summary="All risk checks passed (stop loss, position size, exposure); risk level low",
+        recommendation="Proceed within current risk limits",
+    )
@@ -1,6 +1,7 @@
 """Risk subgraph schema - Pydantic models for risk analysis."""
 
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -69,6 +70,47 @@ class RiskSubgraphState(BaseModel):
         description="Feedback from evaluator for worker to address on retry"
     )
     
+    # Human-in-the-loop decision, set up front by the caller (API request,
+    # CLI prompt) instead of blocking on input() inside the graph
+    user_decision: Literal["retry", "skip", "abort"] = Field(
+        default="retry",
+        description="What to do when validation fails: retry with feedback, skip, or abort"
+    )
+    
     # Combined output
     completed: bool = False
     error: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RiskSubgraphStateInternal:
+    """Unvalidated mirror of RiskSubgraphState used as the LangGraph state.
+    
+    RiskSubgraphState validates the input once at the subgraph boundary; nodes
+    then return dataclasses.replace() copies, which skip Pydantic validation
+    on every worker/evaluator hop of the retry loop.
+    """
+    
+    symbol: str
+    current_price: float
+    proposed_action: str = "buy"
+    proposed_quantity: int = 1
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    worker_output: Optional[RiskWorkerOutput] = None
+    evaluation: Optional[RiskEvaluation] = None
+    retry_count: int = 0
+    max_retries: int = 2
+    evaluator_feedback: Optional[str] = None
+    user_decision: Literal["retry", "skip", "abort"] = "retry"
+    completed: bool = False
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_pydantic(cls, state: RiskSubgraphState) -> "RiskSubgraphStateInternal":
+        """Build from a validated RiskSubgraphState."""
+        return cls(**{f.name: getattr(state, f.name) for f in fields(cls)})
+    
+    def to_pydantic(self) -> RiskSubgraphState:
+        """Convert back to the validated Pydantic state."""
+        return RiskSubgraphState(**{f.name: getattr(self, f.name) for f in fields(self)})
@@ -1,13 +1,15 @@
 """Risk worker - deterministic risk validation."""
 
+from dataclasses import replace
+
 from ...tools.risk import check_risk_constraints
-from ...utils.logger import get_logger
-from .schema import RiskSubgraphState, RiskWorkerOutput
+from ...utils.logger import get_logger, debug_exc_info
+from .schema import RiskSubgraphStateInternal, RiskWorkerOutput
 
 logger = get_logger(__name__)
 
 
-def risk_worker(state: RiskSubgraphState) -> RiskSubgraphState:
+def risk_worker(state: RiskSubgraphStateInternal) -> RiskSubgraphStateInternal:
     """Execute deterministic risk validation.
     
     Single responsibility: Check risk constraints.
@@ -23,13 +25,14 @@ def risk_worker(state: RiskSubgraphState) -> RiskSubgraphState:
         Updated state with worker_output populated
     """
     try:
-        logger.info(f"Risk worker validating {state.symbol}")
+        logger.info("Risk worker validating %s", state.symbol)
         
         # If this is a retry, log the evaluator feedback
         if state.retry_count > 0:
             logger.warning(
-                f"Risk worker retry attempt {state.retry_count}/{state.max_retries} for {state.symbol}. "
-                f"Evaluator feedback: {state.evaluator_feedback}"
+                "Risk worker retry attempt %s/%s for %s. "
+                "Evaluator feedback: %s",
+                state.retry_count, state.max_retries, state.symbol, state.evaluator_feedback
             )
         
         # Check all risk constraints (deterministic)
@@ -68,32 +71,22 @@ def risk_worker(state: RiskSubgraphState) -> RiskSubgraphState:
         )
         
         logger.info(
-            f"Risk worker completed: checks_passed={worker_output.all_checks_passed}, "
-            f"risk_level={worker_output.risk_level}"
+            "Risk worker completed: checks_passed=%s, "
+            "risk_level=%s",
+            worker_output.all_checks_passed, worker_output.risk_level
         )
         
-        return RiskSubgraphState(
-            symbol=state.symbol,
-            current_price=state.current_price,
-            proposed_action=state.proposed_action,
-            proposed_quantity=state.proposed_quantity,
-            stop_loss=state.stop_loss,
-            take_profit=state.take_profit,
+        return replace(
+            state,
             worker_output=worker_output,
-            evaluation=state.evaluation,
             completed=False,
             error=None,
         )
         
     except Exception as e:
-        logger.error(f"Risk worker error: {e}", exc_info=True)
-        return RiskSubgraphState(
-            symbol=state.symbol,
-            current_price=state.current_price,
-            proposed_action=state.proposed_action,
-            proposed_quantity=state.proposed_quantity,
-            stop_loss=state.stop_loss,
-            take_profit=state.take_profit,
+        logger.error("Risk worker error: %s", e, exc_info=debug_exc_info(logger))
+        return replace(
+            state,
             worker_output=None,
             evaluation=None,
             completed=True,
@@ -1,11 +1,12 @@
 """Sentiment subgraph package."""
 
 from .graph import create_sentiment_subgraph
-from .schema import SentimentSubgraphState, SentimentWorkerOutput, SentimentEvaluation
+from .schema import SentimentSubgraphState, SentimentSubgraphStateInternal, SentimentWorkerOutput, SentimentEvaluation
 
 __all__ = [
     "create_sentiment_subgraph",
     "SentimentSubgraphState",
+    "SentimentSubgraphStateInternal",
     "SentimentWorkerOutput",
     "SentimentEvaluation",
 ]
@@ -1,57 +1,40 @@
 """Sentiment evaluator - LLM-based validation of sentiment analysis."""
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+from dataclasses import replace
+from functools import lru_cache
+
 from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable
 
-from ...utils.llm_v2 import get_llm, LLMConfig
-from ...utils.logger import get_logger
-from ...utils.json_fixer import fix_json_string
-from .schema import SentimentSubgraphState, SentimentEvaluation
+from ...utils.llm_v2 import get_llm, acall_with_backoff, ainvoke_with_retry, LLMConfig
+from ...utils.aio import run_sync
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.eval_cache import EvaluationCache
+from ...utils.parser_cache import get_parser
+from ...utils.streaming_eval import astream_evaluation
+from .fast_check import fast_validate
+from .schema import SentimentSubgraphStateInternal, SentimentWorkerOutput, SentimentEvaluation
 
 logger = get_logger(__name__)
 
+# Sentiment readings that round to the same values reuse one evaluation
+_EVAL_CACHE = EvaluationCache(
+    SentimentEvaluation,
+    quantize={
+        "social_sentiment": 0.01,
+        "news_sentiment": 0.01,
+        "market_sentiment": 0.01,
+        "overall_sentiment": 0.01,
+    },
+    maxsize=4096,
+)
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            return super().parse(text)
-        except OutputParserException as e:
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                raise e
+# Shared parser (with JSON fixing) and precomputed format instructions
+_PARSER, _FORMAT_INSTRUCTIONS = get_parser(SentimentEvaluation)
 
-
-def sentiment_evaluator(state: SentimentSubgraphState) -> SentimentSubgraphState:
-    """Evaluate sentiment worker output using LLM.
-    
-    Single responsibility: Judge quality and confidence of sentiment data.
-    Does NOT make trading decisions - only evaluates data quality.
-    
-    Uses LCEL: prompt | llm | parser
-    
-    Args:
-        state: State with worker_output to evaluate
-        
-    Returns:
-        Updated state with evaluation populated
-    """
-    try:
-        if not state.worker_output:
-            raise ValueError("No worker output to evaluate")
-        
-        logger.info(f"Sentiment evaluator validating {state.symbol}")
-        
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=SentimentEvaluation)
-        
-        # Create prompt
-        system_message = """You are a sentiment analysis quality evaluator.
+SYSTEM_MESSAGE = """You are a sentiment analysis quality evaluator.
 
 Your job is to assess the QUALITY and RELIABILITY of sentiment data.
 You do NOT make trading decisions - only evaluate data quality.
@@ -69,62 +52,158 @@ Provide:
 - summary: brief sentiment summary
 - recommendation: what this sentiment suggests
 
-{format_instructions}"""
+Input legend: social, news, mkt = per-source sentiment (-1 to 1), each source
+followed by n = its mention/article count; overall and signal = aggregate.
 
-        human_message = """Symbol: {symbol}
+{format_instructions}"""
 
-Sentiment Data:
-- Social: {social_sentiment:.2f} ({social_volume} mentions)
-- News: {news_sentiment:.2f} ({news_count} articles)
-- Market: {market_sentiment:.2f}
-- Overall: {overall_sentiment:.2f} ({sentiment_signal})
+# Compact encoding (legend in the system message) keeps prompt tokens low
+HUMAN_MESSAGE = """SENT:{symbol} social={social_sentiment:.2f} n={social_volume} news={news_sentiment:.2f} n={news_count} mkt={market_sentiment:.2f} overall={overall_sentiment:.2f} signal={sentiment_signal}
 
 Evaluate this sentiment analysis."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
+RETRY_MESSAGE = """[RETRY {attempt}/{max_retries}] Previous attempt failed: {last_error}
+Please provide valid JSON with ALL required fields."""
+
+# Built once at import and shared by first attempts and retries. Retries
+# append a message through the retry_context placeholder, so the template is
+# never rebuilt and error text needs no brace escaping.
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_MESSAGE),
+    ("human", HUMAN_MESSAGE),
+    MessagesPlaceholder("retry_context", optional=True),
+]).partial(format_instructions=_FORMAT_INSTRUCTIONS)
+
+
+@lru_cache(maxsize=2)
+def _get_chains(light: bool = False) -> tuple[Runnable, Runnable]:
+    """Build the (first attempt, retry) LCEL chains on first use.
+    
+    The first attempt is streamed and parsed incrementally, so its chain
+    stops at the LLM. Deferred because get_llm needs an API key, which may
+    not be set at import.
+    """
+    # Low-stakes validations go to the smaller configured model
+    llm = get_llm(**(LLMConfig.EVALUATORS_LIGHT if light else LLMConfig.EVALUATORS))
+    return _PROMPT | llm, _PROMPT | llm | _PARSER
+
+
+# Light-model verdicts are kept only when valid and above this confidence
+# (DraftVerifyLLM's acceptance bar); anything else goes to the main model
+_LIGHT_MIN_CONFIDENCE = 0.85
+
+
+def _needs_full_model(worker_output: SentimentWorkerOutput) -> bool:
+    """Conflicting or thin sentiment needs the main evaluator; the rest use the light one."""
+    conflicting = abs(worker_output.social_sentiment - worker_output.news_sentiment) > 0.5
+    return conflicting or worker_output.social_volume < 10
+
+
+async def _ainvoke_with_feedback(inputs: dict, light: bool = False) -> SentimentEvaluation:
+    """Run the evaluator chain, re-prompting with the error on parse failures."""
+    stream_chain, retry_chain = _get_chains(light)
+    
+    # Parse failures re-prompt with the error (up to 3 attempts); transient
+    # network/rate-limit errors are retried with backoff inside each attempt
+    max_retries = 3
+    
+    for attempt in range(max_retries):
+        try:
+            if attempt == 0:
+                # Stream the first reply and stop once the verdict is settled
+                return await acall_with_backoff(
+                    lambda: astream_evaluation(stream_chain, inputs, SentimentEvaluation, _PARSER)
+                )
+            return await ainvoke_with_retry(retry_chain, inputs)
+        except OutputParserException as e:
+            if attempt == max_retries - 1:
+                raise  # Re-raise on final attempt
+            # Bounded once: parser errors can embed the whole raw reply
+            last_error = str(e)[:300]
+            logger.warning("Sentiment evaluator attempt %s/%s failed: %s", attempt + 1, max_retries, last_error)
+            
+            # Resend with error feedback for next attempt
+            retry_message = RETRY_MESSAGE.format(
+                attempt=attempt + 2,
+                max_retries=max_retries,
+                last_error=last_error,
+            )
+            inputs = {**inputs, "retry_context": [HumanMessage(content=retry_message)]}
+
+
+async def _aevaluate(inputs: dict, light: bool) -> SentimentEvaluation:
+    """Evaluate on the light model when allowed, escalating unsure verdicts.
+    
+    A light-model rejection, a verdict at or below _LIGHT_MIN_CONFIDENCE, or
+    a light-model failure is re-evaluated by the main EVALUATORS model.
+    """
+    if light:
+        try:
+            evaluation = await _ainvoke_with_feedback(inputs, light=True)
+            if evaluation.is_valid and evaluation.confidence > _LIGHT_MIN_CONFIDENCE:
+                return evaluation
+            logger.info(
+                "Light sentiment evaluation unsure (valid=%s, confidence=%.2f), escalating",
+                evaluation.is_valid, evaluation.confidence,
+            )
+        except Exception as e:
+            logger.warning("Light sentiment evaluator failed, escalating: %s", e)
+    
+    return await _ainvoke_with_feedback(inputs)
+
+
+async def asentiment_evaluator(state: SentimentSubgraphStateInternal) -> SentimentSubgraphStateInternal:
+    """Evaluate sentiment worker output using LLM.
+    
+    Single responsibility: Judge quality and confidence of sentiment data.
+    Does NOT make trading decisions - only evaluates data quality.
+    
+    Uses LCEL: prompt | llm | parser (awaited, so concurrent subgraphs
+    overlap their LLM calls)
+    
+    Args:
+        state: State with worker_output to evaluate
         
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.EVALUATORS)  # Use configured evaluator LLM
-        chain = prompt | llm | parser
+    Returns:
+        Updated state with evaluation populated
+    """
+    try:
+        if not state.worker_output:
+            raise ValueError("No worker output to evaluate")
+        
+        # Unambiguous outputs are validated by rules; no LLM call needed
+        evaluation = fast_validate(state.worker_output)
+        if evaluation is not None:
+            logger.info("Sentiment evaluator fast path for %s", state.symbol)
+            return replace(
+                state,
+                evaluation=evaluation,
+                evaluator_feedback=None,
+                completed=True,
+                error=None,
+            )
+        
+        logger.info("Sentiment evaluator validating %s", state.symbol)
         
-        # Invoke with retry logic (up to 3 attempts)
-        max_retries = 3
-        last_error = None
+        inputs = {
+            "symbol": state.symbol,
+            "social_sentiment": state.worker_output.social_sentiment,
+            "social_volume": state.worker_output.social_volume,
+            "news_sentiment": state.worker_output.news_sentiment,
+            "news_count": state.worker_output.news_count,
+            "market_sentiment": state.worker_output.market_sentiment,
+            "overall_sentiment": state.worker_output.overall_sentiment,
+            "sentiment_signal": state.worker_output.sentiment_signal,
+        }
         
-        for attempt in range(max_retries):
-            try:
-                evaluation = chain.invoke({
-                    "symbol": state.symbol,
-                    "social_sentiment": state.worker_output.social_sentiment,
-                    "social_volume": state.worker_output.social_volume,
-                    "news_sentiment": state.worker_output.news_sentiment,
-                    "news_count": state.worker_output.news_count,
-                    "market_sentiment": state.worker_output.market_sentiment,
-                    "overall_sentiment": state.worker_output.overall_sentiment,
-                    "sentiment_signal": state.worker_output.sentiment_signal,
-                    "format_instructions": parser.get_format_instructions(),
-                })
-                break  # Success, exit retry loop
-            except Exception as e:
-                last_error = str(e).replace("{", "{{").replace("}", "}}")  # Escape braces for f-string
-                logger.warning(f"Sentiment evaluator attempt {attempt + 1}/{max_retries} failed: {last_error[:200]}")
-                if attempt < max_retries - 1:
-                    # Update prompt with error feedback for next attempt
-                    retry_message = f"\n\n[RETRY {attempt + 2}/{max_retries}] Previous attempt failed: {last_error[:300]}\nPlease provide valid JSON with ALL required fields."
-                    prompt = ChatPromptTemplate.from_messages([
-                        ("system", system_message),
-                        ("human", human_message + retry_message),
-                    ])
-                    chain = prompt | llm | parser
-                else:
-                    raise  # Re-raise on final attempt
+        # Repeated inputs are served from the cache; misses run the chain
+        light = not _needs_full_model(state.worker_output)
+        evaluation = await _EVAL_CACHE.aget_or_call(inputs, lambda: _aevaluate(inputs, light))
         
         logger.info(
-            f"Sentiment evaluator completed: valid={evaluation.is_valid}, "
-            f"confidence={evaluation.confidence:.2f}, quality={evaluation.quality_score:.2f}"
+            "Sentiment evaluator completed: valid=%s, "
+            "confidence=%.2f, quality=%.2f",
+            evaluation.is_valid, evaluation.confidence, evaluation.quality_score
         )
         
         # Prepare feedback for worker retry if validation failed
@@ -138,23 +217,20 @@ Evaluate this sentiment analysis."""
             )
             new_retry_count = state.retry_count + 1
         
-        return SentimentSubgraphState(
-            symbol=state.symbol,
-            worker_output=state.worker_output,
+        return replace(
+            state,
             evaluation=evaluation,
             retry_count=new_retry_count,
-            max_retries=state.max_retries,
             evaluator_feedback=evaluator_feedback,
             completed=evaluation.is_valid,
             error=None,
         )
         
     except Exception as e:
-        logger.error(f"Sentiment evaluator error: {e}", exc_info=True)
+        logger.error("Sentiment evaluator error: %s", e, exc_info=debug_exc_info(logger))
         
-        return SentimentSubgraphState(
-            symbol=state.symbol,
-            worker_output=state.worker_output,
+        return replace(
+            state,
             evaluation=SentimentEvaluation(
                 is_valid=False,
                 confidence=0.0,
@@ -166,3 +242,8 @@ Evaluate this sentiment analysis."""
             completed=True,
             error=f"Evaluator failed: {str(e)}",
         )
+
+
+def sentiment_evaluator(state: SentimentSubgraphStateInternal) -> SentimentSubgraphStateInternal:
+    """Sync entry point for asentiment_evaluator (used by graph.invoke)."""
+    return run_sync(asentiment_evaluator(state))
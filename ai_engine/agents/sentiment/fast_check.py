@@ -0,0 +1,48 @@
+"""Sentiment fast check - rule-based validation that skips the LLM evaluator.
+
+Neutral sentiment backed by a large sample of mentions and articles gives
+the LLM nothing to arbitrate, so a high-confidence evaluation is
+synthesized directly. Directional or thinly sourced sentiment goes to the LLM.
+"""
+
+from typing import Optional
+
+from .schema import SentimentWorkerOutput, SentimentEvaluation
+
+# |overall_sentiment| below this counts as clearly neutral
+_NEUTRAL_BAND = 0.1
+
+# Minimum social mentions + news articles for the data to count as reliable
+_MIN_SAMPLE_SIZE = 100
+
+
+def fast_validate(worker_output: SentimentWorkerOutput) -> Optional[SentimentEvaluation]:
+    """Validate neutral, well-sourced sentiment without an LLM call.
+    
+    Args:
+        worker_output: Sentiment worker output to check
+        
+    Returns:
+        High-confidence SentimentEvaluation if sentiment is neutral and
+        well sourced, else None
+    """
+    if worker_output.sentiment_signal != "neutral":
+        return None
+    if abs(worker_output.overall_sentiment) >= _NEUTRAL_BAND:
+        return None
+    
+    sample_size = worker_output.social_volume + worker_output.news_count
+    if sample_size < _MIN_SAMPLE_SIZE:
+        return None
+    
+    return SentimentEvaluation(
+        is_valid=True,
+        confidence=0.9,
+        quality_score=0.85,
+        issues=[],
+        summary=(
+            f"Neutral sentiment ({worker_output.overall_sentiment:+.2f}) across "
+            f"{worker_output.social_volume} mentions and {worker_output.news_count} articles"
+        ),
+        recommendation="Sentiment does not favor either direction",
+    )
@@ -1,18 +1,21 @@
 """Sentiment subgraph builder - worker → evaluator workflow."""
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from ...utils.logger import get_logger
-from .schema import SentimentSubgraphState
+from .schema import SentimentSubgraphStateInternal
 from .worker import sentiment_worker
-from .evaluator import sentiment_evaluator
+from .evaluator import sentiment_evaluator, asentiment_evaluator
 
 logger = get_logger(__name__)
 
 
-def should_retry_worker(state: SentimentSubgraphState) -> str:
+def should_retry_worker(state: SentimentSubgraphStateInternal) -> str:
     """Decide if worker should retry based on evaluator feedback.
     
+    Failed validations follow state.user_decision (retry/skip/abort).
+    
     Returns:
         'worker' if evaluation failed and retries remain
         'END' if evaluation passed or max retries reached
@@ -20,6 +23,10 @@ def should_retry_worker(state: SentimentSubgraphState) -> str:
     if not state.evaluation:
         return END
     
+    # Worker/evaluator errors (e.g. no LLM configured) are not fixed by a retry
+    if state.error:
+        return END
+    
     if state.evaluation.is_valid:
         return END
     
@@ -37,44 +44,26 @@ def should_retry_worker(state: SentimentSubgraphState) -> str:
         logger.error(error_msg)
         return END
     
-    # Human-in-the-loop: Ask user if they want to retry
-    print(f"\n{'='*70}")
-    print(f"⚠️  SENTIMENT VALIDATION FAILED - {state.symbol}")
-    print(f"{'='*70}")
-    print(f"\n📊 Retry {state.retry_count}/{state.max_retries}")
-    print(f"\n❌ Issues found:")
-    for issue in state.evaluation.issues:
-        print(f"   • {issue}")
-    print(f"\n💡 Evaluator feedback: {state.evaluator_feedback}")
-    print(f"\n{'='*70}")
-    print("\nWhat would you like to do?")
-    print("  [y] Retry with feedback")
-    print("  [n] Skip and continue with current data")
-    print("  [a] Abort entire decision")
-    
-    choice = input("\nYour choice (y/n/a): ").strip().lower()
-    print(f"{'='*70}\n")
-    
-    if choice == 'a':
+    # Human-in-the-loop: apply the caller's pre-set decision (never blocks)
+    logger.warning(
+        "Sentiment validation failed for %s (retry %d/%d). Issues: %s. Feedback: %s",
+        state.symbol, state.retry_count, state.max_retries,
+        "; ".join(state.evaluation.issues), state.evaluator_feedback,
+    )
+    
+    if state.user_decision == "abort":
         logger.info("User aborted sentiment analysis")
         raise Exception("User aborted sentiment analysis")
-    elif choice == 'n':
+    if state.user_decision == "skip":
         logger.info("User skipped sentiment retry, continuing with current data")
         return END
-    else:
-        # Default to retry
-        logger.info("User approved sentiment retry")
-        return 'worker'
-    
-    logger.info(
-        f"Sentiment worker retry {state.retry_count}/{state.max_retries} for {state.symbol}. "
-        f"Feedback: {state.evaluation.issues}"
-    )
+    
+    logger.info("Retrying sentiment worker for %s with evaluator feedback", state.symbol)
     return "worker"
 
 
-def create_sentiment_subgraph() -> StateGraph:
-    """Create sentiment analysis subgraph.
+def _build() -> StateGraph:
+    """Build and compile the sentiment analysis subgraph.
     
     Architecture:
         START → worker → evaluator → [conditional]
@@ -90,11 +79,12 @@ def create_sentiment_subgraph() -> StateGraph:
     logger.info("Creating sentiment subgraph")
     
     # Create graph
-    graph = StateGraph(SentimentSubgraphState)
+    graph = StateGraph(SentimentSubgraphStateInternal)
     
     # Add nodes
     graph.add_node("worker", sentiment_worker)
-    graph.add_node("evaluator", sentiment_evaluator)
+    # Evaluator has an async path so graph.ainvoke awaits its LLM call
+    graph.add_node("evaluator", RunnableLambda(sentiment_evaluator, afunc=asentiment_evaluator))
     
     # Define flow
     graph.set_entry_point("worker")
@@ -105,8 +95,25 @@ def create_sentiment_subgraph() -> StateGraph:
         {"worker": "worker", END: END}
     )
     
-    # Compile
-    workflow = graph.compile()
+    # Compile without a checkpointer: nothing is serialized between node
+    # transitions, and the compiled graph holds no per-run state, so one
+    # instance is shared by every caller
+    workflow = graph.compile(checkpointer=None)
     
     logger.info("Sentiment subgraph created successfully with retry logic")
     return workflow
+
+
+_SENTIMENT_SUBGRAPH = _build()
+
+
+def create_sentiment_subgraph() -> StateGraph:
+    """Return the shared compiled Sentiment subgraph.
+    
+    The subgraph is compiled once at import; it is stateless with respect to
+    its input, so it is safe to reuse across requests and concurrent runs.
+    
+    Returns:
+        Compiled Sentiment subgraph
+    """
+    return _SENTIMENT_SUBGRAPH
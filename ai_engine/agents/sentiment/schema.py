@@ -1,6 +1,7 @@
 """Sentiment subgraph schema - Pydantic models for sentiment analysis."""
 
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -61,6 +62,42 @@ class SentimentSubgraphState(BaseModel):
         description="Feedback from evaluator for worker to address on retry"
     )
     
+    # Human-in-the-loop decision, set up front by the caller (API request,
+    # CLI prompt) instead of blocking on input() inside the graph
+    user_decision: Literal["retry", "skip", "abort"] = Field(
+        default="retry",
+        description="What to do when validation fails: retry with feedback, skip, or abort"
+    )
+    
     # Combined output
     completed: bool = False
     error: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SentimentSubgraphStateInternal:
+    """Unvalidated mirror of SentimentSubgraphState used as the LangGraph state.
+    
+    SentimentSubgraphState validates the input once at the subgraph boundary; nodes
+    then return dataclasses.replace() copies, which skip Pydantic validation
+    on every worker/evaluator hop of the retry loop.
+    """
+    
+    symbol: str
+    worker_output: Optional[SentimentWorkerOutput] = None
+    evaluation: Optional[SentimentEvaluation] = None
+    retry_count: int = 0
+    max_retries: int = 2
+    evaluator_feedback: Optional[str] = None
+    user_decision: Literal["retry", "skip", "abort"] = "retry"
+    completed: bool = False
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_pydantic(cls, state: SentimentSubgraphState) -> "SentimentSubgraphStateInternal":
+        """Build from a validated SentimentSubgraphState."""
+        return cls(**{f.name: getattr(state, f.name) for f in fields(cls)})
+    
+    def to_pydantic(self) -> SentimentSubgraphState:
+        """Convert back to the validated Pydantic state."""
+        return SentimentSubgraphState(**{f.name: getattr(self, f.name) for f in fields(self)})
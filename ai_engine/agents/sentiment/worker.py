@@ -1,13 +1,15 @@
 """Sentiment worker - deterministic sentiment analysis."""
 
+from dataclasses import replace
+
 from ...tools.sentiment import get_sentiment_analysis
-from ...utils.logger import get_logger
-from .schema import SentimentSubgraphState, SentimentWorkerOutput
+from ...utils.logger import get_logger, debug_exc_info
+from .schema import SentimentSubgraphStateInternal, SentimentWorkerOutput
 
 logger = get_logger(__name__)
 
 
-def sentiment_worker(state: SentimentSubgraphState) -> SentimentSubgraphState:
+def sentiment_worker(state: SentimentSubgraphStateInternal) -> SentimentSubgraphStateInternal:
     """Execute deterministic sentiment analysis.
     
     Single responsibility: Gather sentiment data from sources.
@@ -23,13 +25,14 @@ def sentiment_worker(state: SentimentSubgraphState) -> SentimentSubgraphState:
         Updated state with worker_output populated
     """
     try:
-        logger.info(f"Sentiment worker analyzing {state.symbol}")
+        logger.info("Sentiment worker analyzing %s", state.symbol)
         
         # If this is a retry, log the evaluator feedback
         if state.retry_count > 0:
             logger.warning(
-                f"Sentiment worker retry attempt {state.retry_count}/{state.max_retries} for {state.symbol}. "
-                f"Evaluator feedback: {state.evaluator_feedback}"
+                "Sentiment worker retry attempt %s/%s for %s. "
+                "Evaluator feedback: %s",
+                state.retry_count, state.max_retries, state.symbol, state.evaluator_feedback
             )
         
         # Get sentiment data (deterministic - calls external APIs/mocks)
@@ -51,22 +54,22 @@ def sentiment_worker(state: SentimentSubgraphState) -> SentimentSubgraphState:
         )
         
         logger.info(
-            f"Sentiment worker completed: overall={worker_output.overall_sentiment:.2f}, "
-            f"signal={worker_output.sentiment_signal}"
+            "Sentiment worker completed: overall=%.2f, "
+            "signal=%s",
+            worker_output.overall_sentiment, worker_output.sentiment_signal
         )
         
-        return SentimentSubgraphState(
-            symbol=state.symbol,
+        return replace(
+            state,
             worker_output=worker_output,
-            evaluation=state.evaluation,
             completed=False,
             error=None,
         )
         
     except Exception as e:
-        logger.error(f"Sentiment worker error: {e}", exc_info=True)
-        return SentimentSubgraphState(
-            symbol=state.symbol,
+        logger.error("Sentiment worker error: %s", e, exc_info=debug_exc_info(logger))
+        return replace(
+            state,
             worker_output=None,
             evaluation=None,
             completed=True,
@@ -1,5 +1,5 @@
 """Supervisor agent for hierarchical orchestration."""
 
-from .agent import supervisor_agent
+from .agent import supervisor_agent, asupervisor_agent, astream_supervisor_plan
 
-__all__ = ["supervisor_agent"]
+__all__ = ["supervisor_agent", "asupervisor_agent", "astream_supervisor_plan"]
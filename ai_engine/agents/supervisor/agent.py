@@ -8,73 +8,27 @@ The supervisor analyzes user requests and generates:
 Uses LCEL: prompt | llm | parser
 """
 
-from pydantic import BaseModel, Field
+import re
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
+from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
 
-from ...context.schema import DecisionContext
-from ...utils.llm_v2 import get_llm, LLMConfig
-from ...utils.logger import get_logger
-from ...utils.json_fixer import fix_json_string
+from ...context.schema import DecisionContext, SupervisorPlan
+from ...utils.llm_v2 import get_llm, cacheable_system_message, LLMConfig
+from ...utils.aio import run_sync
+from ...utils.eval_cache import EvaluationCache
+from ...utils.logger import get_logger, debug_exc_info
+from ...utils.parser_cache import get_parser
 
 logger = get_logger(__name__)
 
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            return super().parse(text)
-        except OutputParserException as e:
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                raise e
+_SUPERVISOR_PARSER, _SUPERVISOR_FORMAT_INSTRUCTIONS = get_parser(SupervisorPlan)
 
-
-class SupervisorPlan(BaseModel):
-    """Supervisor's execution plan."""
-    
-    trading_rules: list[str] = Field(
-        description="Extracted trading rules from user request"
-    )
-    required_subgraphs: list[str] = Field(
-        description="Which subgraphs are needed (market, ml, sentiment, risk)"
-    )
-    execution_strategy: str = Field(
-        description="How to orchestrate the subgraphs"
-    )
-    reasoning: str = Field(
-        description="Why this plan was chosen"
-    )
-
-
-def supervisor_agent(context: DecisionContext) -> DecisionContext:
-    """Generate execution plan from user request.
-    
-    This is the top-level orchestrator that:
-    1. Analyzes the user's request
-    2. Extracts trading rules
-    3. Generates an execution plan
-    
-    Args:
-        context: Current decision context
-        
-    Returns:
-        Updated context with supervisor_plan
-    """
-    logger.info(f"Supervisor analyzing request for {context.symbol}")
-    
-    try:
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=SupervisorPlan)
-        
-        # Create prompt
-        system_message = """You are a trading strategy supervisor.
+SUPERVISOR_SYSTEM_MESSAGE = """You are a trading strategy supervisor.
 
 Your job is to analyze user requests and create an execution plan.
 
@@ -97,7 +51,7 @@ Guidelines:
 
 {format_instructions}"""
 
-        human_message = """User Request: {user_request}
+SUPERVISOR_HUMAN_MESSAGE = """User Request: {user_request}
 
 Symbol: {symbol}
 Request ID: {request_id}
@@ -105,49 +59,200 @@ Request ID: {request_id}
 
 Analyze this request and create an execution plan."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
-        
-        # Build enriched rules section if available
-        enriched_rules_section = ""
-        if context.trading_rules:
-            rules_text = "\n".join(f"  {i+1}. {rule}" for i, rule in enumerate(context.trading_rules))
-            enriched_rules_section = f"\n\nEnriched Trading Rules (from rule enrichment graph):\nThese are structured rules created by the user. Use them to guide your analysis:\n{rules_text}"
+# Built once at import. The system block (guidelines + format instructions)
+# is rendered up front and kept byte-identical so providers can serve it from
+# their prompt-prefix cache; only the human message varies per request.
+_SUPERVISOR_PROMPT = ChatPromptTemplate.from_messages([
+    cacheable_system_message(
+        SUPERVISOR_SYSTEM_MESSAGE.replace("{format_instructions}", _SUPERVISOR_FORMAT_INSTRUCTIONS),
+        LLMConfig.SUPERVISOR.get("provider"),
+    ),
+    ("human", SUPERVISOR_HUMAN_MESSAGE),
+])
+
+
+# Plans for identical requests (same symbol, rules and request text up to
+# case/whitespace) are reused instead of re-running the supervisor LLM
+_PLAN_CACHE = EvaluationCache(SupervisorPlan, maxsize=512)
+
+
+def _normalize_request(text: str) -> str:
+    """Case- and whitespace-insensitive form of the request, for cache keys."""
+    return " ".join(text.lower().split())
+
+
+# Template requests whose plan is known without asking the LLM
+_ANALYZE_PATTERN = re.compile(r"(?:analy[sz]e|what do you think (?:about|of)) (?P<symbol>[\w/-]+)\??")
+_FOCUSED_PATTERN = re.compile(r"check (?P<symbol>[\w/-]+) (?P<focus>technicals?|sentiment|ml|predictions?)\??")
+
+_FOCUS_SUBGRAPHS = {
+    "technical": "market",
+    "technicals": "market",
+    "sentiment": "sentiment",
+    "ml": "ml",
+    "prediction": "ml",
+    "predictions": "ml",
+}
+
+
+def _simple_plan(context: DecisionContext) -> Optional[SupervisorPlan]:
+    """Build the plan locally for empty or template requests, else None.
+    
+    Handles "analyze X" / "what do you think about X" (all subgraphs) and
+    "check X technical|sentiment|ml" (that subgraph plus risk) when X is the
+    request's symbol or its base asset.
+    """
+    request = _normalize_request(context.user_request or "")
+    symbol = context.symbol.lower()
+    symbols = {symbol, re.split(r"[/-]", symbol)[0]}
+    
+    subgraphs = None
+    if not request:
+        subgraphs = ["market", "ml", "sentiment", "risk"]
+    elif (match := _ANALYZE_PATTERN.fullmatch(request)) and match["symbol"] in symbols:
+        subgraphs = ["market", "ml", "sentiment", "risk"]
+    elif (match := _FOCUSED_PATTERN.fullmatch(request)) and match["symbol"] in symbols:
+        subgraphs = [_FOCUS_SUBGRAPHS[match["focus"]], "risk"]
+    
+    if subgraphs is None:
+        return None
+    
+    return SupervisorPlan(
+        trading_rules=list(context.trading_rules) or ["Use all available data"],
+        required_subgraphs=subgraphs,
+        execution_strategy="Run all subgraphs in parallel where possible",
+        reasoning="Template request, planned without the LLM",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_chain() -> Runnable:
+    """Build the supervisor LCEL chain on first use.
+    
+    Deferred because get_llm needs an API key, which may not be set at import.
+    """
+    return _SUPERVISOR_PROMPT | get_llm(**LLMConfig.SUPERVISOR) | _SUPERVISOR_PARSER
+
+
+@lru_cache(maxsize=1)
+def _get_stream_chain() -> Runnable:
+    """Supervisor chain whose parser yields partial plan dicts while streaming."""
+    return _SUPERVISOR_PROMPT | get_llm(**LLMConfig.SUPERVISOR) | JsonOutputParser()
+
+
+def _plan_inputs(context: DecisionContext) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Prompt variables and plan-cache key for a request."""
+    # Build enriched rules section if available
+    enriched_rules_section = ""
+    if context.trading_rules:
+        rules_text = "\n".join(f"  {i+1}. {rule}" for i, rule in enumerate(context.trading_rules))
+        enriched_rules_section = f"\n\nEnriched Trading Rules (from rule enrichment graph):\nThese are structured rules created by the user. Use them to guide your analysis:\n{rules_text}"
+    
+    inputs = {
+        "user_request": context.user_request or f"Analyze {context.symbol}",
+        "symbol": context.symbol,
+        "request_id": context.request_id,
+        "enriched_rules_section": enriched_rules_section,
+    }
+    
+    # request_id only labels the request, so it stays out of the cache key
+    cache_key = {
+        "user_request": _normalize_request(inputs["user_request"]),
+        "symbol": context.symbol,
+        "enriched_rules_section": enriched_rules_section,
+    }
+    return inputs, cache_key
+
+
+async def astream_supervisor_plan(context: DecisionContext) -> AsyncIterator[dict[str, Any]]:
+    """Stream the supervisor plan as it is generated.
+    
+    Yields growing partial plan dicts (e.g. reasoning arriving token by
+    token). The completed plan is validated and stored in the plan cache, so
+    a graph run for the same request picks it up without another LLM call.
+    
+    Args:
+        context: Current decision context
         
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.SUPERVISOR)
-        chain = prompt | llm | parser
+    Yields:
+        Partial SupervisorPlan dicts; the last one is complete
+    
+    Examples:
+        async for partial in astream_supervisor_plan(context):
+            print(partial.get("reasoning", ""))
+    """
+    plan = _simple_plan(context)
+    if plan is not None:
+        yield plan.model_dump()
+        return
+    
+    inputs, cache_key = _plan_inputs(context)
+    key = _PLAN_CACHE.make_key(cache_key)
+    
+    cached = _PLAN_CACHE.get(key)
+    if cached is not None:
+        yield cached.model_dump()
+        return
+    
+    partial: dict[str, Any] = {}
+    async for partial in _get_stream_chain().astream(inputs):
+        yield partial
+    
+    _PLAN_CACHE.set(key, SupervisorPlan.model_validate(partial))
+
+
+async def asupervisor_agent(context: DecisionContext) -> DecisionContext:
+    """Generate execution plan from user request.
+    
+    This is the top-level orchestrator that:
+    1. Analyzes the user's request
+    2. Extracts trading rules
+    3. Generates an execution plan
+    
+    The LLM call is awaited, so the API's event loop is not blocked while
+    the plan is generated.
+    
+    Args:
+        context: Current decision context
         
-        # Invoke
-        plan = chain.invoke({
-            "user_request": context.user_request or f"Analyze {context.symbol}",
-            "symbol": context.symbol,
-            "request_id": context.request_id,
-            "enriched_rules_section": enriched_rules_section,
-            "format_instructions": parser.get_format_instructions(),
-        })
+    Returns:
+        Updated context with supervisor_plan
+    """
+    logger.info("Supervisor analyzing request for %s", context.symbol)
+    
+    try:
+        plan = _simple_plan(context)
+        if plan is None:
+            inputs, cache_key = _plan_inputs(context)
+            
+            # Invoke the shared LCEL chain on a cache miss
+            plan = await _PLAN_CACHE.aget_or_call(cache_key, lambda: _get_chain().ainvoke(inputs))
         
         # Update context
-        context.supervisor_plan = plan.model_dump()
+        context.supervisor_plan = plan
         context.trading_rules = plan.trading_rules
         
         logger.info(
-            f"Supervisor plan created: {len(plan.required_subgraphs)} subgraphs, "
-            f"{len(plan.trading_rules)} rules"
+            "Supervisor plan created: %s subgraphs, "
+            "%s rules",
+            len(plan.required_subgraphs), len(plan.trading_rules)
         )
-        logger.debug(f"Plan: {plan.reasoning}")
+        logger.debug("Plan: %s", plan.reasoning)
         
     except Exception as e:
-        logger.error(f"Supervisor error: {e}", exc_info=True)
+        logger.error("Supervisor error: %s", e, exc_info=debug_exc_info(logger))
         # Fallback plan
-        context.supervisor_plan = {
-            "trading_rules": ["Use all available data"],
-            "required_subgraphs": ["market", "ml", "sentiment", "risk"],
-            "execution_strategy": "Run all subgraphs in parallel where possible",
-            "reasoning": f"Error in supervisor, using default plan: {str(e)}",
-        }
+        context.supervisor_plan = SupervisorPlan(
+            trading_rules=["Use all available data"],
+            required_subgraphs=["market", "ml", "sentiment", "risk"],
+            execution_strategy="Run all subgraphs in parallel where possible",
+            reasoning=f"Error in supervisor, using default plan: {str(e)}",
+        )
         context.trading_rules = ["Use all available data"]
     
     return context
+
+
+def supervisor_agent(context: DecisionContext) -> DecisionContext:
+    """Sync entry point for asupervisor_agent (used by graph.invoke)."""
+    return run_sync(asupervisor_agent(context))
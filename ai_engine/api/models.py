@@ -1,15 +1,34 @@
 """Pydantic models for API requests and responses."""
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+import base64
+from typing import Dict, Any, List, Literal, Optional
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+
+def _decode_series(encoded: str, dtype: str) -> np.ndarray:
+    """Decode a base64 little-endian float buffer into a float64 array."""
+    raw = base64.b64decode(encoded, validate=True)
+    itemsize = np.dtype(dtype).itemsize
+    if not raw or len(raw) % itemsize:
+        raise ValueError(f"expected a non-empty buffer of {dtype} values")
+    return np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder("<")).astype(np.float64)
 
 
 class DecisionRequest(BaseModel):
     """Request model for trading decision endpoint."""
     
     symbol: str = Field(..., description="Trading symbol (e.g., 'BTC/USD')")
-    prices: List[float] = Field(..., description="Historical price data", min_items=1)
-    volumes: List[float] = Field(..., description="Historical volume data", min_items=1)
+    prices: Optional[List[float]] = Field(default=None, description="Historical price data", min_length=1)
+    volumes: Optional[List[float]] = Field(default=None, description="Historical volume data", min_length=1)
+    
+    # Compact alternative to the JSON arrays above: base64 of the raw
+    # little-endian float buffer, decoded with one numpy call instead of
+    # parsing and boxing every number
+    prices_b64: Optional[str] = Field(default=None, description="Base64 little-endian float buffer of prices")
+    volumes_b64: Optional[str] = Field(default=None, description="Base64 little-endian float buffer of volumes")
+    series_dtype: Literal["float32", "float64"] = Field(default="float32", description="Element type of the *_b64 buffers")
     
     # Optional parameters
     rules: Optional[List[Dict[str, Any]]] = Field(default=None, description="User-defined trading rules")
@@ -22,18 +41,47 @@ class DecisionRequest(BaseModel):
     history: Optional[Dict[str, Any]] = Field(default=None, description="Historical performance data")
     request_id: Optional[str] = Field(default=None, description="Request ID for tracking")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "symbol": "BTC/USD",
-                "prices": [50000, 50100, 50200, 50300, 50250, 50400, 50500, 50450, 50600, 50700],
-                "volumes": [1000, 1100, 1050, 1200, 1150, 1300, 1250, 1400, 1350, 1500],
-                "proposed_action": "buy",
-                "proposed_size": 1000.0,
-                "account_balance": 10000.0,
-                "fear_greed_index": 65.0,
-            }
+    _price_array: np.ndarray = PrivateAttr()
+    _volume_array: np.ndarray = PrivateAttr()
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "symbol": "BTC/USD",
+            "prices": [50000, 50100, 50200, 50300, 50250, 50400, 50500, 50450, 50600, 50700],
+            "volumes": [1000, 1100, 1050, 1200, 1150, 1300, 1250, 1400, 1350, 1500],
+            "proposed_action": "buy",
+            "proposed_size": 1000.0,
+            "account_balance": 10000.0,
+            "fear_greed_index": 65.0,
         }
+    })
+
+    
+    @model_validator(mode="after")
+    def _decode_series_fields(self) -> "DecisionRequest":
+        """Resolve prices/volumes from either the JSON arrays or the base64 buffers."""
+        for name in ("prices", "volumes"):
+            values = getattr(self, name)
+            encoded = getattr(self, f"{name}_b64")
+            if encoded is not None:
+                array = _decode_series(encoded, self.series_dtype)
+            elif values is not None:
+                array = np.asarray(values, dtype=np.float64)
+            else:
+                raise ValueError(f"either {name} or {name}_b64 is required")
+            setattr(self, f"_{name[:-1]}_array", array)
+        return self
+    
+    @property
+    def price_array(self) -> np.ndarray:
+        """Prices as a float64 array, whichever wire format was used."""
+        return self._price_array
+    
+    @property
+    def volume_array(self) -> np.ndarray:
+        """Volumes as a float64 array, whichever wire format was used."""
+        return self._volume_array
+
 
 
 class DecisionResponse(BaseModel):
@@ -56,25 +104,32 @@ class DecisionResponse(BaseModel):
     request_id: str = Field(default="", description="Request ID")
     signals: Dict[str, Any] = Field(default_factory=dict, description="Signal breakdown")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "symbol": "BTC/USD",
-                "action": "buy",
-                "confidence": 0.75,
-                "reasoning": "Strong bullish signals from market indicators (RSI oversold, bullish trend) combined with positive ML prediction and sentiment.",
-                "position_size": 1000.0,
-                "stop_loss": 49500.0,
-                "take_profit": 52000.0,
-                "risk_score": 0.35,
-                "timestamp": "2025-12-29T10:30:00Z",
-                "processing_time_ms": 250.5,
-                "request_id": "req_123456",
-                "signals": {
-                    "market": "bullish",
-                    "ml": "bullish",
-                    "sentiment": "positive",
-                    "risk": "proceed"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "symbol": "BTC/USD",
+            "action": "buy",
+            "confidence": 0.75,
+            "reasoning": "Strong bullish signals from market indicators (RSI oversold, bullish trend) combined with positive ML prediction and sentiment.",
+            "position_size": 1000.0,
+            "stop_loss": 49500.0,
+            "take_profit": 52000.0,
+            "risk_score": 0.35,
+            "timestamp": "2025-12-29T10:30:00Z",
+            "processing_time_ms": 250.5,
+            "request_id": "req_123456",
+            "signals": {
+                "market": "bullish",
+                "ml": "bullish",
+                "sentiment": "positive",
+                "risk": "proceed"
             }
         }
+    })
+
+
+class StatusResponse(BaseModel):
+    """Response model for engine status endpoint."""
+    
+    status: str = Field(..., description="Service status")
+    engine: str = Field(..., description="Decision engine state")
+    graph_type: str = Field(..., description="Workflow graph in use: simple or full")
@@ -1,19 +1,35 @@
 """API routes for the decision engine."""
 
-from fastapi import APIRouter, HTTPException
-from .models import DecisionRequest, DecisionResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from .models import DecisionRequest, DecisionResponse, StatusResponse
 from ..graph.engine import DecisionEngine
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-# Initialize decision engine (singleton)
-decision_engine = DecisionEngine(use_simple_graph=False)
+
+def get_engine(request: Request) -> DecisionEngine:
+    """Return the app's DecisionEngine (created at startup, or lazily on first use)."""
+    engine = getattr(request.app.state, "decision_engine", None)
+    if engine is None:
+        engine = DecisionEngine(use_simple_graph=False)
+        request.app.state.decision_engine = engine
+    return engine
+
+
+# Passed to the engine by attribute; excluded from the kwargs dump so the
+# price/volume lists are not copied per request
+_SERIES_FIELDS = {"symbol", "prices", "volumes", "prices_b64", "volumes_b64", "series_dtype"}
 
 
 @router.post("/decide", response_model=DecisionResponse)
-async def make_decision(request: DecisionRequest) -> DecisionResponse:
+async def make_decision(
+    request: DecisionRequest,
+    decision_engine: DecisionEngine = Depends(get_engine),
+) -> DecisionResponse:
     """Make a trading decision based on input data.
     
     This endpoint:
@@ -27,23 +43,17 @@ async def make_decision(request: DecisionRequest) -> DecisionResponse:
     Returns:
         Trading decision with action, confidence, and reasoning
     """
-    logger.info(f"Received decision request for {request.symbol}")
+    logger.info("Received decision request for %s", request.symbol)
     
     try:
-        # Convert request to parameters
-        params = request.dict()
-        
-        # Extract main parameters
-        symbol = params.pop("symbol")
-        prices = params.pop("prices")
-        volumes = params.pop("volumes")
+        symbol = request.symbol
         
         # Execute decision workflow
         decision = await decision_engine.decide_async(
             symbol=symbol,
-            prices=prices,
-            volumes=volumes,
-            **params
+            prices=request.price_array,
+            volumes=request.volume_array,
+            **request.model_dump(exclude=_SERIES_FIELDS)
         )
         
         # Build response
@@ -62,22 +72,60 @@ async def make_decision(request: DecisionRequest) -> DecisionResponse:
             request_id=decision.get("request_id", ""),
         )
         
-        logger.info(f"Decision completed for {symbol}: {response.action}")
+        logger.info("Decision completed for %s: %s", symbol, response.action)
         return response
     
     except Exception as e:
-        logger.error(f"Error processing decision request: {e}", exc_info=True)
+        logger.error("Error processing decision request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing decision: {str(e)}"
         )
 
 
-@router.get("/status")
-async def get_status():
+@router.post("/decide/stream")
+async def stream_decision(
+    request: DecisionRequest,
+    decision_engine: DecisionEngine = Depends(get_engine),
+) -> StreamingResponse:
+    """Make a trading decision, streaming progress as Server-Sent Events.
+    
+    Emits `plan` events with the supervisor plan as it is generated (partial
+    JSON growing token by token), a `stage` event as each graph node
+    finishes (e.g. the market analysis), then a single `decision` event with
+    the final decision, so clients see the reasoning long before the full
+    workflow completes.
+    
+    Args:
+        request: Decision request with market data and parameters
+        
+    Returns:
+        text/event-stream response
+    """
+    logger.info("Received streaming decision request for %s", request.symbol)
+    
+    async def events():
+        try:
+            async for event, data in decision_engine.decide_stream(
+                symbol=request.symbol,
+                prices=request.price_array,
+                volumes=request.volume_array,
+                **request.model_dump(exclude=_SERIES_FIELDS)
+            ):
+                # pydantic-core's serializer, same as the non-streaming responses
+                yield b"event: %s\ndata: %s\n\n" % (event.encode(), to_json(data, fallback=str))
+        except Exception as e:
+            logger.error("Error streaming decision: %s", e, exc_info=True)
+            yield b"event: error\ndata: %s\n\n" % to_json({"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@router.get("/status", response_model=StatusResponse)
+async def get_status(decision_engine: DecisionEngine = Depends(get_engine)) -> StatusResponse:
     """Get engine status."""
-    return {
-        "status": "operational",
-        "engine": "running",
-        "graph_type": "simple" if decision_engine.use_simple_graph else "full",
-    }
+    return StatusResponse(
+        status="operational",
+        engine="running",
+        graph_type="simple" if decision_engine.use_simple_graph else "full",
+    )
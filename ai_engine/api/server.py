@@ -1,17 +1,32 @@
 """FastAPI server setup."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routes import router
+from ..graph.engine import DecisionEngine
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the decision engine once per worker, off the event loop."""
+    logger.info("AI Decision Engine starting up")
+    app.state.decision_engine = await asyncio.to_thread(DecisionEngine, use_simple_graph=False)
+    yield
+    logger.info("AI Decision Engine shutting down")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Decision Engine",
     description="AI-powered trading decision engine for crypto trading copilot",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -47,14 +62,3 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler."""
-    logger.info("AI Decision Engine starting up")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler."""
-    logger.info("AI Decision Engine shutting down")
@@ -6,22 +6,26 @@ all tool outputs into a single structured object.
 
 from .schema import (
     DecisionContext,
+    DecisionState,
     MarketContext,
     MLContext,
     SentimentContext,
     RulesContext,
     RiskContext,
     HistoryContext,
+    SupervisorPlan,
 )
 from .builder import ContextBuilder
 
 __all__ = [
     "DecisionContext",
+    "DecisionState",
     "MarketContext",
     "MLContext",
     "SentimentContext",
     "RulesContext",
     "RiskContext",
     "HistoryContext",
+    "SupervisorPlan",
     "ContextBuilder",
 ]
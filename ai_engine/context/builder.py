@@ -4,8 +4,12 @@ Combines all tool outputs into a unified DecisionContext object.
 """
 
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
+import itertools
+import os
+import time
+
+from langchain_core.runnables import RunnableLambda, RunnableParallel
 
 from .schema import (
     DecisionContext,
@@ -25,6 +29,36 @@ from ..tools import (
 )
 
 
+def _market_and_ml(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Market indicators, then the ML predictions that depend on them."""
+    market_data = get_market_indicators(inputs["symbol"], inputs["prices"], inputs["volumes"])
+    ml_data = get_ml_predictions(inputs["symbol"], inputs["prices"], market_data)
+    return {"market": market_data, "ml": ml_data}
+
+
+def _sentiment(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Sentiment analysis (network-bound)."""
+    return get_sentiment_analysis(inputs["symbol"], inputs["fear_greed_index"])
+
+
+# Request IDs only need to be unique, not unguessable: pid + counter + time
+# avoids a urandom read per request (itertools.count is atomic under the GIL)
+_REQUEST_COUNTER = itertools.count()
+
+
+def _new_request_id() -> str:
+    """Cheap process-unique request ID, e.g. req_4242_17_1843a9f0c2b1d000."""
+    return f"req_{os.getpid()}_{next(_REQUEST_COUNTER)}_{time.time_ns():x}"
+
+
+# Independent tool calls run concurrently (a thread pool on invoke, the event
+# loop's executor on ainvoke), so latency is the slowest branch, not the sum
+_GATHER_TOOLS = RunnableParallel(
+    market_and_ml=RunnableLambda(_market_and_ml),
+    sentiment=RunnableLambda(_sentiment),
+)
+
+
 class ContextBuilder:
     """Builds DecisionContext from input parameters and tool outputs."""
     
@@ -66,20 +100,70 @@ class ContextBuilder:
         Returns:
             Complete DecisionContext object
         """
-        request_id = kwargs.get("request_id", str(uuid.uuid4()))
-        timestamp = datetime.utcnow().isoformat()
-        
-        # Get market indicators
-        market_data = get_market_indicators(symbol, prices, volumes)
-        market_context = MarketContext(**market_data)
+        gathered = _GATHER_TOOLS.invoke({
+            "symbol": symbol,
+            "prices": prices,
+            "volumes": volumes,
+            "fear_greed_index": fear_greed_index,
+        })
+        return self._assemble(
+            symbol, gathered, rules, proposed_action, proposed_size, account_balance,
+            current_positions, entry_price, history, **kwargs
+        )
+    
+    async def abuild_context(
+        self,
+        symbol: str,
+        prices: List[float],
+        volumes: List[float],
+        rules: List[Dict[str, Any]] = None,
+        proposed_action: str = "hold",
+        proposed_size: float = 0.0,
+        account_balance: float = 10000.0,
+        current_positions: Dict[str, float] = None,
+        entry_price: Optional[float] = None,
+        fear_greed_index: Optional[float] = None,
+        history: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> DecisionContext:
+        """Async version of build_context (tool calls run off the event loop)."""
+        gathered = await _GATHER_TOOLS.ainvoke({
+            "symbol": symbol,
+            "prices": prices,
+            "volumes": volumes,
+            "fear_greed_index": fear_greed_index,
+        })
+        return self._assemble(
+            symbol, gathered, rules, proposed_action, proposed_size, account_balance,
+            current_positions, entry_price, history, **kwargs
+        )
+    
+    def _assemble(
+        self,
+        symbol: str,
+        gathered: Dict[str, Any],
+        rules: Optional[List[Dict[str, Any]]],
+        proposed_action: str,
+        proposed_size: float,
+        account_balance: float,
+        current_positions: Optional[Dict[str, float]],
+        entry_price: Optional[float],
+        history: Optional[Dict[str, Any]],
+        **kwargs
+    ) -> DecisionContext:
+        """Evaluate rules and risk on the gathered tool outputs and build the context."""
+        request_id = kwargs.get("request_id") or _new_request_id()
+        timestamp = datetime.now(timezone.utc).isoformat()
         
-        # Get ML predictions
-        ml_data = get_ml_predictions(symbol, prices, market_data)
-        ml_context = MLContext(**ml_data)
+        market_data = gathered["market_and_ml"]["market"]
+        ml_data = gathered["market_and_ml"]["ml"]
+        sentiment_data = gathered["sentiment"]
         
-        # Get sentiment analysis
-        sentiment_data = get_sentiment_analysis(symbol, fear_greed_index)
-        sentiment_context = SentimentContext(**sentiment_data)
+        # Tool outputs come from our own code and already match the schemas,
+        # so they skip per-field validation; user-supplied history does not
+        market_context = MarketContext.model_construct(**market_data)
+        ml_context = MLContext.model_construct(**ml_data)
+        sentiment_context = SentimentContext.model_construct(**sentiment_data)
         
         # Evaluate rules
         if rules is None:
@@ -92,7 +176,7 @@ class ContextBuilder:
             "sentiment": sentiment_data,
         }
         rules_data = evaluate_rules(rules, rule_eval_context)
-        rules_context = RulesContext(**rules_data)
+        rules_context = RulesContext.model_construct(**rules_data)
         
         # Check risk constraints
         risk_data = check_risk_constraints(
@@ -105,12 +189,12 @@ class ContextBuilder:
             entry_price=entry_price,
             volatility=ml_data["volatility"],
         )
-        risk_context = RiskContext(**risk_data)
+        risk_context = RiskContext.model_construct(**risk_data)
         
         # Build history context
         if history is None:
             history = {}
-        history_context = HistoryContext(**history)
+        history_context = HistoryContext.model_validate(history)
         
         # Create complete decision context
         context = DecisionContext(
@@ -3,8 +3,10 @@
 Defines the structure of all context objects used in the decision engine.
 """
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+import base64
+from typing import Dict, Any, List, Optional, TypedDict
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_validator
 
 
 class MarketContext(BaseModel):
@@ -82,6 +84,23 @@ class HistoryContext(BaseModel):
     last_action: Optional[str] = None
 
 
+class SupervisorPlan(BaseModel):
+    """Supervisor's execution plan."""
+    
+    trading_rules: list[str] = Field(
+        description="Extracted trading rules from user request"
+    )
+    required_subgraphs: list[str] = Field(
+        description="Which subgraphs are needed (market, ml, sentiment, risk)"
+    )
+    execution_strategy: str = Field(
+        description="How to orchestrate the subgraphs"
+    )
+    reasoning: str = Field(
+        description="Why this plan was chosen"
+    )
+
+
 class DecisionContext(BaseModel):
     """Complete decision context combining all data sources.
     
@@ -91,12 +110,14 @@ class DecisionContext(BaseModel):
     # Input parameters
     symbol: str
     request_id: str = Field(default="")
-    prices: List[float] = Field(default_factory=list)
-    volumes: List[float] = Field(default_factory=list)
+    prices: np.ndarray = Field(default_factory=lambda: np.empty(0), repr=False)
+    volumes: np.ndarray = Field(default_factory=lambda: np.empty(0), repr=False)
     user_request: Optional[str] = None
+    # Last price, extracted once at validation (None when prices is empty)
+    current_price: Optional[float] = None
     
     # Supervisor output
-    supervisor_plan: Optional[Dict[str, Any]] = None
+    supervisor_plan: Optional[SupervisorPlan] = None
     trading_rules: List[str] = Field(default_factory=list)
     
     # Tool outputs (legacy, for backward compatibility)
@@ -107,14 +128,6 @@ class DecisionContext(BaseModel):
     risk: Optional[RiskContext] = None
     history: Optional[HistoryContext] = None
     
-    # New: Context objects for compatibility
-    market_context: Optional[MarketContext] = None
-    ml_context: Optional[MLContext] = None
-    sentiment_context: Optional[SentimentContext] = None
-    rules_context: Optional[RulesContext] = None
-    risk_context: Optional[RiskContext] = None
-    history_context: Optional[HistoryContext] = None
-    
     # Agent outputs (from subgraphs)
     market_agent_output: Optional[Dict[str, Any]] = None
     ml_agent_output: Optional[Dict[str, Any]] = None
@@ -129,5 +142,84 @@ class DecisionContext(BaseModel):
     timestamp: Optional[str] = None
     processing_time_ms: Optional[float] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    # *_context names are aliases of the tool output fields above, kept for
+    # older callers without storing (and serializing) every context twice
+    market_context = property(lambda self: self.market)
+    ml_context = property(lambda self: self.ml)
+    sentiment_context = property(lambda self: self.sentiment)
+    rules_context = property(lambda self: self.rules)
+    risk_context = property(lambda self: self.risk)
+    history_context = property(lambda self: self.history)
+    
+    def to_state(self) -> "DecisionState":
+        """Shallow field dict used as the LangGraph state (no copies)."""
+        return dict(self)
+    
+    @classmethod
+    def from_state(cls, state: "DecisionState") -> "DecisionContext":
+        """Wrap graph state in a DecisionContext without re-validating it.
+        
+        State only ever holds values produced by DecisionContext validation
+        or by our own nodes, so per-node validation is skipped.
+        """
+        return cls.model_construct(**state)
+    
+    @field_validator("prices", "volumes", mode="before")
+    @classmethod
+    def _as_float_array(cls, value):
+        """Accept lists, arrays or base64 float64 buffers; store a float64 array.
+        
+        Arrays are not copied if they already are float64.
+        """
+        if isinstance(value, (str, bytes)):
+            return np.frombuffer(base64.b64decode(value), dtype="<f8").copy()
+        return np.ascontiguousarray(value, dtype=np.float64)
+    
+    @model_validator(mode="after")
+    def _set_current_price(self) -> "DecisionContext":
+        """Fill current_price from the last price unless given explicitly."""
+        if self.current_price is None and len(self.prices):
+            self.current_price = float(self.prices[-1])
+        return self
+    
+    @field_serializer("prices", "volumes", when_used="json")
+    def _series_to_base64(self, value: np.ndarray) -> str:
+        """Emit series as one base64 float64 buffer instead of a JSON number list."""
+        return base64.b64encode(np.ascontiguousarray(value, dtype="<f8").tobytes()).decode("ascii")
+
+
+class DecisionState(TypedDict, total=False):
+    """LangGraph state for the hierarchical graph.
+    
+    Mirrors DecisionContext's fields (plus graph-only keys). LangGraph passes TypedDict state
+    between nodes as-is, whereas a Pydantic state schema is re-validated on
+    every hop; DecisionContext stays the validated API-side model.
+    """
+    
+    symbol: str
+    request_id: str
+    prices: np.ndarray
+    volumes: np.ndarray
+    user_request: Optional[str]
+    current_price: Optional[float]
+    supervisor_plan: Optional[SupervisorPlan]
+    trading_rules: List[str]
+    market: Optional[MarketContext]
+    ml: Optional[MLContext]
+    sentiment: Optional[SentimentContext]
+    rules: Optional[RulesContext]
+    risk: Optional[RiskContext]
+    history: Optional[HistoryContext]
+    market_agent_output: Optional[Dict[str, Any]]
+    ml_agent_output: Optional[Dict[str, Any]]
+    sentiment_agent_output: Optional[Dict[str, Any]]
+    risk_agent_output: Optional[Dict[str, Any]]
+    decision_agent_output: Optional[Dict[str, Any]]
+    final_decision: Optional[Dict[str, Any]]
+    timestamp: Optional[str]
+    processing_time_ms: Optional[float]
+    # Graph-only: worker outputs prefetched while the supervisor plans
+    # (by subgraph name); dropped by DecisionContext.from_state
+    prefetched_outputs: Dict[str, Any]
@@ -1,17 +1,43 @@
 """Decision engine - orchestrates the hierarchical LangGraph workflow."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Optional
+import json
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
 from ..context.schema import DecisionContext
 from ..context.builder import ContextBuilder
 from .hierarchical_graph import create_hierarchical_graph
+from ..agents.supervisor import astream_supervisor_plan
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _format_rule(rule_json: str) -> str:
+    """Format one enriched rule (canonical JSON) as a human-readable description.
+    
+    Sessions resubmit the same rules on every request, so descriptions are
+    cached by the rule's sorted-key JSON.
+    """
+    rule = json.loads(rule_json)
+    conditions_str = ", ".join(
+        f"{c['field']} {c['operator']} {c['value']}" for c in rule.get('conditions', [])
+    )
+    rule_str = f"{rule.get('name', 'Unnamed Rule')}: {rule.get('action', 'UNKNOWN').upper()} when {conditions_str}"
+    if rule.get('metadata', {}).get('description'):
+        rule_str += f" - {rule['metadata']['description']}"
+    return rule_str
+
+
+@lru_cache(maxsize=1024)
+def _default_request_id(symbol: str) -> str:
+    """Request label used when no user request is given, interned per symbol."""
+    return f"Decision for {symbol}"
+
+
 class DecisionEngine:
     """Main decision engine that orchestrates the LangGraph workflow."""
     
@@ -41,6 +67,97 @@ class DecisionEngine:
         logger.info("Decision engine initialized with hierarchical graph (supervisor → agents)")
 
     
+    def _build_context(
+        self,
+        symbol: str,
+        prices: list[float],
+        volumes: list[float],
+        user_request: str = "",
+        **kwargs
+    ) -> DecisionContext:
+        """Build the initial graph state for a decision run."""
+        # For hierarchical graph, create simpler context
+        if self.use_hierarchical:
+            # Extract enriched rules from kwargs if provided
+            enriched_rules = kwargs.get("rules", [])
+            # Format rules as descriptive strings for supervisor
+            trading_rules = [
+                _format_rule(json.dumps(rule, sort_keys=True, default=str))
+                for rule in enriched_rules or []
+            ]
+            
+            return DecisionContext(
+                symbol=symbol,
+                prices=prices,
+                volumes=volumes,
+                request_id=user_request or _default_request_id(symbol),
+                user_request=user_request,
+                trading_rules=trading_rules,
+            )
+        
+        # Build full context for legacy graphs
+        return self.context_builder.build_context(
+            symbol=symbol,
+            prices=prices,
+            volumes=volumes,
+            **kwargs
+        )
+    
+    def _finalize(self, result: Any, symbol: str, start_time: float, **kwargs) -> Dict[str, Any]:
+        """Extract the final decision from a graph result and add metadata."""
+        # Calculate processing time
+        processing_time_ms = (time.time() - start_time) * 1000
+        
+        # Extract final decision
+        if isinstance(result, DecisionContext):
+            final_decision = result.final_decision or result.decision_agent_output
+        elif isinstance(result, dict):
+            final_decision = result.get("final_decision") or result.get("decision_agent_output")
+        else:
+            final_decision = None
+        
+        if final_decision is None:
+            logger.error("No final decision produced")
+            final_decision = {
+                "action": "hold",
+                "confidence": 0.0,
+                "reasoning": "No decision produced by workflow",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        
+        # Add metadata
+        final_decision["processing_time_ms"] = processing_time_ms
+        final_decision["symbol"] = symbol
+        
+        # Add supervisor plan info if hierarchical
+        if self.use_hierarchical and isinstance(result, DecisionContext):
+            # Serialized once here for the response, not on every node transition
+            plan = result.supervisor_plan
+            final_decision["supervisor_plan"] = plan.model_dump() if plan else None
+            # Include enriched rules in the response
+            if kwargs.get("rules"):
+                final_decision["enriched_rules"] = kwargs["rules"]
+        
+        logger.info(
+            "Decision completed for %s: %s "
+            "(%.2fms)",
+            symbol, final_decision.get('action', 'unknown'), processing_time_ms
+        )
+        
+        return final_decision
+    
+    @staticmethod
+    def _error_response(e: Exception) -> Dict[str, Any]:
+        """Safe hold decision returned when the workflow itself fails."""
+        logger.error("Error in decision workflow: %s", e, exc_info=True)
+        return {
+            "action": "hold",
+            "confidence": 0.0,
+            "reasoning": f"Error in decision workflow: {str(e)}",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "error": str(e),
+        }
+    
     def decide(
         self,
         symbol: str,
@@ -62,94 +179,18 @@ class DecisionEngine:
             Final trading decision
         """
         start_time = time.time()
-        logger.info(f"Starting decision workflow for {symbol}")
+        logger.info("Starting decision workflow for %s", symbol)
         
         try:
-            # For hierarchical graph, create simpler context
-            if self.use_hierarchical:
-                # Extract enriched rules from kwargs if provided
-                enriched_rules = kwargs.get("rules", [])
-                # Format rules as descriptive strings for supervisor
-                trading_rules = []
-                if enriched_rules:
-                    for rule in enriched_rules:
-                        # Create a human-readable rule description
-                        conditions_str = ", ".join([
-                            f"{c['field']} {c['operator']} {c['value']}" 
-                            for c in rule.get('conditions', [])
-                        ])
-                        rule_str = f"{rule.get('name', 'Unnamed Rule')}: {rule.get('action', 'UNKNOWN').upper()} when {conditions_str}"
-                        if rule.get('metadata', {}).get('description'):
-                            rule_str += f" - {rule['metadata']['description']}"
-                        trading_rules.append(rule_str)
-                
-                context = DecisionContext(
-                    symbol=symbol,
-                    prices=prices,
-                    volumes=volumes,
-                    request_id=user_request or f"Decision for {symbol}",
-                    user_request=user_request,
-                    trading_rules=trading_rules,
-                )
-            else:
-                # Build full context for legacy graphs
-                context = self.context_builder.build_context(
-                    symbol=symbol,
-                    prices=prices,
-                    volumes=volumes,
-                    **kwargs
-                )
-            
-            # Execute the graph
-            result = self.graph.invoke(context)
-            
-            # Calculate processing time
-            processing_time_ms = (time.time() - start_time) * 1000
-            
-            # Extract final decision
-            if isinstance(result, DecisionContext):
-                final_decision = result.final_decision or result.decision_agent_output
-            elif isinstance(result, dict):
-                final_decision = result.get("final_decision") or result.get("decision_agent_output")
-            else:
-                final_decision = None
+            context = self._build_context(symbol, prices, volumes, user_request, **kwargs)
             
-            if final_decision is None:
-                logger.error("No final decision produced")
-                final_decision = {
-                    "action": "hold",
-                    "confidence": 0.0,
-                    "reasoning": "No decision produced by workflow",
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+            # Execute the graph (state is a plain dict; see DecisionState)
+            result = DecisionContext.from_state(self.graph.invoke(context.to_state()))
             
-            # Add metadata
-            final_decision["processing_time_ms"] = processing_time_ms
-            final_decision["symbol"] = symbol
-            
-            # Add supervisor plan info if hierarchical
-            if self.use_hierarchical and isinstance(result, DecisionContext):
-                final_decision["supervisor_plan"] = result.supervisor_plan
-                # Include enriched rules in the response
-                if kwargs.get("rules"):
-                    final_decision["enriched_rules"] = kwargs["rules"]
-            
-            logger.info(
-                f"Decision completed for {symbol}: {final_decision.get('action', 'unknown')} "
-                f"({processing_time_ms:.2f}ms)"
-            )
-            
-            return final_decision
+            return self._finalize(result, symbol, start_time, **kwargs)
         
         except Exception as e:
-            logger.error(f"Error in decision workflow: {e}", exc_info=True)
-            return {
-                "action": "hold",
-                "confidence": 0.0,
-                "reasoning": f"Error in decision workflow: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat(),
-                "error": str(e),
-            }
+            return self._error_response(e)
     
     async def decide_async(
         self,
@@ -161,6 +202,9 @@ class DecisionEngine:
     ) -> Dict[str, Any]:
         """Async version of decide (for FastAPI integration).
         
+        Runs the graph with ainvoke so the parallel subgraphs overlap their
+        LLM calls on the event loop.
+        
         Args:
             symbol: Trading symbol
             prices: Historical price data
@@ -171,6 +215,123 @@ class DecisionEngine:
         Returns:
             Final trading decision
         """
-        # For now, just wrap the sync version
-        # In production, you'd use ainvoke() with async agents
-        return self.decide(symbol, prices, volumes, user_request, **kwargs)
+        start_time = time.time()
+        logger.info("Starting async decision workflow for %s", symbol)
+        
+        try:
+            context = self._build_context(symbol, prices, volumes, user_request, **kwargs)
+            
+            # Execute the graph (state is a plain dict; see DecisionState)
+            result = DecisionContext.from_state(await self.graph.ainvoke(context.to_state()))
+            
+            return self._finalize(result, symbol, start_time, **kwargs)
+        
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def decide_batch(self, requests: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+        """Run several decisions concurrently through one graph.abatch call.
+        
+        The runs overlap on the event loop, so their LLM calls are in
+        flight concurrently rather than one decision after another.
+        
+        Args:
+            requests: decide_async keyword arguments per decision (symbol,
+                prices, volumes, optional user_request, rules, ...)
+            
+        Returns:
+            Final decisions, in request order; a failed run yields the
+            safe hold response for that entry only
+        
+        Examples:
+            decisions = await engine.decide_batch([
+                {"symbol": "BTC/USD", "prices": btc_prices, "volumes": btc_volumes},
+                {"symbol": "ETH/USD", "prices": eth_prices, "volumes": eth_volumes},
+            ])
+        """
+        if not requests:
+            return []
+        
+        start_time = time.time()
+        logger.info("Starting batch decision workflow for %d requests", len(requests))
+        
+        try:
+            states = [self._build_context(**request).to_state() for request in requests]
+            results = await self.graph.abatch(
+                states,
+                config={"max_concurrency": len(states)},
+                return_exceptions=True,
+            )
+        except Exception as e:
+            return [self._error_response(e) for _ in requests]
+        
+        decisions = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                decisions.append(self._error_response(result))
+                continue
+            extra = {k: v for k, v in request.items() if k not in ("symbol", "prices", "volumes", "user_request")}
+            decisions.append(
+                self._finalize(DecisionContext.from_state(result), request["symbol"], start_time, **extra)
+            )
+        return decisions
+    
+    async def decide_stream(
+        self,
+        symbol: str,
+        prices: list[float],
+        volumes: list[float],
+        user_request: str = "",
+        **kwargs
+    ) -> AsyncIterator[tuple[str, Dict[str, Any]]]:
+        """Stream the supervisor plan, each graph stage's output, then the decision.
+        
+        The streamed plan lands in the supervisor's plan cache, so the graph
+        run that follows does not generate it a second time. The graph then
+        runs with astream, and every node's update is yielded as soon as the
+        node finishes (e.g. market analysis well before the final decision).
+        
+        Args:
+            symbol: Trading symbol
+            prices: Historical price data
+            volumes: Historical volume data
+            user_request: User's trading request
+            **kwargs: Additional parameters
+            
+        Yields:
+            ("plan", partial plan dict) events, ("stage", {"stage": node,
+            "output": update}) per graph node, then one ("decision", decision)
+        """
+        start_time = time.time()
+        
+        try:
+            context = self._build_context(symbol, prices, volumes, user_request, **kwargs)
+        except Exception as e:
+            yield "decision", self._error_response(e)
+            return
+        
+        try:
+            async for partial in astream_supervisor_plan(context):
+                yield "plan", partial
+        except Exception as e:
+            # The graph's supervisor node falls back to a default plan
+            logger.warning("Supervisor plan streaming failed for %s: %s", symbol, e)
+        
+        try:
+            state = context.to_state()
+            async for mode, chunk in self.graph.astream(state, stream_mode=["updates", "values"]):
+                if mode == "values":
+                    state = chunk
+                    continue
+                for node, update in chunk.items():
+                    # The final decision is sent once, with metadata, below
+                    if node == "final_decision" or not update:
+                        continue
+                    output = {k: v for k, v in update.items() if k in DecisionContext.model_fields}
+                    yield "stage", {"stage": node, "output": output}
+            
+            decision = self._finalize(DecisionContext.from_state(state), symbol, start_time, **kwargs)
+        except Exception as e:
+            decision = self._error_response(e)
+        
+        yield "decision", decision
@@ -9,9 +9,10 @@ Defines the multi-agent decision workflow using LangGraph.
 # This file is deprecated - imports commented out to prevent errors
 # Use hierarchical_graph.py instead
 
-from typing import Dict, Any
-from langgraph.graph import StateGraph, END
-from ..context.schema import DecisionContext
+from typing import TYPE_CHECKING
+# The stubs below only raise; langgraph is imported for annotations only
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 # from ..agents import (
 #     market_agent,
 #     ml_agent,
@@ -26,7 +27,7 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def create_decision_graph() -> StateGraph:
+def create_decision_graph() -> "StateGraph":
     """Create the LangGraph workflow for trading decisions.
     
     ⚠️  DEPRECATED: Use create_hierarchical_graph() from hierarchical_graph.py instead.
@@ -40,7 +41,7 @@ def create_decision_graph() -> StateGraph:
     )
 
 
-def create_simple_decision_graph() -> StateGraph:
+def create_simple_decision_graph() -> "StateGraph":
     """Create a simplified 2-agent workflow (for initial testing).
     
     ⚠️  DEPRECATED: Use create_hierarchical_graph() from hierarchical_graph.py instead.
@@ -1,7 +1,7 @@
 """Hierarchical LangGraph workflow with supervisor-subgraph architecture.
 
 Clean architecture:
-    Supervisor → Router → Subgraphs → Aggregator
+    [Supervisor ∥ Market/Sentiment workers] → [Market ∥ Sentiment] → Risk → Aggregator
     
 Each subgraph is self-contained with:
     - schema.py: Pydantic models
@@ -10,181 +10,206 @@ Each subgraph is self-contained with:
     - graph.py: Subgraph builder
 """
 
-from typing import Literal
+import asyncio
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 from pydantic import BaseModel, Field
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
-
-from ..context.schema import DecisionContext
-from ..agents.supervisor.agent import supervisor_agent
-from ..agents.market import create_market_subgraph, MarketSubgraphState
-# ML subgraph temporarily disabled - not yet implemented
-# from ..agents.ml import create_ml_subgraph, MLSubgraphState
-from ..agents.sentiment import create_sentiment_subgraph, SentimentSubgraphState
-from ..agents.risk import create_risk_subgraph, RiskSubgraphState
-from ..utils.llm_v2 import get_llm, LLMConfig
-from ..utils.logger import get_logger
-from ..utils.json_fixer import fix_json_string
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from ..context.schema import DecisionContext, DecisionState
+from ..agents.supervisor.agent import supervisor_agent, asupervisor_agent
+from ..agents.market import create_market_subgraph, MarketSubgraphStateInternal, MarketWorkerOutput
+from ..agents.market.worker import market_worker
+# ML subgraph is not wired into the graph yet (see create_hierarchical_graph);
+# imported for aml_subgraph_node
+from ..agents.ml import create_ml_subgraph, MLSubgraphStateInternal
+from ..agents.sentiment import create_sentiment_subgraph, SentimentSubgraphStateInternal
+from ..agents.risk import create_risk_subgraph, RiskSubgraphStateInternal
+from ..utils.llm_v2 import get_llm, cacheable_system_message, LLMConfig
+from ..utils.aio import run_sync
+from ..utils.logger import get_logger, debug_exc_info
+from ..utils.parser_cache import get_parser
 
 logger = get_logger(__name__)
 
 
-class ResilientPydanticParser(PydanticOutputParser):
-    """Pydantic parser that fixes common JSON issues before parsing."""
-    
-    def parse(self, text: str):
-        """Parse with JSON fixing."""
-        try:
-            return super().parse(text)
-        except OutputParserException as e:
-            try:
-                fixed_text = fix_json_string(text)
-                return super().parse(fixed_text)
-            except Exception:
-                raise e
-
-
 # ============================================================================
-# Router Decision Model
+# State Adapter (graph state is a plain DecisionState dict)
 # ============================================================================
 
-class RouterDecision(BaseModel):
-    """Decision made by the router for next subgraph to execute."""
+def _on_context(func: Callable) -> Callable:
+    """Adapt a node written against DecisionContext to run on DecisionState.
     
-    next_action: Literal[
-        "market_subgraph",
-        # "ml_subgraph",  # Disabled - not yet implemented
-        "sentiment_subgraph",
-        "risk_subgraph",
-        "final_decision",
-        "END"
-    ] = Field(description="Which subgraph or action to execute next")
+    The state dict is wrapped with DecisionContext.from_state (no
+    validation). The wrapper is annotated with DecisionState rather than
+    copying func's signature, so LangGraph does not coerce (and re-validate)
+    the state into DecisionContext itself.
+    """
+    if inspect.iscoroutinefunction(func):
+        async def node(state: DecisionState):
+            return await func(DecisionContext.from_state(state))
+    else:
+        def node(state: DecisionState):
+            return func(DecisionContext.from_state(state))
     
-    reasoning: str = Field(description="Why this action was chosen")
+    node.__name__ = func.__name__
+    node.__doc__ = func.__doc__
+    return node
+
+
+def _on_prefetched(func: Callable, subgraph: str) -> Callable:
+    """Like _on_context, also passing the worker output prefetched for subgraph."""
+    if inspect.iscoroutinefunction(func):
+        async def node(state: DecisionState):
+            prefetched = state.get("prefetched_outputs") or {}
+            return await func(DecisionContext.from_state(state), prefetched.get(subgraph))
+    else:
+        def node(state: DecisionState):
+            prefetched = state.get("prefetched_outputs") or {}
+            return func(DecisionContext.from_state(state), prefetched.get(subgraph))
+    
+    node.__name__ = func.__name__
+    node.__doc__ = func.__doc__
+    return node
+
+
+async def asupervisor_node(context: DecisionContext) -> dict:
+    """Run the supervisor and return only the fields it sets."""
+    context = await asupervisor_agent(context)
+    return {"supervisor_plan": context.supervisor_plan, "trading_rules": context.trading_rules}
+
+
+def supervisor_node(context: DecisionContext) -> dict:
+    """Sync entry point for asupervisor_node."""
+    context = supervisor_agent(context)
+    return {"supervisor_plan": context.supervisor_plan, "trading_rules": context.trading_rules}
 
 
 # ============================================================================
 # Subgraph Wrapper Nodes (Connect DecisionContext to subgraph states)
 # ============================================================================
 
-def market_subgraph_node(context: DecisionContext) -> DecisionContext:
+def _subgraph_output(result: dict, label: str) -> Optional[dict]:
+    """Flatten a subgraph result into the dict stored on DecisionContext."""
+    # model_dump (Python mode) builds the dicts directly in pydantic-core;
+    # a JSON round-trip would only add an encode and a decode.
+    # One output dict is built up in place (None if the subgraph produced nothing)
+    worker_output = result.get("worker_output")
+    if not worker_output:
+        output = {}
+    elif isinstance(worker_output, dict):
+        output = dict(worker_output)
+    else:
+        output = worker_output.model_dump()
+    
+    evaluation = result.get("evaluation")
+    if evaluation:
+        output["evaluation"] = evaluation if isinstance(evaluation, dict) else evaluation.model_dump()
+    
+    error = result.get("error")
+    if error:
+        logger.warning("%s subgraph error: %s", label, error)
+        output["error"] = error
+    
+    return output or None
+
+
+async def amarket_subgraph_node(
+    context: DecisionContext,
+    worker_output: Optional[MarketWorkerOutput] = None,
+) -> dict:
     """Execute market analysis subgraph.
     
-    Converts DecisionContext → MarketSubgraphState → run subgraph → update context
+    Converts DecisionContext → MarketSubgraphStateInternal → run subgraph → update context
+    
+    Returns a partial update so it can run in parallel with other subgraphs.
+    A prefetched worker_output is reused by the subgraph's first attempt.
     """
-    logger.info(f"Executing market subgraph for {context.symbol}")
+    logger.info("Executing market subgraph for %s", context.symbol)
     
     try:
-        # Create subgraph state
-        state = MarketSubgraphState(
+        # Series were validated into float64 arrays at the DecisionContext
+        # boundary, so the slotted internal state is built directly
+        state = MarketSubgraphStateInternal(
             symbol=context.symbol,
             prices=context.prices,
             volumes=context.volumes,
+            worker_output=worker_output,
         )
         
-        # Execute subgraph
+        # Execute subgraph (result is a dict from LangGraph)
         subgraph = create_market_subgraph()
-        result = subgraph.invoke(state)
-        
-        # Update main context with results (result is a dict from LangGraph)
-        if result.get("worker_output"):
-            context.market_agent_output = result["worker_output"] if isinstance(result["worker_output"], dict) else result["worker_output"].model_dump()
-        
-        if result.get("evaluation"):
-            context.market_agent_output = context.market_agent_output or {}
-            context.market_agent_output["evaluation"] = result["evaluation"] if isinstance(result["evaluation"], dict) else result["evaluation"].model_dump()
-        
-        if result.get("error"):
-            logger.warning(f"Market subgraph error: {result['error']}")
-            context.market_agent_output = context.market_agent_output or {}
-            context.market_agent_output["error"] = result["error"]
+        result = await subgraph.ainvoke(state)
+        output = _subgraph_output(result, "Market")
         
         logger.info("Market subgraph completed")
         
     except Exception as e:
-        logger.error(f"Market subgraph node error: {e}", exc_info=True)
-        context.market_agent_output = {"error": str(e)}
+        logger.error("Market subgraph node error: %s", e, exc_info=debug_exc_info(logger))
+        output = {"error": str(e)}
     
-    return context
+    return {"market_agent_output": output}
 
 
-def ml_subgraph_node(context: DecisionContext) -> DecisionContext:
+async def aml_subgraph_node(context: DecisionContext) -> dict:
     """Execute ML prediction subgraph."""
-    logger.info(f"Executing ML subgraph for {context.symbol}")
+    logger.info("Executing ML subgraph for %s", context.symbol)
     
     try:
-        state = MLSubgraphState(
+        state = MLSubgraphStateInternal(
             symbol=context.symbol,
             prices=context.prices,
             volumes=context.volumes,
         )
         
         subgraph = create_ml_subgraph()
-        result = subgraph.invoke(state)
-        
-        if result.get("worker_output"):
-            context.ml_agent_output = result["worker_output"] if isinstance(result["worker_output"], dict) else result["worker_output"].model_dump()
-        
-        if result.get("evaluation"):
-            context.ml_agent_output = context.ml_agent_output or {}
-            context.ml_agent_output["evaluation"] = result["evaluation"] if isinstance(result["evaluation"], dict) else result["evaluation"].model_dump()
-        
-        if result.get("error"):
-            logger.warning(f"ML subgraph error: {result['error']}")
-            context.ml_agent_output = context.ml_agent_output or {}
-            context.ml_agent_output["error"] = result["error"]
+        result = await subgraph.ainvoke(state)
+        output = _subgraph_output(result, "ML")
         
         logger.info("ML subgraph completed")
         
     except Exception as e:
-        logger.error(f"ML subgraph node error: {e}", exc_info=True)
-        context.ml_agent_output = {"error": str(e)}
+        logger.error("ML subgraph node error: %s", e, exc_info=debug_exc_info(logger))
+        output = {"error": str(e)}
     
-    return context
+    return {"ml_agent_output": output}
 
 
-def sentiment_subgraph_node(context: DecisionContext) -> DecisionContext:
+async def asentiment_subgraph_node(context: DecisionContext) -> dict:
     """Execute sentiment analysis subgraph."""
-    logger.info(f"Executing sentiment subgraph for {context.symbol}")
+    logger.info("Executing sentiment subgraph for %s", context.symbol)
     
     try:
-        state = SentimentSubgraphState(
-            symbol=context.symbol,
-        )
+        state = SentimentSubgraphStateInternal(symbol=context.symbol)
         
         subgraph = create_sentiment_subgraph()
-        result = subgraph.invoke(state)
-        
-        if result.get("worker_output"):
-            context.sentiment_agent_output = result["worker_output"] if isinstance(result["worker_output"], dict) else result["worker_output"].model_dump()
-        
-        if result.get("evaluation"):
-            context.sentiment_agent_output = context.sentiment_agent_output or {}
-            context.sentiment_agent_output["evaluation"] = result["evaluation"] if isinstance(result["evaluation"], dict) else result["evaluation"].model_dump()
-        
-        if result.get("error"):
-            logger.warning(f"Sentiment subgraph error: {result['error']}")
-            context.sentiment_agent_output = context.sentiment_agent_output or {}
-            context.sentiment_agent_output["error"] = result["error"]
+        result = await subgraph.ainvoke(state)
+        output = _subgraph_output(result, "Sentiment")
         
         logger.info("Sentiment subgraph completed")
         
     except Exception as e:
-        logger.error(f"Sentiment subgraph node error: {e}", exc_info=True)
-        context.sentiment_agent_output = {"error": str(e)}
+        logger.error("Sentiment subgraph node error: %s", e, exc_info=debug_exc_info(logger))
+        output = {"error": str(e)}
     
-    return context
+    return {"sentiment_agent_output": output}
 
 
-def risk_subgraph_node(context: DecisionContext) -> DecisionContext:
-    """Execute risk validation subgraph."""
-    logger.info(f"Executing risk subgraph for {context.symbol}")
+async def arisk_subgraph_node(context: DecisionContext) -> dict:
+    """Execute risk validation subgraph (skipped if the plan leaves it out)."""
+    if not _plan_requires(context, "risk"):
+        logger.info("Supervisor plan skips risk subgraph for %s", context.symbol)
+        return {}
+    
+    logger.info("Executing risk subgraph for %s", context.symbol)
     
     try:
-        # Determine current price from prices array
-        current_price = context.prices[-1] if context.prices else 100.0
+        # Current price was extracted once when the context was validated
+        current_price = context.current_price if context.current_price is not None else 100.0
         
         # Default action/quantity
         action = "buy"
@@ -195,143 +220,114 @@ def risk_subgraph_node(context: DecisionContext) -> DecisionContext:
             action = context.decision_agent_output.get("action", "buy")
             quantity = context.decision_agent_output.get("quantity", 1)
         
-        state = RiskSubgraphState(
+        state = RiskSubgraphStateInternal(
             symbol=context.symbol,
             current_price=current_price,
-            proposed_action=action,
-            proposed_quantity=quantity,
+            proposed_action=str(action),
+            proposed_quantity=int(quantity),
         )
         
         subgraph = create_risk_subgraph()
-        result = subgraph.invoke(state)
-        
-        if result.get("worker_output"):
-            context.risk_agent_output = result["worker_output"] if isinstance(result["worker_output"], dict) else result["worker_output"].model_dump()
-        
-        if result.get("evaluation"):
-            context.risk_agent_output = context.risk_agent_output or {}
-            context.risk_agent_output["evaluation"] = result["evaluation"] if isinstance(result["evaluation"], dict) else result["evaluation"].model_dump()
-        
-        if result.get("error"):
-            logger.warning(f"Risk subgraph error: {result['error']}")
-            context.risk_agent_output = context.risk_agent_output or {}
-            context.risk_agent_output["error"] = result["error"]
+        result = await subgraph.ainvoke(state)
+        output = _subgraph_output(result, "Risk")
         
         logger.info("Risk subgraph completed")
         
     except Exception as e:
-        logger.error(f"Risk subgraph node error: {e}", exc_info=True)
-        context.risk_agent_output = {"error": str(e)}
+        logger.error("Risk subgraph node error: %s", e, exc_info=debug_exc_info(logger))
+        output = {"error": str(e)}
     
-    return context
+    return {"risk_agent_output": output}
 
 
-# ============================================================================
-# Router Node (LLM-driven dynamic routing)
-# ============================================================================
+def market_subgraph_node(
+    context: DecisionContext,
+    worker_output: Optional[MarketWorkerOutput] = None,
+) -> dict:
+    """Sync entry point for amarket_subgraph_node."""
+    return run_sync(amarket_subgraph_node(context, worker_output))
 
-def route_next_subgraph(context: DecisionContext) -> str:
-    """Use LLM to decide which subgraph to execute next.
-    
-    This is the core of hierarchical routing - the LLM decides the execution path.
-    Uses LCEL: prompt | llm | parser
-    """
-    logger.info("Router deciding next action")
-    
-    try:
-        # Check what's been completed
-        completed = []
-        if context.market_agent_output:
-            completed.append("market")
-        if context.ml_agent_output:
-            completed.append("ml")
-        if context.sentiment_agent_output:
-            completed.append("sentiment")
-        if context.risk_agent_output:
-            completed.append("risk")
-        if context.final_decision:
-            return "END"
-        
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=RouterDecision)
-        
-        # Create prompt
-        system_message = """You are a workflow router for a trading decision system.
 
-Your job is to decide which subgraph should execute next based on:
-1. The supervisor's plan
-2. What's already been completed
-3. Logical dependencies between subgraphs
+def ml_subgraph_node(context: DecisionContext) -> dict:
+    """Sync entry point for aml_subgraph_node."""
+    return run_sync(aml_subgraph_node(context))
 
-Available subgraphs:
-- market_subgraph: Technical analysis (RSI, EMA, trend)
-- sentiment_subgraph: Sentiment analysis (social, news)
-- risk_subgraph: Risk validation (constraints, limits)
-- final_decision: Synthesize all data into trading decision
 
-Note: ML subgraph temporarily disabled (not yet implemented)
+def sentiment_subgraph_node(context: DecisionContext) -> dict:
+    """Sync entry point for asentiment_subgraph_node."""
+    return run_sync(asentiment_subgraph_node(context))
 
-Rules:
-1. Data gathering subgraphs (market, sentiment) can run in any order
-2. Risk subgraph should run after we have initial data
-3. final_decision should run ONLY after all needed subgraphs complete
-4. Skip subgraphs if supervisor plan doesn't require them
-5. END only after final_decision is set
 
-{format_instructions}"""
+def risk_subgraph_node(context: DecisionContext) -> dict:
+    """Sync entry point for arisk_subgraph_node."""
+    return run_sync(arisk_subgraph_node(context))
 
-        human_message = """Symbol: {symbol}
-User Request: {request_id}
 
-Supervisor Plan:
-{supervisor_plan}
+def _plan_requires(context: DecisionContext, subgraph: str) -> bool:
+    """Whether the supervisor plan asks for a subgraph (no plan: run everything)."""
+    plan = context.supervisor_plan
+    return plan is None or subgraph in plan.required_subgraphs
 
-Completed Subgraphs: {completed}
 
-What should execute next?"""
+async def _aprefetch_market(context: DecisionContext) -> Optional[MarketWorkerOutput]:
+    """Run the CPU-bound market worker (indicators) off the event loop.
+    
+    Only the market worker is prefetched: the sentiment worker makes
+    blocking HTTP requests, which must not run for plans that leave
+    sentiment out.
+    """
+    update = await asyncio.to_thread(
+        market_worker,
+        MarketSubgraphStateInternal(symbol=context.symbol, prices=context.prices, volumes=context.volumes),
+    )
+    return update.get("worker_output")
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
-        
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.ROUTER)  # Use configured router LLM
-        chain = prompt | llm | parser
-        
-        # Invoke
-        decision = chain.invoke({
-            "symbol": context.symbol,
-            "request_id": context.request_id,
-            "supervisor_plan": context.supervisor_plan or "No plan set",
-            "completed": completed if completed else "None",
-            "format_instructions": parser.get_format_instructions(),
-        })
-        
-        logger.info(f"Router decision: {decision.next_action} - {decision.reasoning}")
-        return decision.next_action
-        
+
+async def aplan_and_prefetch_node(context: DecisionContext) -> dict:
+    """Plan with the supervisor while the market worker is prefetched.
+    
+    The supervisor LLM call and the market indicators overlap; if the plan
+    requires the market subgraph, it starts from the prefetched output and
+    only runs its evaluator. A failed prefetch is left for the subgraph's
+    own worker to report.
+    
+    Returns:
+        Partial update with the plan, trading rules and prefetched_outputs
+    """
+    plan_task = asyncio.create_task(asupervisor_node(context))
+    try:
+        market_output = await _aprefetch_market(context)
     except Exception as e:
-        logger.error(f"Router error: {e}", exc_info=True)
-        # Fallback to simple logic
-        return fallback_router(context)
+        logger.debug("Market worker prefetch failed: %s", e)
+        market_output = None
+    except BaseException:
+        plan_task.cancel()
+        raise
+    
+    plan_update = await plan_task
+    return {**plan_update, "prefetched_outputs": {"market": market_output}}
+
+
+def plan_and_prefetch_node(context: DecisionContext) -> dict:
+    """Sync entry point for aplan_and_prefetch_node."""
+    return run_sync(aplan_and_prefetch_node(context))
+
 
+# Independent data subgraphs, fanned out in parallel after the supervisor
+_DATA_SUBGRAPHS = ("market", "sentiment")
 
-def fallback_router(context: DecisionContext) -> str:
-    """Fallback router if LLM fails - uses simple sequential logic."""
+
+def dispatch_data_subgraphs(state: DecisionState) -> list[Send] | str:
+    """Fan out to the data subgraphs the supervisor plan requires.
     
-    if not context.market_agent_output:
-        return "market_subgraph"
-    if not context.sentiment_agent_output:
-        return "sentiment_subgraph"
-    # ML subgraph disabled - not yet implemented
-    # if not context.ml_agent_output:
-    #     return "ml_subgraph"
-    if not context.risk_agent_output:
-        return "risk_subgraph"
-    if not context.final_decision:
-        return "final_decision"
-    return "END"
+    Each Send becomes its own task in the same superstep, so LangGraph runs
+    them in parallel; they write disjoint state keys, so no reducer is
+    needed. Their edges converge on risk_subgraph, which runs once after
+    all of them. With nothing to gather, go straight to risk.
+    """
+    context = DecisionContext.from_state(state)
+    sends = [Send(f"{name}_subgraph", state) for name in _DATA_SUBGRAPHS if _plan_requires(context, name)]
+    return sends or "risk_subgraph"
 
 
 # ============================================================================
@@ -353,19 +349,9 @@ class FinalTradingDecision(BaseModel):
     take_profit: float | None = Field(default=None, description="Recommended take profit")
 
 
-def final_decision_node(context: DecisionContext) -> DecisionContext:
-    """Synthesize all subgraph outputs into final trading decision.
-    
-    Uses LCEL: prompt | llm | parser
-    """
-    logger.info("Generating final trading decision")
-    
-    try:
-        # Create parser with JSON fixing
-        parser = ResilientPydanticParser(pydantic_object=FinalTradingDecision)
-        
-        # Create prompt
-        system_message = """You are a trading decision synthesizer.
+_FINAL_DECISION_PARSER, _FINAL_DECISION_FORMAT_INSTRUCTIONS = get_parser(FinalTradingDecision)
+
+FINAL_DECISION_SYSTEM_MESSAGE = """You are a trading decision synthesizer.
 
 Your job is to analyze ALL subgraph outputs and make a final trading decision.
 
@@ -382,7 +368,7 @@ Make a decision that:
 
 {format_instructions}"""
 
-        human_message = """Symbol: {symbol}
+FINAL_DECISION_HUMAN_MESSAGE = """Symbol: {symbol}
 Current Price: {price:.2f}
 
 Market Analysis:
@@ -399,127 +385,156 @@ Risk Validation:
 
 Make your final trading decision."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("human", human_message),
-        ])
-        
-        # Build LCEL chain
-        llm = get_llm(**LLMConfig.AGGREGATOR)  # Use configured aggregator LLM
-        chain = prompt | llm | parser
-        
-        # Invoke
-        current_price = context.prices[-1] if context.prices else 100.0
+# Built once at import. Format instructions are rendered into the system
+# block up front (no partial-variable merge per call), which also keeps it
+# byte-identical for the provider's prompt-prefix cache.
+_FINAL_DECISION_PROMPT = ChatPromptTemplate.from_messages([
+    cacheable_system_message(
+        FINAL_DECISION_SYSTEM_MESSAGE.replace("{format_instructions}", _FINAL_DECISION_FORMAT_INSTRUCTIONS),
+        LLMConfig.AGGREGATOR.get("provider"),
+    ),
+    ("human", FINAL_DECISION_HUMAN_MESSAGE),
+])
+
+
+@lru_cache(maxsize=1)
+def _get_final_decision_chain() -> Runnable:
+    """Build the final-decision LCEL chain once, on first use."""
+    return _FINAL_DECISION_PROMPT | get_llm(**LLMConfig.AGGREGATOR) | _FINAL_DECISION_PARSER
+
+
+async def afinal_decision_node(context: DecisionContext) -> dict:
+    """Synthesize all subgraph outputs into final trading decision.
+    
+    Uses LCEL: prompt | llm | parser
+    
+    Returns:
+        Partial state update with final_decision (and decision_agent_output)
+    """
+    logger.info("Generating final trading decision")
+    
+    try:
+        current_price = context.current_price if context.current_price is not None else 100.0
         
-        decision = chain.invoke({
+        # Invoke the shared final-decision chain
+        decision = await _get_final_decision_chain().ainvoke({
             "symbol": context.symbol,
             "price": current_price,
             "market": context.market_agent_output or "No data",
             "ml": context.ml_agent_output or "No data",
             "sentiment": context.sentiment_agent_output or "No data",
             "risk": context.risk_agent_output or "No data",
-            "format_instructions": parser.get_format_instructions(),
         })
         
-        # Update context
-        context.final_decision = decision.model_dump()
-        context.decision_agent_output = decision.model_dump()
+        logger.info("Final decision: %s with confidence %.2f", decision.action, decision.confidence)
         
-        logger.info(f"Final decision: {decision.action} with confidence {decision.confidence:.2f}")
+        # FinalTradingDecision is flat (scalars only, no aliases or computed
+        # fields), so its __dict__ equals model_dump() without the schema walk.
+        # The engine adds response metadata to final_decision, so
+        # decision_agent_output gets its own shallow copy
+        final_decision = dict(decision.__dict__)
+        return {
+            "final_decision": final_decision,
+            "decision_agent_output": dict(final_decision),
+        }
         
     except Exception as e:
-        logger.error(f"Final decision error: {e}", exc_info=True)
+        logger.error("Final decision error: %s", e, exc_info=debug_exc_info(logger))
         # Safe fallback
-        context.final_decision = {
-            "action": "hold",
-            "confidence": 0.0,
-            "quantity": 0,
-            "reasoning": f"Error in decision synthesis: {str(e)}",
-            "risk_approved": False,
+        return {
+            "final_decision": {
+                "action": "hold",
+                "confidence": 0.0,
+                "quantity": 0,
+                "reasoning": f"Error in decision synthesis: {str(e)}",
+                "risk_approved": False,
+            },
         }
-    
-    return context
+
+
+def final_decision_node(context: DecisionContext) -> dict:
+    """Sync entry point for afinal_decision_node."""
+    return run_sync(afinal_decision_node(context))
 
 
 # ============================================================================
 # Main Hierarchical Graph Builder
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def create_hierarchical_graph() -> StateGraph:
-    """Create the hierarchical graph with supervisor, router, and subgraphs.
+    """Create the hierarchical graph with supervisor and subgraphs.
+    
+    Compiled once and shared (like the agent subgraphs): the compiled graph
+    holds no per-run state, so every DecisionEngine reuses the same one.
     
     Architecture:
         START
           ↓
-        Supervisor (generates plan)
+        supervisor: generates plan ∥ prefetches the market worker
+          ↓ (Send fan-out to the subgraphs the plan requires)
+        market_subgraph ∥ sentiment_subgraph
+          ↓
+        risk_subgraph
           ↓
-        Router (decides next subgraph) ←──┐
-          ↓                                │
-        [Subgraphs]                        │
-          market_subgraph ─────────────────┤
-          ml_subgraph ─────────────────────┤
-          sentiment_subgraph ──────────────┤
-          risk_subgraph ───────────────────┤
-          final_decision                   │
-          ↓                                │
-        Router (check if done) ────────────┘
+        final_decision
           ↓
         END
     
+    The DAG is static: the supervisor plan decides which subgraphs do work
+    (nodes it does not require return no update), not an LLM call per hop.
+    
+    Supervisor and subgraph nodes are async, so graph.ainvoke overlaps their LLM calls;
+    graph.invoke still works through their sync wrappers.
+    
+    State is a DecisionState dict (see DecisionContext.to_state); nodes see
+    it as an unvalidated DecisionContext and return partial updates.
+    
     Returns:
         Compiled hierarchical graph
     """
     logger.info("Creating hierarchical graph")
     
-    # Create main graph with DecisionContext as state
-    graph = StateGraph(DecisionContext)
+    # Create main graph with DecisionState (TypedDict) as state
+    graph = StateGraph(DecisionState)
     
-    # Add supervisor node (generates plan)
-    graph.add_node("supervisor", supervisor_agent)
+    # Supervisor plan overlaps the market worker prefetch
+    graph.add_node(
+        "supervisor",
+        RunnableLambda(_on_context(plan_and_prefetch_node), afunc=_on_context(aplan_and_prefetch_node)),
+    )
     
-    # Add subgraph wrapper nodes
-    graph.add_node("market_subgraph", market_subgraph_node)
-    # ML subgraph disabled - not yet implemented
-    # graph.add_node("ml_subgraph", ml_subgraph_node)
-    graph.add_node("sentiment_subgraph", sentiment_subgraph_node)
-    graph.add_node("risk_subgraph", risk_subgraph_node)
+    # Data subgraphs run as parallel Send tasks (ML subgraph disabled - not yet implemented)
+    graph.add_node(
+        "market_subgraph",
+        RunnableLambda(
+            _on_prefetched(market_subgraph_node, "market"),
+            afunc=_on_prefetched(amarket_subgraph_node, "market"),
+        ),
+    )
+    graph.add_node(
+        "sentiment_subgraph",
+        RunnableLambda(_on_context(sentiment_subgraph_node), afunc=_on_context(asentiment_subgraph_node)),
+    )
+    graph.add_node("risk_subgraph", RunnableLambda(_on_context(risk_subgraph_node), afunc=_on_context(arisk_subgraph_node)))
     
     # Add final decision node
-    graph.add_node("final_decision", final_decision_node)
+    graph.add_node("final_decision", RunnableLambda(_on_context(final_decision_node), afunc=_on_context(afinal_decision_node)))
     
     # Start with supervisor
     graph.set_entry_point("supervisor")
     
-    # After supervisor, router decides next action
+    # Fan out to the planned data subgraphs; they converge on risk validation
     graph.add_conditional_edges(
         "supervisor",
-        route_next_subgraph,
-        {
-            "market_subgraph": "market_subgraph",
-            # "ml_subgraph": "ml_subgraph",  # Disabled
-            "sentiment_subgraph": "sentiment_subgraph",
-            "risk_subgraph": "risk_subgraph",
-            "final_decision": "final_decision",
-            "END": END,
-        }
+        dispatch_data_subgraphs,
+        ["market_subgraph", "sentiment_subgraph", "risk_subgraph"],
     )
+    graph.add_edge("market_subgraph", "risk_subgraph")
+    graph.add_edge("sentiment_subgraph", "risk_subgraph")
     
-    # After each subgraph, router decides what's next
-    for subgraph_name in ["market_subgraph", "sentiment_subgraph", "risk_subgraph"]:  # Removed ml_subgraph
-        graph.add_conditional_edges(
-            subgraph_name,
-            route_next_subgraph,
-            {
-                "market_subgraph": "market_subgraph",
-                # "ml_subgraph": "ml_subgraph",  # Disabled
-                "sentiment_subgraph": "sentiment_subgraph",
-                "risk_subgraph": "risk_subgraph",
-                "final_decision": "final_decision",
-                "END": END,
-            }
-        )
-    
-    # After final decision, always end
+    # Fixed order: risk validation, then the final decision
+    graph.add_edge("risk_subgraph", "final_decision")
     graph.add_edge("final_decision", END)
     
     # Compile
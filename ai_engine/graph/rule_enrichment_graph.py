@@ -7,105 +7,156 @@ Flow:
 1. Parse Intent - Understand what the user wants
 2. Identify Missing Info - Check what details are needed (thresholds, timeframes, etc.)
 3. Generate Questions - Ask clarifying questions
+   (steps 1-3 run as one fused LLM call by default, see analyze_query_node)
 4. Collect Answers - Get user input (terminal prompts)
 5. Validate Rule - Ensure rule is complete and valid
 6. Human Verification - Show final rule, ask user to confirm/edit
 7. Output Structured Rule - Ready for execution
 """
 
-from typing import Annotated, Literal, Optional
-from pydantic import BaseModel, Field
+import asyncio
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 from langgraph.graph import StateGraph, END
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
 import os
 from dotenv import load_dotenv
+from jsonschema import Draft7Validator
 
 # Import get_llm - handle both module and direct execution
 try:
-    from ai_engine.utils.llm_v2 import get_llm
+    from ai_engine.utils.llm_v2 import cacheable_system_message, get_llm
+    from ai_engine.utils.response_cache import get_response_cache
+    from ai_engine.utils.parser_cache import get_parser
+    from ai_engine.utils.aio import run_sync
+    from ai_engine.utils.logger import get_logger
+    from ai_engine.utils.streaming_eval import settled_fields
+    from ai_engine.utils.json_guard import get_rule_schema
 except ImportError:
-    from ..utils.llm_v2 import get_llm
+    from ..utils.llm_v2 import cacheable_system_message, get_llm
+    from ..utils.response_cache import get_response_cache
+    from ..utils.parser_cache import get_parser
+    from ..utils.aio import run_sync
+    from ..utils.logger import get_logger
+    from ..utils.streaming_eval import settled_fields
+    from ..utils.json_guard import get_rule_schema
 
 # Load environment variables - override any shell variables with .env values
 load_dotenv(override=True)
 
+logger = get_logger(__name__)
+
+# Fused single-call query analysis; set to "0" for the staged three-call flow
+FUSED_ANALYSIS = os.getenv("RULE_ENRICHMENT_FUSED_ANALYSIS", "1") != "0"
+
 
 # ============================================================================
 # STATE SCHEMA
 # ============================================================================
 
-class RuleEnrichmentState(BaseModel):
-    """State for rule enrichment graph."""
+@dataclass(slots=True)
+class RuleEnrichmentState:
+    """State for rule enrichment graph.
     
-    # Input
-    user_query: str = Field(description="Raw user query (e.g., 'buy when RSI is low')")
+    A plain slotted dataclass: LangGraph rebuilds the state for every node,
+    and the dict payloads are already validated by the response schemas
+    when a node produces them, so per-hop pydantic validation is skipped.
+    """
     
-    # Intent parsing
-    parsed_intent: Optional[dict] = Field(
-        default=None,
-        description="Parsed intent: action, indicators, conditions"
-    )
+    # Input: raw user query (e.g., 'buy when RSI is low')
+    user_query: str
     
-    # Missing information
-    missing_info: list[str] = Field(
-        default_factory=list,
-        description="List of missing details (thresholds, timeframes, etc.)"
-    )
+    # Intent parsing: action, indicators, conditions
+    parsed_intent: Optional[dict] = None
     
-    # Questions and answers
-    clarifying_questions: list[str] = Field(
-        default_factory=list,
-        description="Questions to ask the user"
-    )
-    user_answers: dict[str, str] = Field(
-        default_factory=dict,
-        description="User's answers to questions"
-    )
+    # Missing details (thresholds, timeframes, etc.)
+    missing_info: list[str] = field(default_factory=list)
     
-    # Structured rule
-    structured_rule: Optional[dict] = Field(
-        default=None,
-        description="Final structured trading rule"
-    )
+    # Questions to ask the user and the user's answers
+    clarifying_questions: list[str] = field(default_factory=list)
+    user_answers: dict[str, str] = field(default_factory=dict)
+    
+    # Final structured trading rule
+    structured_rule: Optional[dict] = None
     
     # Validation
-    is_valid: bool = Field(default=False, description="Whether rule is valid")
-    validation_errors: list[str] = Field(
-        default_factory=list,
-        description="Validation errors if any"
-    )
+    is_valid: bool = False
+    validation_errors: list[str] = field(default_factory=list)
     
-    # Human verification
-    user_confirmed: bool = Field(default=False, description="User confirmed the rule")
-    user_modifications: Optional[str] = Field(
-        default=None,
-        description="User's modifications to the rule"
-    )
+    # Human verification: confirmation and requested modifications
+    user_confirmed: bool = False
+    user_modifications: Optional[str] = None
     
     # Metadata
-    completed: bool = Field(default=False, description="Workflow completed")
-    error: Optional[str] = Field(default=None, description="Error message if any")
-    
-    model_config = {"arbitrary_types_allowed": True}
+    fast_path: bool = False  # Parsed by regex; LLM analysis skipped
+    completed: bool = False
+    error: Optional[str] = None
 
 
 # ============================================================================
-# NODE FUNCTIONS
+# RESPONSE SCHEMAS (LLM replies are validated straight from JSON text)
 # ============================================================================
 
-def parse_intent_node(state: RuleEnrichmentState) -> dict:
-    """Parse user's intent from natural language query.
+class ParsedIntent(BaseModel):
+    """Structured components of a trading query."""
     
-    Extracts:
-    - Action: buy/sell/hold
-    - Indicators: RSI, EMA, volume, etc.
-    - Conditions: thresholds, comparisons
-    - Logic: AND/OR
-    """
-    llm = get_llm(temperature=0.0)
+    action: str = Field(default="hold", description="buy, sell, or hold")
+    indicators: list[str] = Field(default_factory=list)
+    conditions: list[str] = Field(default_factory=list)
+    thresholds: dict[str, Any] = Field(default_factory=dict)
+    timeframe: Optional[str] = None
+    logic: str = Field(default="AND", description="AND or OR")
     
-    prompt = f"""Parse this trading query into structured components:
+    # Keep any extra details the model extracted
+    model_config = ConfigDict(extra="allow")
+
+
+class ParsedIntentBatch(RootModel[list[ParsedIntent]]):
+    """Parsed intents for a numbered list of queries, in order."""
+
+
+class MissingInfo(RootModel[list[str]]):
+    """Missing details needed for an executable rule."""
+
 
-User Query: "{state.user_query}"
+class ClarifyingQuestions(RootModel[list[str]]):
+    """Questions that fill in the missing details."""
+
+
+class QueryAnalysis(BaseModel):
+    """Fused reply of analyze_query_node."""
+    
+    parsed_intent: Optional[ParsedIntent] = None
+    missing_info: list[str] = Field(default_factory=list)
+    clarifying_questions: list[str] = Field(default_factory=list)
+
+
+class RuleDraft(RootModel[dict[str, Any]]):
+    """Structured rule as drafted by the LLM (checked in validate_and_build_rule_node)."""
+
+
+_PARSED_INTENT_PARSER, _ = get_parser(ParsedIntent)
+_PARSED_INTENT_BATCH_PARSER, _ = get_parser(ParsedIntentBatch)
+_MISSING_INFO_PARSER, _ = get_parser(MissingInfo)
+_QUESTIONS_PARSER, _ = get_parser(ClarifyingQuestions)
+_QUERY_ANALYSIS_PARSER, _ = get_parser(QueryAnalysis)
+_RULE_DRAFT_PARSER, _ = get_parser(RuleDraft)
+
+# Checked once here; validating a rule is then a single pass over it
+Draft7Validator.check_schema(get_rule_schema())
+_RULE_VALIDATOR = Draft7Validator(get_rule_schema())
+
+
+# ============================================================================
+# PROMPTS (static instructions first so providers can serve them from cache)
+# ============================================================================
+
+PARSE_INTENT_SYSTEM = """You parse trading queries into structured components.
 
 Extract:
 1. **Action**: buy, sell, or hold
@@ -116,33 +167,315 @@ Extract:
 6. **Logic**: AND or OR (if multiple conditions)
 
 Return a JSON object with these fields:
-{{
+{
   "action": "buy" | "sell" | "hold",
   "indicators": ["indicator1", "indicator2", ...],
   "conditions": ["condition1", "condition2", ...],
-  "thresholds": {{"indicator": value, ...}},
+  "thresholds": {"indicator": value, ...},
   "timeframe": "description" | null,
   "logic": "AND" | "OR"
-}}
+}
 
 Be precise and extract all mentioned details."""
 
-    response = llm.invoke(prompt)
+PARSE_INTENTS_SYSTEM = PARSE_INTENT_SYSTEM + """
+
+You will receive a numbered list of independent queries. Parse each one on
+its own and return a JSON array with exactly one such object per query, in
+the same order as the list."""
+
+IDENTIFY_MISSING_SYSTEM = """You analyze parsed trading intents and identify missing information.
+
+Check what's missing to create a complete, executable trading rule:
+1. **Threshold Values**: Are numeric thresholds specified? (e.g., "RSI < 30" vs vague "low RSI")
+2. **Timeframe**: Is the timeframe clear? (e.g., "hold for 3 days" vs vague "hold")
+3. **Position Size**: Is quantity or position size specified?
+4. **Risk Parameters**: Stop loss, take profit, max risk percentage?
+5. **Condition Specificity**: Are conditions clear enough? (e.g., "EMA crossed" - which EMAs?)
+
+Return a JSON array of missing information items:
+[
+  "specific detail needed",
+  "another detail needed",
+  ...
+]
+
+If everything is complete, return an empty array: []
+
+Be thorough - we need ALL details to execute the rule safely."""
+
+GENERATE_QUESTIONS_SYSTEM = """You generate clear, specific questions to fill in missing information in a trading rule.
+
+For each missing piece of information, create ONE specific question that will help the user provide the needed detail.
+
+Guidelines:
+- Be specific and actionable
+- Provide examples or ranges when helpful
+- Ask one thing at a time
+- Use natural language, not technical jargon
+- Include context about why it's needed
+
+Return a JSON array of questions:
+[
+  "Question 1?",
+  "Question 2?",
+  ...
+]
+
+Example:
+If missing "RSI threshold", ask: "What RSI value should trigger the buy? (Typically oversold is below 30)"
+If missing "position size", ask: "How much would you like to invest? (e.g., $1000 or 1 ETH)"
+"""
+
+ANALYZE_QUERY_SYSTEM = """You analyze trading queries in three steps and return all results together.
+
+STEP 1 - Parse the intent into structured components:
+1. **Action**: buy, sell, or hold
+2. **Indicators**: What market indicators are mentioned? (RSI, EMA, volume, price, trend, etc.)
+3. **Conditions**: What are the conditions? (e.g., "RSI < 30", "EMA crossed", "volume high")
+4. **Thresholds**: Are there specific numbers mentioned?
+5. **Timeframe**: Is there a timeframe mentioned? (e.g., "for 3 days", "until price reaches X")
+6. **Logic**: AND or OR (if multiple conditions)
+
+STEP 2 - Identify what's missing to create a complete, executable trading rule:
+1. **Threshold Values**: Are numeric thresholds specified? (e.g., "RSI < 30" vs vague "low RSI")
+2. **Timeframe**: Is the timeframe clear? (e.g., "hold for 3 days" vs vague "hold")
+3. **Position Size**: Is quantity or position size specified?
+4. **Risk Parameters**: Stop loss, take profit, max risk percentage?
+5. **Condition Specificity**: Are conditions clear enough? (e.g., "EMA crossed" - which EMAs?)
+Be thorough - we need ALL details to execute the rule safely.
+
+STEP 3 - For each missing piece of information, write ONE specific question:
+- Be specific and actionable
+- Provide examples or ranges when helpful
+- Ask one thing at a time
+- Use natural language, not technical jargon
+- Include context about why it's needed
+Example: if missing "RSI threshold", ask: "What RSI value should trigger the buy? (Typically oversold is below 30)"
+
+Return a single JSON object:
+{
+  "parsed_intent": {
+    "action": "buy" | "sell" | "hold",
+    "indicators": ["indicator1", "indicator2", ...],
+    "conditions": ["condition1", "condition2", ...],
+    "thresholds": {"indicator": value, ...},
+    "timeframe": "description" | null,
+    "logic": "AND" | "OR"
+  },
+  "missing_info": ["specific detail needed", ...],
+  "clarifying_questions": ["Question 1?", ...]
+}
+
+If everything is complete, return empty arrays for missing_info and clarifying_questions."""
+
+BUILD_RULE_SYSTEM = """You build structured trading rules from parsed intents and user answers.
+
+Create a complete, executable trading rule with this EXACT format:
+{
+  "name": "Descriptive rule name",
+  "conditions": [
+    {
+      "field": "market.rsi",  // Available: market.rsi, market.ema_short, market.ema_long, market.volume_ratio, market.trend_direction, sentiment.sentiment_signal, etc.
+      "operator": "lt",  // Available: gt, lt, gte, lte, eq, ne
+      "value": 30  // Numeric or string value
+    }
+  ],
+  "action": "buy",  // Must be: buy, sell, or hold
+  "logic": "AND",  // Must be: AND or OR (if multiple conditions)
+  "confidence": 0.8,  // Your confidence in this rule (0.0-1.0)
+  "metadata": {
+    "position_size": "value from user or default",
+    "stop_loss": "value from user or null",
+    "take_profit": "value from user or null",
+    "max_risk_percent": "value from user or 2",
+    "timeframe": "value from user or null",
+    "description": "Natural language description of the rule"
+  }
+}
+
+CRITICAL REQUIREMENTS:
+1. Map user's indicators to correct field paths (e.g., "RSI" → "market.rsi")
+2. Use correct operators (gt=greater than, lt=less than, etc.)
+3. Convert user's natural language thresholds to numeric values
+4. Include ALL information from user answers in metadata
+5. Set a reasonable confidence based on rule specificity
+6. Action MUST be exactly "buy", "sell", or "hold"
+
+Available field paths:
+- market.rsi (0-100)
+- market.rsi_signal (oversold/neutral/overbought)
+- market.ema_short, market.ema_long (numeric)
+- market.ema_signal (bullish/bearish/neutral)
+- market.volume_ratio (numeric, >1 is high volume)
+- market.volume_signal (high/normal/low)
+- market.trend_direction (bullish/bearish/sideways)
+- market.trend_strength (0-1)
+- sentiment.sentiment_signal (positive/negative/neutral)
+- sentiment.average_sentiment (-1 to 1)
+
+Return ONLY the JSON object, no explanation."""
+
+
+def _prompt_messages(system: str, request: str) -> list[BaseMessage]:
+    """Static instructions as a cacheable system message, request data last.
     
-    # Parse JSON from response
-    import json
+    Only the trailing human message varies between calls, so the system
+    prefix stays byte-identical and eligible for provider prompt caching.
+    """
+    return [cacheable_system_message(system), HumanMessage(content=request)]
+
+
+def _intent_request(user_query: str) -> str:
+    """Request text of a single-query parse_intent prompt."""
+    return f'User Query: "{user_query}"'
+
+
+# ============================================================================
+# FAST PATH (fully specified queries are parsed without an LLM)
+# ============================================================================
+
+_ACTION_RE = re.compile(r"\b(buy|sell|hold)\b", re.I)
+_RSI_RE = re.compile(r"\bRSI\s*(?:is\s*)?(<=|>=|==|<|>|=|below|under|above|over)\s*(\d+(?:\.\d+)?)", re.I)
+_EMA_CROSS_RE = re.compile(
+    r"\bEMA\s*(\d+)\s*cross(?:es|ed)?\s*(above|over|below|under)?\s*(?:the\s*)?EMA\s*(\d+)", re.I
+)
+_SIZE_RE = re.compile(r"\$\s*(\d+(?:\.\d+)?)|\b(\d+(?:\.\d+)?)\s*(USDC?|USD|ETH|BTC|dollars?)\b", re.I)
+_STOP_LOSS_RE = re.compile(r"stop[\s-]*loss\s*(?:of|at)?\s*(\d+(?:\.\d+)?)\s*%", re.I)
+_TAKE_PROFIT_RE = re.compile(r"take[\s-]*profit\s*(?:of|at)?\s*(\d+(?:\.\d+)?)\s*%", re.I)
+_OR_RE = re.compile(r"\bor\b", re.I)
+
+_OPERATORS = {
+    "<": "lt", "below": "lt", "under": "lt",
+    "<=": "lte",
+    ">": "gt", "above": "gt", "over": "gt",
+    ">=": "gte",
+    "=": "eq", "==": "eq",
+}
+_OPERATOR_SYMBOLS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">=", "eq": "=="}
+
+
+def _number(text: str) -> float | int:
+    """Parse a matched number, keeping integers integral."""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def fast_parse_intent(user_query: str) -> Optional[dict]:
+    """Parse a fully specified query with regexes, or return None.
+    
+    Matches when the query names exactly one action and at least one
+    indicator with an explicit threshold (e.g. "buy ETH when RSI < 30 with
+    $1000, stop loss 5%"). Vague queries ("when RSI is low") return None
+    and go to the LLM.
+    
+    Returns:
+        parsed_intent dict (ParsedIntent fields plus rule_conditions and any
+        position_size / stop_loss / take_profit found), or None
+    """
+    actions = {action.lower() for action in _ACTION_RE.findall(user_query)}
+    if len(actions) != 1:
+        return None
+    action = actions.pop()
+    
+    indicators, conditions, thresholds, rule_conditions = [], [], {}, []
+    for comparator, value in _RSI_RE.findall(user_query):
+        operator = _OPERATORS[comparator.lower()]
+        value = _number(value)
+        indicators.append("RSI")
+        conditions.append(f"RSI {_OPERATOR_SYMBOLS[operator]} {value}")
+        thresholds["rsi"] = value
+        rule_conditions.append({"field": "market.rsi", "operator": operator, "value": value})
+    
+    for fast, direction, slow in _EMA_CROSS_RE.findall(user_query):
+        bearish = direction.lower() in ("below", "under") or (not direction and action == "sell")
+        indicators.append("EMA")
+        conditions.append(f"EMA {fast} crosses {'below' if bearish else 'above'} EMA {slow}")
+        rule_conditions.append(
+            {"field": "market.ema_signal", "operator": "eq", "value": "bearish" if bearish else "bullish"}
+        )
+    
+    if not rule_conditions:
+        return None
+    
+    parsed_intent = {
+        "action": action,
+        "indicators": list(dict.fromkeys(indicators)),
+        "conditions": conditions,
+        "thresholds": thresholds,
+        "timeframe": None,
+        "logic": "OR" if _OR_RE.search(user_query) else "AND",
+        "rule_conditions": rule_conditions,
+    }
+    
+    size = _SIZE_RE.search(user_query)
+    if size:
+        parsed_intent["position_size"] = f"${size.group(1)}" if size.group(1) else f"{size.group(2)} {size.group(3)}"
+    for key, pattern in (("stop_loss", _STOP_LOSS_RE), ("take_profit", _TAKE_PROFIT_RE)):
+        match = pattern.search(user_query)
+        if match:
+            parsed_intent[key] = f"{match.group(1)}%"
+    
+    return parsed_intent
+
+
+def _template_rule(user_query: str, parsed_intent: dict) -> dict:
+    """Fill the structured rule format from a fast-path parsed intent."""
+    joiner = f" {parsed_intent['logic'].lower()} "
+    return {
+        "name": f"{parsed_intent['action'].capitalize()} when {joiner.join(parsed_intent['conditions'])}",
+        "conditions": parsed_intent["rule_conditions"],
+        "action": parsed_intent["action"],
+        "logic": parsed_intent["logic"],
+        "confidence": 0.8,
+        "metadata": {
+            "position_size": parsed_intent.get("position_size", "default"),
+            "stop_loss": parsed_intent.get("stop_loss"),
+            "take_profit": parsed_intent.get("take_profit"),
+            "max_risk_percent": 2,
+            "timeframe": parsed_intent.get("timeframe"),
+            "description": user_query,
+        },
+    }
+
+
+# ============================================================================
+# NODE FUNCTIONS
+# ============================================================================
+
+def parse_intent_node(state: RuleEnrichmentState) -> dict:
+    """Parse user's intent from natural language query.
+    
+    Extracts:
+    - Action: buy/sell/hold
+    - Indicators: RSI, EMA, volume, etc.
+    - Conditions: thresholds, comparisons
+    - Logic: AND/OR
+    
+    Fully specified queries skip the LLM (see fast_parse_intent). This sync
+    path sends one query per call; aparse_intent_node batches concurrent ones.
+    """
+    parsed_intent = fast_parse_intent(state.user_query)
+    if parsed_intent is not None:
+        return {"parsed_intent": parsed_intent, "missing_info": [], "clarifying_questions": [], "fast_path": True}
+    
+    llm = get_llm(temperature=0.0)
+    
+    response = get_response_cache().invoke(
+        "parse_intent", llm, _prompt_messages(PARSE_INTENT_SYSTEM, _intent_request(state.user_query))
+    )
+    
+    return _parsed_intent_update(response.content)
+
+
+def _parsed_intent_update(content: Any) -> dict:
+    """State update for a parse_intent reply."""
     try:
-        # Extract JSON from markdown code block if present
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        parsed_intent = json.loads(content)
+        # One pass: fences/think blocks stripped, JSON validated by pydantic-core
+        parsed_intent = _PARSED_INTENT_PARSER.parse(content)
         
         return {
-            "parsed_intent": parsed_intent
+            "parsed_intent": parsed_intent.model_dump()
         }
     except Exception as e:
         return {
@@ -151,7 +484,119 @@ Be precise and extract all mentioned details."""
         }
 
 
-def identify_missing_info_node(state: RuleEnrichmentState) -> dict:
+class _BatchedIntentParser:
+    """Coalesce concurrent parse_intent calls into one numbered-list prompt.
+    
+    Calls are queued per event loop for up to `max_wait_ms` (or until
+    `max_batch` are pending). A batch of several queries is sent as one
+    request ("1) ... 2) ...") answered with a JSON array, so the prompt
+    prefill and round-trip are paid once. Each intent is stored in the
+    response cache under its single-query key. Single queries, and batches
+    whose reply cannot be matched back to the queries, use the per-query
+    prompt instead.
+    """
+    
+    def __init__(self, max_batch: int = 25, max_wait_ms: float = 50.0):
+        """Initialize the batcher.
+        
+        Args:
+            max_batch: Flush as soon as this many calls are pending (caps prompt size)
+            max_wait_ms: Max time the first queued call waits for company
+        """
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._pending: dict[asyncio.AbstractEventLoop, list] = {}
+        self._timers: dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+    
+    async def aparse(self, user_query: str) -> Any:
+        """Return the parse_intent reply text for one query."""
+        cache = get_response_cache()
+        messages = _prompt_messages(PARSE_INTENT_SYSTEM, _intent_request(user_query))
+        key = cache.make_key("parse_intent", get_llm(temperature=0.0), messages)
+        content = cache.get(key)
+        if content is not None:
+            return content
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        pending = self._pending.setdefault(loop, [])
+        pending.append((user_query, messages, key, future))
+        
+        if len(pending) >= self.max_batch:
+            self._flush(loop)
+        elif loop not in self._timers:
+            self._timers[loop] = loop.call_later(self.max_wait_ms / 1000, self._flush, loop)
+        
+        return await future
+    
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        
+        batch = self._pending.pop(loop, [])
+        if batch:
+            loop.create_task(self._run_batch(batch))
+    
+    async def _run_batch(self, batch: list) -> None:
+        llm = get_llm(temperature=0.0)
+        contents = None
+        
+        if len(batch) > 1:
+            try:
+                contents = await self._ainvoke_rows(llm, [item[0] for item in batch])
+            except Exception as e:
+                logger.warning("Batched parse_intent failed, parsing %d queries one by one: %s", len(batch), e)
+        
+        if contents is None:
+            responses = await asyncio.gather(*(llm.ainvoke(item[1]) for item in batch), return_exceptions=True)
+            contents = [r if isinstance(r, BaseException) else r.content for r in responses]
+        
+        cache = get_response_cache()
+        for (_, _, key, future), content in zip(batch, contents):
+            if future.done():
+                continue
+            if isinstance(content, BaseException):
+                future.set_exception(content)
+                continue
+            if isinstance(content, str):
+                cache.set(key, content)
+            future.set_result(content)
+    
+    @staticmethod
+    async def _ainvoke_rows(llm: Any, user_queries: list[str]) -> list[str]:
+        """One LLM call for all queries; returns each intent as JSON text."""
+        numbered = "\n".join(f'{i}) "{query}"' for i, query in enumerate(user_queries, 1))
+        response = await llm.ainvoke(_prompt_messages(PARSE_INTENTS_SYSTEM, f"User Queries:\n{numbered}"))
+        
+        intents = _PARSED_INTENT_BATCH_PARSER.parse(response.content).root
+        if len(intents) != len(user_queries):
+            raise ValueError(f"expected {len(user_queries)} parsed intents, got {len(intents)}")
+        return [intent.model_dump_json() for intent in intents]
+
+
+_INTENT_BATCHER = _BatchedIntentParser()
+
+
+async def aparse_intent_node(state: RuleEnrichmentState) -> dict:
+    """Async parse_intent_node; concurrent calls share one batched LLM request."""
+    parsed_intent = fast_parse_intent(state.user_query)
+    if parsed_intent is not None:
+        return {"parsed_intent": parsed_intent, "missing_info": [], "clarifying_questions": [], "fast_path": True}
+    
+    try:
+        content = await _INTENT_BATCHER.aparse(state.user_query)
+    except Exception as e:
+        return {
+            "error": f"Failed to parse intent: {str(e)}",
+            "parsed_intent": None
+        }
+    
+    return _parsed_intent_update(content)
+
+
+async def aidentify_missing_info_node(state: RuleEnrichmentState) -> dict:
     """Identify what information is missing to create a complete rule.
     
     Checks:
@@ -163,114 +608,183 @@ def identify_missing_info_node(state: RuleEnrichmentState) -> dict:
     """
     llm = get_llm(temperature=0.0)
     
-    prompt = f"""Analyze this parsed trading intent and identify missing information:
+    response = await get_response_cache().ainvoke("identify_missing", llm, _prompt_messages(
+        IDENTIFY_MISSING_SYSTEM,
+        f'User Query: "{state.user_query}"\n\nParsed Intent:\n{state.parsed_intent}',
+    ))
+    
+    try:
+        return {
+            "missing_info": _MISSING_INFO_PARSER.parse(response.content).root
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to identify missing info: {str(e)}",
+            "missing_info": []
+        }
 
-User Query: "{state.user_query}"
 
-Parsed Intent:
-{state.parsed_intent}
+# Stand-in for missing_info while it is still being identified
+_UNKNOWN_MISSING_INFO = (
+    "not yet identified - cover every detail the query leaves unspecified "
+    "(thresholds, timeframe, position size, risk parameters, condition specifics)"
+)
 
-Check what's missing to create a complete, executable trading rule:
-1. **Threshold Values**: Are numeric thresholds specified? (e.g., "RSI < 30" vs vague "low RSI")
-2. **Timeframe**: Is the timeframe clear? (e.g., "hold for 3 days" vs vague "hold")
-3. **Position Size**: Is quantity or position size specified?
-4. **Risk Parameters**: Stop loss, take profit, max risk percentage?
-5. **Condition Specificity**: Are conditions clear enough? (e.g., "EMA crossed" - which EMAs?)
 
-Return a JSON array of missing information items:
-[
-  "specific detail needed",
-  "another detail needed",
-  ...
-]
+# Handcrafted questions for the common missing_info items (keyword -> question);
+# the first keyword found in an item wins, so the generic indicators come last
+_QUESTION_TEMPLATES = {
+    "timeframe": "Which timeframe should the conditions be checked on? (e.g., 1h, 4h, 1d)",
+    "position size": "How much would you like to invest? (e.g., $1000 or 1 ETH)",
+    "stop loss": "Where should the stop loss be? (e.g., 5% below entry)",
+    "take profit": "Where should profits be taken? (e.g., 10% above entry)",
+    "rsi": "What RSI value should trigger the trade? (Typically oversold is below 30, overbought above 70)",
+    "ema": "Which EMA periods should cross? (e.g., 20 EMA crossing above 50 EMA)",
+}
 
-If everything is complete, return an empty array: []
 
-Be thorough - we need ALL details to execute the rule safely."""
+def _template_questions(missing_info: list[str]) -> Optional[list[str]]:
+    """Questions from _QUESTION_TEMPLATES, or None if any item has no template."""
+    questions = []
+    for item in missing_info:
+        lowered = item.lower()
+        question = next((q for keyword, q in _QUESTION_TEMPLATES.items() if keyword in lowered), None)
+        if question is None:
+            return None
+        if question not in questions:
+            questions.append(question)
+    return questions
+
 
-    response = llm.invoke(prompt)
+async def _adraft_questions(state: RuleEnrichmentState, missing_info: Optional[list[str]]) -> dict:
+    """Ask the LLM for clarifying questions (missing_info None: not yet known)."""
+    llm = get_llm(temperature=0.0)
+    missing = missing_info if missing_info is not None else _UNKNOWN_MISSING_INFO
+    
+    response = await get_response_cache().ainvoke("generate_questions", llm, _prompt_messages(
+        GENERATE_QUESTIONS_SYSTEM,
+        f'User Query: "{state.user_query}"\n'
+        f"Parsed Intent: {state.parsed_intent}\n"
+        f"Missing Information: {missing}",
+    ))
     
-    import json
     try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        missing_info = json.loads(content)
-        
         return {
-            "missing_info": missing_info if isinstance(missing_info, list) else []
+            "clarifying_questions": _QUESTIONS_PARSER.parse(response.content).root
         }
     except Exception as e:
         return {
-            "error": f"Failed to identify missing info: {str(e)}",
-            "missing_info": []
+            "error": f"Failed to generate questions: {str(e)}",
+            "clarifying_questions": []
         }
 
 
-def generate_questions_node(state: RuleEnrichmentState) -> dict:
-    """Generate clarifying questions based on missing information."""
+async def agenerate_questions_node(state: RuleEnrichmentState) -> dict:
+    """Generate clarifying questions based on missing information.
+    
+    Common items (RSI threshold, position size, stop loss, ...) are answered
+    from _QUESTION_TEMPLATES without an LLM call.
+    """
     
     if not state.missing_info:
         return {"clarifying_questions": []}
     
-    llm = get_llm(temperature=0.3)
+    questions = _template_questions(state.missing_info)
+    if questions is not None:
+        return {"clarifying_questions": questions}
     
-    prompt = f"""Generate clear, specific questions to fill in missing information:
+    return await _adraft_questions(state, state.missing_info)
 
-User Query: "{state.user_query}"
-Parsed Intent: {state.parsed_intent}
-Missing Information: {state.missing_info}
 
-For each missing piece of information, create ONE specific question that will help the user provide the needed detail.
+def identify_missing_info_node(state: RuleEnrichmentState) -> dict:
+    """Sync entry point for aidentify_missing_info_node."""
+    return run_sync(aidentify_missing_info_node(state))
 
-Guidelines:
-- Be specific and actionable
-- Provide examples or ranges when helpful
-- Ask one thing at a time
-- Use natural language, not technical jargon
-- Include context about why it's needed
 
-Return a JSON array of questions:
-[
-  "Question 1?",
-  "Question 2?",
-  ...
-]
+def generate_questions_node(state: RuleEnrichmentState) -> dict:
+    """Sync entry point for agenerate_questions_node."""
+    return run_sync(agenerate_questions_node(state))
 
-Example:
-If missing "RSI threshold", ask: "What RSI value should trigger the buy? (Typically oversold is below 30)"
-If missing "position size", ask: "How much would you like to invest? (e.g., $1000 or 1 ETH)"
-"""
 
-    response = llm.invoke(prompt)
+async def aidentify_missing_and_questions_node(state: RuleEnrichmentState) -> dict:
+    """Identify missing info while speculatively drafting the questions.
     
-    import json
+    Both calls only need the query and parsed intent, so the questions call
+    starts right away instead of after identify_missing returns. If nothing
+    turns out to be missing, or every missing item has a template question,
+    the speculative call is cancelled.
+    """
+    questions_task = asyncio.create_task(_adraft_questions(state, None))
     try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        questions = json.loads(content)
+        missing_update = await aidentify_missing_info_node(state)
+    except BaseException:
+        questions_task.cancel()
+        raise
+    
+    missing_info = missing_update["missing_info"]
+    questions = _template_questions(missing_info) if missing_info else []
+    if questions is not None:
+        questions_task.cancel()
+        return {**missing_update, "clarifying_questions": questions}
+    
+    questions_update = await questions_task
+    # Either call's error is reported; identify_missing's takes precedence
+    return {**questions_update, **missing_update}
+
+
+def identify_missing_and_questions_node(state: RuleEnrichmentState) -> dict:
+    """Sync entry point for aidentify_missing_and_questions_node."""
+    return run_sync(aidentify_missing_and_questions_node(state))
+
+
+def analyze_query_node(state: RuleEnrichmentState) -> dict:
+    """Parse intent, identify missing info and generate questions in one LLM call.
+    
+    Fuses parse_intent_node, identify_missing_info_node and
+    generate_questions_node: the three steps depend on each other only
+    through the model's own output, so one structured prompt replaces three
+    sequential round-trips and prompt prefills. Fully specified queries
+    skip the LLM (see fast_parse_intent).
+    """
+    parsed_intent = fast_parse_intent(state.user_query)
+    if parsed_intent is not None:
+        return {"parsed_intent": parsed_intent, "missing_info": [], "clarifying_questions": [], "fast_path": True}
+    
+    llm = get_llm(temperature=0.0)
+    
+    response = get_response_cache().invoke(
+        "analyze_query", llm, _prompt_messages(ANALYZE_QUERY_SYSTEM, f'User Query: "{state.user_query}"')
+    )
+    
+    try:
+        analysis = _QUERY_ANALYSIS_PARSER.parse(response.content)
         
         return {
-            "clarifying_questions": questions if isinstance(questions, list) else []
+            "parsed_intent": analysis.parsed_intent.model_dump() if analysis.parsed_intent else None,
+            "missing_info": analysis.missing_info,
+            "clarifying_questions": analysis.clarifying_questions,
         }
     except Exception as e:
         return {
-            "error": f"Failed to generate questions: {str(e)}",
+            "error": f"Failed to analyze query: {str(e)}",
+            "parsed_intent": None,
+            "missing_info": [],
             "clarifying_questions": []
         }
 
 
-def collect_answers_node(state: RuleEnrichmentState) -> dict:
+async def _ainput(prompt: str) -> str:
+    """Read a line from the terminal without blocking the event loop."""
+    sys.stdout.flush()  # Ensure prompt is visible
+    return (await asyncio.to_thread(input, prompt)).strip()
+
+
+async def acollect_answers_node(state: RuleEnrichmentState) -> dict:
     """Collect answers from user via terminal prompts.
     
     This is the human-in-the-loop step where we ask clarifying questions.
+    Input is read in a worker thread, so other graph runs on the same event
+    loop keep going while the user types.
     """
     if not state.clarifying_questions:
         return {"user_answers": {}}
@@ -283,11 +797,9 @@ def collect_answers_node(state: RuleEnrichmentState) -> dict:
     
     answers = {}
     
-    import sys
     for i, question in enumerate(state.clarifying_questions, 1):
         print(f"\n{i}. {question}")
-        sys.stdout.flush()  # Ensure prompt is visible
-        answer = input("   Your answer: ").strip()
+        answer = await _ainput("   Your answer: ")
         
         # Store with question as key for context
         answers[question] = answer
@@ -299,6 +811,59 @@ def collect_answers_node(state: RuleEnrichmentState) -> dict:
     return {"user_answers": answers}
 
 
+def collect_answers_node(state: RuleEnrichmentState) -> dict:
+    """Sync entry point for acollect_answers_node."""
+    return run_sync(acollect_answers_node(state))
+
+
+_RULE_ACTIONS = ("buy", "sell", "hold")
+
+# Re-parse the streamed rule every N chunks rather than on every token
+_PARSE_EVERY = 4
+
+
+def _stream_rule_draft(llm: Any, messages: list[BaseMessage]) -> tuple[str, Optional[str]]:
+    """Stream the build_rule reply, stopping as soon as "action" is invalid.
+    
+    "action" counts as final once the next key has started, so a value
+    still being decoded ("bu...") is never rejected.
+    
+    Returns:
+        (reply text, the invalid action if the stream was stopped early)
+    """
+    buffer = ""
+    stream = llm.stream(messages)
+    try:
+        for chunks, chunk in enumerate(stream, 1):
+            if isinstance(chunk.content, str):
+                buffer += chunk.content
+            if chunks % _PARSE_EVERY:
+                continue
+            
+            action = settled_fields(buffer).get("action")
+            if action is not None and action not in _RULE_ACTIONS:
+                return buffer, action
+    finally:
+        stream.close()
+    
+    return buffer, None
+
+
+def _invalid_action_update(action: Any) -> dict:
+    """State update for a rule whose action is not buy, sell or hold."""
+    return {
+        "structured_rule": None,
+        "is_valid": False,
+        "validation_errors": [f"Invalid action: {action}. Must be buy, sell, or hold."]
+    }
+
+
+def _schema_error_message(error: Any) -> str:
+    """Readable message for a rule schema violation, prefixed with its path."""
+    path = ".".join(str(part) for part in error.absolute_path)
+    return f"{path}: {error.message}" if path else error.message
+
+
 def validate_and_build_rule_node(state: RuleEnrichmentState) -> dict:
     """Build structured rule from parsed intent and user answers.
     
@@ -313,97 +878,45 @@ def validate_and_build_rule_node(state: RuleEnrichmentState) -> dict:
         "confidence": 0.8,
         "metadata": {...}
     }
+    
+    Fast-path intents are template-filled without an LLM call. Otherwise the
+    reply is streamed (visible with stream_mode="messages") and abandoned as
+    soon as its action is invalid, skipping the rest of the decode.
     """
-    llm = get_llm(temperature=0.0)
+    if state.fast_path and state.parsed_intent:
+        return {
+            "structured_rule": _template_rule(state.user_query, state.parsed_intent),
+            "is_valid": True,
+            "validation_errors": []
+        }
     
-    prompt = f"""Build a structured trading rule from this information:
-
-Original Query: "{state.user_query}"
-Parsed Intent: {state.parsed_intent}
-User Answers: {state.user_answers}
-
-Create a complete, executable trading rule with this EXACT format:
-{{
-  "name": "Descriptive rule name",
-  "conditions": [
-    {{
-      "field": "market.rsi",  // Available: market.rsi, market.ema_short, market.ema_long, market.volume_ratio, market.trend_direction, sentiment.sentiment_signal, etc.
-      "operator": "lt",  // Available: gt, lt, gte, lte, eq, ne
-      "value": 30  // Numeric or string value
-    }}
-  ],
-  "action": "buy",  // Must be: buy, sell, or hold
-  "logic": "AND",  // Must be: AND or OR (if multiple conditions)
-  "confidence": 0.8,  // Your confidence in this rule (0.0-1.0)
-  "metadata": {{
-    "position_size": "value from user or default",
-    "stop_loss": "value from user or null",
-    "take_profit": "value from user or null",
-    "max_risk_percent": "value from user or 2",
-    "timeframe": "value from user or null",
-    "description": "Natural language description of the rule"
-  }}
-}}
-
-CRITICAL REQUIREMENTS:
-1. Map user's indicators to correct field paths (e.g., "RSI" → "market.rsi")
-2. Use correct operators (gt=greater than, lt=less than, etc.)
-3. Convert user's natural language thresholds to numeric values
-4. Include ALL information from user answers in metadata
-5. Set a reasonable confidence based on rule specificity
-6. Action MUST be exactly "buy", "sell", or "hold"
-
-Available field paths:
-- market.rsi (0-100)
-- market.rsi_signal (oversold/neutral/overbought)
-- market.ema_short, market.ema_long (numeric)
-- market.ema_signal (bullish/bearish/neutral)
-- market.volume_ratio (numeric, >1 is high volume)
-- market.volume_signal (high/normal/low)
-- market.trend_direction (bullish/bearish/sideways)
-- market.trend_strength (0-1)
-- sentiment.sentiment_signal (positive/negative/neutral)
-- sentiment.average_sentiment (-1 to 1)
-
-Return ONLY the JSON object, no explanation."""
-
-    response = llm.invoke(prompt)
+    llm = get_llm(temperature=0.0)
+    messages = _prompt_messages(
+        BUILD_RULE_SYSTEM,
+        f'Original Query: "{state.user_query}"\n'
+        f"Parsed Intent: {state.parsed_intent}\n"
+        f"User Answers: {state.user_answers}",
+    )
     
-    import json
     try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        structured_rule = json.loads(content)
-        
-        # Validate required fields
-        required_fields = ["name", "conditions", "action", "logic"]
-        missing_fields = [f for f in required_fields if f not in structured_rule]
+        cache = get_response_cache()
+        key = cache.make_key("build_rule", llm, messages)
+        content = cache.get(key)
+        if content is None:
+            content, invalid_action = _stream_rule_draft(llm, messages)
+            if invalid_action is not None:
+                return _invalid_action_update(invalid_action)
+            cache.set(key, content)
         
-        if missing_fields:
-            return {
-                "structured_rule": None,
-                "is_valid": False,
-                "validation_errors": [f"Missing required field: {f}" for f in missing_fields]
-            }
+        structured_rule = _RULE_DRAFT_PARSER.parse(content).root
         
-        # Validate action
-        if structured_rule["action"] not in ["buy", "sell", "hold"]:
+        # Required fields, action/logic/operator values, non-empty conditions
+        validation_errors = [_schema_error_message(e) for e in _RULE_VALIDATOR.iter_errors(structured_rule)]
+        if validation_errors:
             return {
                 "structured_rule": None,
                 "is_valid": False,
-                "validation_errors": [f"Invalid action: {structured_rule['action']}. Must be buy, sell, or hold."]
-            }
-        
-        # Validate conditions
-        if not structured_rule["conditions"] or not isinstance(structured_rule["conditions"], list):
-            return {
-                "structured_rule": None,
-                "is_valid": False,
-                "validation_errors": ["Conditions must be a non-empty list"]
+                "validation_errors": validation_errors
             }
         
         return {
@@ -421,10 +934,11 @@ Return ONLY the JSON object, no explanation."""
         }
 
 
-def human_verification_node(state: RuleEnrichmentState) -> dict:
+async def ahuman_verification_node(state: RuleEnrichmentState) -> dict:
     """Show structured rule to user and ask for confirmation/modifications.
     
     This is the final human-in-the-loop step before returning the rule.
+    Like acollect_answers_node, it reads input without blocking the loop.
     """
     if not state.is_valid or not state.structured_rule:
         print("\n⚠️  Rule validation failed. Cannot proceed.")
@@ -434,8 +948,6 @@ def human_verification_node(state: RuleEnrichmentState) -> dict:
             "completed": True
         }
     
-    import json
-    
     print("\n" + "="*70)
     print("📊 STRUCTURED TRADING RULE - Review and Confirm")
     print("="*70)
@@ -466,10 +978,7 @@ def human_verification_node(state: RuleEnrichmentState) -> dict:
     print("  [n] Cancel")
     print("  [e] Edit (provide modifications in natural language)")
     
-    import sys
-    sys.stdout.flush()  # Ensure output is displayed before input
-    
-    choice = input("\nYour choice (y/n/e): ").strip().lower()
+    choice = (await _ainput("\nYour choice (y/n/e): ")).lower()
     
     if choice == 'y':
         print("\n✓ Rule confirmed! Ready for execution.\n")
@@ -478,7 +987,7 @@ def human_verification_node(state: RuleEnrichmentState) -> dict:
             "completed": True
         }
     elif choice == 'e':
-        modifications = input("\nDescribe your modifications: ").strip()
+        modifications = await _ainput("\nDescribe your modifications: ")
         print("\n⚠️  Modification feature not yet implemented. Please confirm or cancel.\n")
         # TODO: Implement modification loop
         return {
@@ -494,6 +1003,11 @@ def human_verification_node(state: RuleEnrichmentState) -> dict:
         }
 
 
+def human_verification_node(state: RuleEnrichmentState) -> dict:
+    """Sync entry point for ahuman_verification_node."""
+    return run_sync(ahuman_verification_node(state))
+
+
 # ============================================================================
 # CONDITIONAL EDGES
 # ============================================================================
@@ -505,6 +1019,13 @@ def should_ask_questions(state: RuleEnrichmentState) -> Literal["collect_answers
     return "build_rule"
 
 
+def after_parse_intent(state: RuleEnrichmentState) -> Literal["identify_missing", "build_rule"]:
+    """Fast-path intents are complete, so skip straight to rule building."""
+    if state.fast_path:
+        return "build_rule"
+    return "identify_missing"
+
+
 def should_continue_after_verification(state: RuleEnrichmentState) -> Literal["END"]:
     """Always end after verification."""
     return "END"
@@ -514,33 +1035,58 @@ def should_continue_after_verification(state: RuleEnrichmentState) -> Literal["E
 # GRAPH CONSTRUCTION
 # ============================================================================
 
-def build_rule_enrichment_graph() -> StateGraph:
+def build_rule_enrichment_graph(fused_analysis: Optional[bool] = None) -> StateGraph:
     """Build the rule enrichment graph.
     
-    Flow:
-    START → parse_intent → identify_missing → generate_questions → 
+    Flow (fused, default):
+    START → analyze_query →
     [if questions] → collect_answers → build_rule → human_verification → END
     [if no questions] → build_rule → human_verification → END
+    
+    Flow (staged, for A/B comparison):
+    START → parse_intent → identify_missing (∥ speculative generate_questions) → ...same as above
+    
+    Args:
+        fused_analysis: One analyze_query LLM call instead of three staged
+            calls (default: RULE_ENRICHMENT_FUSED_ANALYSIS env var, on unless "0")
     """
+    if fused_analysis is None:
+        fused_analysis = FUSED_ANALYSIS
     
     graph = StateGraph(RuleEnrichmentState)
     
     # Add nodes
-    graph.add_node("parse_intent", parse_intent_node)
-    graph.add_node("identify_missing", identify_missing_info_node)
-    graph.add_node("generate_questions", generate_questions_node)
-    graph.add_node("collect_answers", collect_answers_node)
+    if fused_analysis:
+        graph.add_node("analyze_query", analyze_query_node)
+    else:
+        graph.add_node("parse_intent", RunnableLambda(parse_intent_node, afunc=aparse_intent_node))
+        graph.add_node(
+            "identify_missing",
+            RunnableLambda(identify_missing_and_questions_node, afunc=aidentify_missing_and_questions_node),
+        )
+    graph.add_node("collect_answers", RunnableLambda(collect_answers_node, afunc=acollect_answers_node))
     graph.add_node("build_rule", validate_and_build_rule_node)
-    graph.add_node("human_verification", human_verification_node)
+    graph.add_node("human_verification", RunnableLambda(human_verification_node, afunc=ahuman_verification_node))
     
     # Add edges
-    graph.set_entry_point("parse_intent")
-    graph.add_edge("parse_intent", "identify_missing")
-    graph.add_edge("identify_missing", "generate_questions")
+    if fused_analysis:
+        graph.set_entry_point("analyze_query")
+        analysis_node = "analyze_query"
+    else:
+        graph.set_entry_point("parse_intent")
+        graph.add_conditional_edges(
+            "parse_intent",
+            after_parse_intent,
+            {
+                "identify_missing": "identify_missing",
+                "build_rule": "build_rule"
+            }
+        )
+        analysis_node = "identify_missing"
     
     # Conditional: ask questions or skip to rule building
     graph.add_conditional_edges(
-        "generate_questions",
+        analysis_node,
         should_ask_questions,
         {
             "collect_answers": "collect_answers",
@@ -590,6 +1136,28 @@ def enrich_rule(user_query: str) -> dict | None:
         return None
 
 
+async def aenrich_rule(user_query: str) -> dict | None:
+    """Async enrich_rule; concurrent calls share the event loop (and batching).
+    
+    Args:
+        user_query: Natural language trading query
+        
+    Returns:
+        Structured trading rule if confirmed, None if cancelled
+    """
+    graph = build_rule_enrichment_graph()
+    
+    try:
+        final_state = await graph.ainvoke(RuleEnrichmentState(user_query=user_query))
+    except Exception as e:
+        print(f"\n❌ Error during rule enrichment: {str(e)}")
+        return None
+    
+    if final_state.get("user_confirmed") and final_state.get("structured_rule"):
+        return final_state["structured_rule"]
+    return None
+
+
 if __name__ == "__main__":
     """Test the rule enrichment graph."""
     
@@ -607,7 +1175,6 @@ if __name__ == "__main__":
     
     if rule:
         print("\n✅ SUCCESS - Structured Rule Generated:")
-        import json
         print(json.dumps(rule, indent=2))
     else:
         print("\n❌ Rule enrichment cancelled or failed.")
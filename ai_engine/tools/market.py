@@ -4,15 +4,24 @@ Provides technical analysis indicators like RSI, EMA, volume, and trend analysis
 This is a deterministic tool with NO LLM usage.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import numpy as np
 
+# Accept plain lists from callers, but compute on contiguous float64 arrays.
+# float64 (not float32) keeps cent precision on five-digit prices.
+PriceSeries = Union[List[float], np.ndarray]
 
-def calculate_rsi(prices: List[float], period: int = 14) -> float:
+
+def _as_array(values: PriceSeries) -> np.ndarray:
+    """Convert a price/volume series to a contiguous float64 array (no copy if already one)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def calculate_rsi(prices: PriceSeries, period: int = 14) -> float:
     """Calculate Relative Strength Index (RSI).
     
     Args:
-        prices: List of historical prices
+        prices: Historical prices (list or numpy array)
         period: RSI period (default 14)
         
     Returns:
@@ -21,12 +30,13 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
     if len(prices) < period + 1:
         return 50.0  # Neutral RSI if insufficient data
     
-    deltas = np.diff(prices)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
+    # Only the last `period` deltas are averaged, so only diff that tail
+    deltas = np.diff(_as_array(prices[-(period + 1):]))
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
     
-    avg_gain = np.mean(gains[-period:])
-    avg_loss = np.mean(losses[-period:])
+    avg_gain = gains.mean()
+    avg_loss = losses.mean()
     
     if avg_loss == 0:
         return 100.0
@@ -36,33 +46,40 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
     return float(rsi)
 
 
-def calculate_ema(prices: List[float], period: int = 20) -> float:
+def calculate_ema(prices: PriceSeries, period: int = 20) -> float:
     """Calculate Exponential Moving Average (EMA).
     
+    Seeded with the first price. The recursion
+    ema_i = a * p_i + (1 - a) * ema_{i-1} is evaluated in closed form as a
+    single weighted sum instead of a Python loop.
+    
     Args:
-        prices: List of historical prices
+        prices: Historical prices (list or numpy array)
         period: EMA period (default 20)
         
     Returns:
         EMA value
     """
+    prices = _as_array(prices)
     if len(prices) < period:
         return float(np.mean(prices))
     
     multiplier = 2 / (period + 1)
-    ema = prices[0]
+    decay = 1 - multiplier
+    n = len(prices)
     
-    for price in prices[1:]:
-        ema = (price * multiplier) + (ema * (1 - multiplier))
+    # Weight of p_i in the final EMA: a * decay^(n-1-i), and decay^(n-1) for the seed
+    weights = multiplier * decay ** np.arange(n - 2, -1, -1, dtype=np.float64)
+    ema = prices[0] * decay ** (n - 1) + weights @ prices[1:]
     
     return float(ema)
 
 
-def get_trend_direction(prices: List[float]) -> str:
+def get_trend_direction(prices: PriceSeries) -> str:
     """Determine trend direction based on price history.
     
     Args:
-        prices: List of historical prices
+        prices: Historical prices (list or numpy array)
         
     Returns:
         Trend direction: 'bullish', 'bearish', or 'neutral'
@@ -83,8 +100,8 @@ def get_trend_direction(prices: List[float]) -> str:
 
 def get_market_indicators(
     symbol: str,
-    prices: List[float],
-    volumes: List[float],
+    prices: PriceSeries,
+    volumes: PriceSeries,
     **kwargs
 ) -> Dict[str, Any]:
     """Get comprehensive market indicators for a trading symbol.
@@ -94,14 +111,18 @@ def get_market_indicators(
     
     Args:
         symbol: Trading symbol (e.g., 'BTC/USD')
-        prices: Historical price data
-        volumes: Historical volume data
+        prices: Historical price data (list or numpy array)
+        volumes: Historical volume data (list or numpy array)
         **kwargs: Additional parameters
         
     Returns:
         Dictionary containing market indicators
     """
-    current_price = prices[-1] if prices else 0.0
+    # Convert once; every indicator below slices these arrays
+    prices = _as_array(prices)
+    volumes = _as_array(volumes)
+    
+    current_price = float(prices[-1]) if len(prices) else 0.0
     
     indicators = {
         "symbol": symbol,
@@ -110,9 +131,9 @@ def get_market_indicators(
         "ema_20": calculate_ema(prices, 20),
         "ema_50": calculate_ema(prices, 50),
         "trend": get_trend_direction(prices),
-        "volume_avg": float(np.mean(volumes[-20:])) if volumes else 0.0,
-        "volume_current": volumes[-1] if volumes else 0.0,
-        "price_change_24h": ((prices[-1] - prices[-24]) / prices[-24] * 100) if len(prices) >= 24 else 0.0,
+        "volume_avg": float(volumes[-20:].mean()) if len(volumes) else 0.0,
+        "volume_current": float(volumes[-1]) if len(volumes) else 0.0,
+        "price_change_24h": float((prices[-1] - prices[-24]) / prices[-24] * 100) if len(prices) >= 24 else 0.0,
     }
     
     # Add interpretation
@@ -121,6 +121,7 @@ def evaluate_rules(
             "rules_matched": 0,
             "matched_rules": [],
             "recommended_action": None,
+            "all_results": [],
         }
     
     results = [evaluate_rule(rule, context) for rule in rules]
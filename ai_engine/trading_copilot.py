@@ -80,7 +80,7 @@ def execute_trading_decision_with_enrichment(
         # Convert enriched rule to the format expected by the engine
         rules = [enriched_rule]
         kwargs["rules"] = rules
-        logger.info(f"Using enriched rule: {enriched_rule['name']}")
+        logger.info("Using enriched rule: %s", enriched_rule['name'])
     
     # Execute the decision
     decision = engine.decide(
@@ -180,7 +180,7 @@ def interactive_trading_session():
                 break
                 
         except Exception as e:
-            logger.error(f"Error in trading session: {e}", exc_info=True)
+            logger.error("Error in trading session: %s", e, exc_info=True)
             print(f"\n❌ Error: {str(e)}")
             print("Please try again with a different query.\n")
 
@@ -5,7 +5,7 @@ Provides LLM wrapper, JSON validation, and logging utilities.
 
 from .llm import get_llm, llm_call
 from .json_guard import validate_json_output, enforce_json_schema
-from .logger import get_logger
+from .logger import get_logger, debug_exc_info
 
 __all__ = [
     "get_llm",
@@ -13,4 +13,5 @@ __all__ = [
     "validate_json_output",
     "enforce_json_schema",
     "get_logger",
+    "debug_exc_info",
 ]
@@ -0,0 +1,217 @@
+"""Evaluation cache - memoize LLM evaluator results by quantized inputs.
+
+Evaluator inputs (RSI, EMAs, signals, ...) barely move between nearby ticks,
+so numeric fields are snapped to coarse bins before hashing. Inputs that land
+in the same bins share one cached evaluation instead of paying for another
+LLM round-trip. Bins are absolute (RSI points) or relative to the value
+(price-scaled fields such as EMAs, where a fixed width never collapses
+anything at BTC-scale prices).
+
+Only passing evaluations are stored. A rejection is meant to trigger a
+worker retry with a fresh evaluation, and must not be pinned for later
+ticks.
+
+Tiers:
+- In-process LRU (always on)
+- Redis (optional, enabled when EVAL_CACHE_REDIS_URL is set)
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from .logger import get_logger
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is the fallback
+    orjson = None
+
+logger = get_logger(__name__)
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU mapping."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return cached value (or None) and mark it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def series_digest(*series: Any) -> bytes:
+    """Content hash of one or more numeric series (lists or numpy arrays)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in series:
+        data = np.ascontiguousarray(values, dtype=np.float64)
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data.tobytes())
+    return digest.digest()
+
+
+def _get_redis_client():
+    """Return a Redis client if EVAL_CACHE_REDIS_URL is configured, else None."""
+    url = os.getenv("EVAL_CACHE_REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("EVAL_CACHE_REDIS_URL is set but redis is not installed. Run: poetry add redis")
+        return None
+    return redis.Redis.from_url(url)
+
+
+def _dumps_canonical(value: dict[str, Any]) -> bytes:
+    """Serialize a dict to sorted-key JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, sort_keys=True, default=str).encode()
+
+
+class EvaluationCache:
+    """Cache of evaluator results keyed by quantized evaluator inputs.
+
+    Examples:
+        cache = EvaluationCache(MarketEvaluation, quantize={"rsi": 1.0})
+        evaluation = cache.get_or_call(inputs, lambda: chain.invoke(inputs))
+    """
+
+    def __init__(
+        self,
+        schema: type[BaseModel],
+        quantize: Optional[dict[str, float]] = None,
+        relative: Optional[dict[str, float]] = None,
+        maxsize: int = 1024,
+        ttl_seconds: int = 3600,
+    ):
+        """Initialize the cache.
+
+        Args:
+            schema: Pydantic model the cached evaluations are restored into
+            quantize: Bin width per numeric input field (e.g. {"rsi": 1.0})
+            relative: Bin width as a fraction of the value, for positive
+                price-scaled fields (e.g. {"ema_short": 0.0005} = 5 bps)
+            maxsize: Max entries in the in-process tier
+            ttl_seconds: Expiry for entries in the Redis tier
+        """
+        self.schema = schema
+        self.quantize = quantize or {}
+        self.relative = relative or {}
+        self.ttl_seconds = ttl_seconds
+        self._memory = LRUCache(maxsize)
+        self._redis = _get_redis_client()
+        self._prefix = f"eval_cache:{schema.__name__}:"
+
+    def make_key(self, inputs: dict[str, Any]) -> str:
+        """Build a canonical hash key from evaluator inputs.
+
+        Numeric fields listed in `quantize` or `relative` are snapped to their
+        bin so that nearly identical inputs map to the same key.
+        """
+        canonical = {}
+        for name, value in inputs.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                step = self.quantize.get(name)
+                ratio = self.relative.get(name)
+                if step:
+                    value = round(round(value / step) * step, 6)
+                elif ratio and value > 0:
+                    # Log-scale bin index: each bin is `ratio` wider than the last
+                    value = f"rel:{round(math.log(value) / math.log1p(ratio))}"
+            canonical[name] = value
+        return hashlib.blake2b(_dumps_canonical(canonical), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[BaseModel]:
+        """Look up a cached evaluation by key."""
+        raw = self._memory.get(key)
+        if raw is None and self._redis is not None:
+            try:
+                raw = self._redis.get(self._prefix + key)
+            except Exception as e:
+                logger.warning("Evaluation cache Redis read failed: %s", e)
+                raw = None
+            if raw is not None:
+                self._memory.set(key, raw)
+        if raw is None:
+            return None
+        return self.schema.model_validate_json(raw)
+
+    def set(self, key: str, evaluation: BaseModel) -> None:
+        """Store an evaluation under key (rejections, is_valid=False, are skipped)."""
+        if getattr(evaluation, "is_valid", True) is False:
+            return
+        raw = evaluation.model_dump_json()
+        self._memory.set(key, raw)
+        if self._redis is not None:
+            try:
+                self._redis.set(self._prefix + key, raw, ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning("Evaluation cache Redis write failed: %s", e)
+
+    def get_or_call(self, inputs: dict[str, Any], call: Callable[[], BaseModel]) -> BaseModel:
+        """Return the cached evaluation for inputs, or compute and store it.
+
+        Args:
+            inputs: Evaluator input variables
+            call: Zero-arg function producing the evaluation on a miss
+
+        Returns:
+            Cached or freshly computed evaluation
+        """
+        key = self.make_key(inputs)
+        cached = self.get(key)
+        if cached is not None:
+            logger.debug("Evaluation cache hit for %s", self.schema.__name__)
+            return cached
+
+        evaluation = call()
+        self.set(key, evaluation)
+        return evaluation
+
+    async def aget_or_call(self, inputs: dict[str, Any], call: Callable[[], Awaitable[BaseModel]]) -> BaseModel:
+        """Async variant of get_or_call for coroutine-producing calls."""
+        key = self.make_key(inputs)
+        cached = self.get(key)
+        if cached is not None:
+            logger.debug("Evaluation cache hit for %s", self.schema.__name__)
+            return cached
+
+        evaluation = await call()
+        self.set(key, evaluation)
+        return evaluation
+
+    def clear(self) -> None:
+        """Drop all in-process entries."""
+        self._memory.clear()
@@ -5,12 +5,27 @@ Handles common JSON formatting issues from LLM responses.
 
 import re
 import json
+from functools import lru_cache
 from typing import Any, Dict
 
+# Compiled once at import; re's internal cache is small and evictable
+_PAT_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_PAT_LINE_COMMENT = re.compile(r'//.*?\n')
+_PAT_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_PAT_TRUE = re.compile(r'\bTrue\b')
+_PAT_FALSE = re.compile(r'\bFalse\b')
+_PAT_NONE = re.compile(r'\bNone\b')
+_PAT_FENCED_OBJECT = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_PAT_OBJECT = re.compile(r'\{.*\}', re.DOTALL)
 
+
+@lru_cache(maxsize=512)
 def fix_json_string(json_str: str) -> str:
     """Fix common JSON formatting issues from LLM responses.
     
+    Memoized: evaluators with stable inputs repeat the same malformed
+    output, which then skips the substitution sweep.
+    
     Handles:
     - Trailing commas before closing braces/brackets
     - Missing quotes around keys
@@ -24,16 +39,16 @@ def fix_json_string(json_str: str) -> str:
         Fixed JSON string that can be parsed
     """
     # Remove trailing commas before } or ]
-    json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
+    json_str = _PAT_TRAILING_COMMA.sub(r'\1', json_str)
     
     # Remove comments (// or /* */)
-    json_str = re.sub(r'//.*?\n', '\n', json_str)
-    json_str = re.sub(r'/\*.*?\*/', '', json_str, flags=re.DOTALL)
+    json_str = _PAT_LINE_COMMENT.sub('\n', json_str)
+    json_str = _PAT_BLOCK_COMMENT.sub('', json_str)
     
     # Fix Python-style booleans and None
-    json_str = re.sub(r'\bTrue\b', 'true', json_str)
-    json_str = re.sub(r'\bFalse\b', 'false', json_str)
-    json_str = re.sub(r'\bNone\b', 'null', json_str)
+    json_str = _PAT_TRUE.sub('true', json_str)
+    json_str = _PAT_FALSE.sub('false', json_str)
+    json_str = _PAT_NONE.sub('null', json_str)
     
     return json_str
 
@@ -67,7 +82,7 @@ def parse_json_safely(json_str: str) -> Dict[str, Any]:
         pass
     
     # Try extracting from markdown code blocks
-    match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', json_str, re.DOTALL)
+    match = _PAT_FENCED_OBJECT.search(json_str)
     if match:
         try:
             fixed = fix_json_string(match.group(1))
@@ -76,7 +91,7 @@ def parse_json_safely(json_str: str) -> Dict[str, Any]:
             pass
     
     # Try finding first complete JSON object
-    match = re.search(r'\{.*\}', json_str, re.DOTALL)
+    match = _PAT_OBJECT.search(json_str)
     if match:
         try:
             fixed = fix_json_string(match.group(0))
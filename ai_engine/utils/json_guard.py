@@ -104,6 +104,59 @@ def get_decision_schema() -> Dict[str, Any]:
     }
 
 
+def get_rule_schema() -> Dict[str, Any]:
+    """Get the JSON schema for structured trading rules.
+    
+    Operators cover both the rule-building prompt ("ne") and
+    tools.rules.evaluate_condition ("neq", "in", "not_in").
+    
+    Returns:
+        JSON schema for rule output
+    """
+    return {
+        "type": "object",
+        "required": ["name", "conditions", "action", "logic"],
+        "properties": {
+            "name": {
+                "type": "string"
+            },
+            "conditions": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "required": ["field", "operator", "value"],
+                    "properties": {
+                        "field": {
+                            "type": "string"
+                        },
+                        "operator": {
+                            "type": "string",
+                            "enum": ["gt", "lt", "gte", "lte", "eq", "ne", "neq", "in", "not_in"]
+                        }
+                    }
+                }
+            },
+            "action": {
+                "type": "string",
+                "enum": ["buy", "sell", "hold"]
+            },
+            "logic": {
+                "type": "string",
+                "enum": ["AND", "OR"]
+            },
+            "confidence": {
+                "type": "number",
+                "minimum": 0.0,
+                "maximum": 1.0
+            },
+            "metadata": {
+                "type": "object"
+            }
+        }
+    }
+
+
 def sanitize_decision_output(data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize and validate a trading decision output.
     
@@ -116,14 +169,14 @@ def sanitize_decision_output(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Sanitized decision data
     """
-    from datetime import datetime
+    from datetime import datetime, timezone
     
     required_fields = ["action", "confidence", "reasoning", "timestamp"]
     defaults = {
         "action": "hold",
         "confidence": 0.0,
         "reasoning": "No reasoning provided",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "position_size": 0.0,
         "stop_loss": 0.0,
         "take_profit": 0.0,
@@ -3,6 +3,7 @@
 Provides a unified interface for LLM interactions.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import os
 from langchain_anthropic import ChatAnthropic
@@ -16,6 +17,9 @@ def get_llm(
 ) -> ChatAnthropic:
     """Get LangChain LLM instance.
     
+    Instances are cached per (model, temperature, kwargs), so repeated calls
+    share one client and its HTTP connection pool.
+    
     Args:
         model: Model name (default: claude-3-5-sonnet-20240620)
         temperature: Sampling temperature
@@ -28,14 +32,25 @@ def get_llm(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     
-    llm = ChatAnthropic(
+    options = tuple(sorted(kwargs.items()))
+    try:
+        hash(options)
+    except TypeError:
+        # Unhashable model parameters: build an uncached instance
+        return ChatAnthropic(model=model, temperature=temperature, anthropic_api_key=api_key, **kwargs)
+    
+    return _build_llm(model, float(temperature), api_key, options)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(model: str, temperature: float, api_key: str, options: tuple) -> ChatAnthropic:
+    """Construct the chat model for get_llm (cached on normalized arguments)."""
+    return ChatAnthropic(
         model=model,
         temperature=temperature,
         anthropic_api_key=api_key,
-        **kwargs
+        **dict(options)
     )
-    
-    return llm
 
 
 def llm_call(
@@ -1,9 +1,68 @@
 """LLM utility - model-agnostic LLM support (Claude, GPT, Gemini)."""
 
+import asyncio
 import os
-from typing import Literal, Optional
+import random
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Literal, Optional, TypeVar
 
-LLMProvider = Literal["anthropic", "openai", "google"]
+import httpx
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+LLMProvider = Literal["anthropic", "openai", "google", "ollama"]
+
+T = TypeVar("T")
+
+
+def _detect_provider() -> LLMProvider:
+    """Pick a provider from whichever API key is set."""
+    if os.getenv("ANTHROPIC_API_KEY"):
+        return "anthropic"
+    if os.getenv("OPENAI_API_KEY"):
+        return "openai"
+    if os.getenv("GOOGLE_API_KEY"):
+        return "google"
+    raise ValueError(
+        "No LLM provider configured. Set one of: "
+        "ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY"
+    )
+
+
+# Connection pool shared by every LLM client in the process, so sync calls
+# (invoke/stream) reuse warm TLS connections instead of handshaking per client.
+# There is deliberately no shared async client: nodes run on short-lived
+# loops (run_sync, parallel Send branches), and pooled connections cannot
+# outlive the loop that opened them.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 multiplexing needs the h2 package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.debug("h2 not installed, LLM HTTP client uses HTTP/1.1. Run: poetry add 'httpx[http2]'")
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide sync HTTP client for provider SDKs.
+    
+    Only sync calls (invoke/stream) go through it. The decision path is
+    async (ainvoke/astream), so it uses each SDK's own async client and is
+    not affected by this pool.
+    """
+    return httpx.Client(http2=_http2_enabled(), limits=_HTTP_LIMITS, timeout=60.0)
 
 
 def get_llm(
@@ -13,9 +72,17 @@ def get_llm(
 ):
     """Get a configured LLM instance (supports Claude, GPT, Gemini).
     
+    Instances are cached per resolved (temperature, provider, model), so
+    every caller asking for the same model shares one client however it
+    spells the arguments (keyword order, implicit vs explicit provider). OpenAI clients are also handed the
+    process-wide sync HTTP pool (HTTP/2 when h2 is installed) for sync calls;
+    async calls, which is every call on the decision path, use the SDK's own
+    async client. langchain-anthropic keeps its own shared pool. Chat models
+    are stateless between calls, so sharing is safe.
+    
     Args:
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
-        provider: LLM provider - "anthropic", "openai", or "google"
+        provider: LLM provider - "anthropic", "openai", "google", or "ollama"
                  If None, auto-detects from environment variables
         model: Specific model name (optional)
         
@@ -26,6 +93,7 @@ def get_llm(
         ANTHROPIC_API_KEY - For Claude models
         OPENAI_API_KEY - For GPT models
         GOOGLE_API_KEY - For Gemini models
+        OLLAMA_BASE_URL - For local Ollama models (default http://localhost:11434)
     
     Examples:
         # Use Claude (default if ANTHROPIC_API_KEY is set)
@@ -39,18 +107,14 @@ def get_llm(
     """
     # Auto-detect provider if not specified
     if provider is None:
-        if os.getenv("ANTHROPIC_API_KEY"):
-            provider = "anthropic"
-        elif os.getenv("OPENAI_API_KEY"):
-            provider = "openai"
-        elif os.getenv("GOOGLE_API_KEY"):
-            provider = "google"
-        else:
-            raise ValueError(
-                "No LLM provider configured. Set one of: "
-                "ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY"
-            )
+        provider = _detect_provider()
     
+    return _build_llm(float(temperature), provider, model)
+
+
+@lru_cache(maxsize=32)
+def _build_llm(temperature: float, provider: LLMProvider, model: Optional[str]):
+    """Construct the chat model for get_llm (cached on normalized arguments)."""
     # Anthropic (Claude)
     if provider == "anthropic":
         from langchain_anthropic import ChatAnthropic
@@ -82,6 +146,7 @@ def get_llm(
             model=model or "gpt-4-turbo-preview",
             temperature=temperature,
             openai_api_key=api_key,
+            http_client=get_http_client(),
         )
     
     # Google (Gemini)
@@ -103,8 +168,209 @@ def get_llm(
             google_api_key=api_key,
         )
     
+    # Ollama (local models, e.g. small draft evaluators)
+    elif provider == "ollama":
+        try:
+            from langchain_ollama import ChatOllama
+        except ImportError:
+            raise ImportError(
+                "langchain-ollama not installed. Run: poetry add langchain-ollama"
+            )
+        
+        return ChatOllama(
+            model=model or "llama3.2:3b",
+            temperature=temperature,
+            base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+        )
+    
     else:
-        raise ValueError(f"Unknown provider: {provider}. Use: anthropic, openai, or google")
+        raise ValueError(f"Unknown provider: {provider}. Use: anthropic, openai, google, or ollama")
+
+
+def get_llm_structured(
+    schema: type[BaseModel],
+    temperature: float = 0.7,
+    provider: Optional[LLMProvider] = None,
+    model: Optional[str] = None,
+) -> Runnable:
+    """Get an LLM that returns `schema` instances via native structured output.
+    
+    The provider enforces the schema (OpenAI strict json_schema, Anthropic
+    tool use, Gemini response schema), so no output parser or JSON fixing is
+    needed and format instructions can be left out of the prompt.
+    
+    Args:
+        schema: Pydantic model the LLM must return
+        temperature: Sampling temperature
+        provider: LLM provider (auto-detected if None)
+        model: Specific model name (optional)
+        
+    Returns:
+        Runnable producing `schema` instances
+    
+    Examples:
+        llm = get_llm_structured(MarketEvaluation, **LLMConfig.EVALUATORS)
+        evaluation = (prompt | llm).invoke(inputs)
+    """
+    if provider is None:
+        provider = _detect_provider()
+    
+    llm = get_llm(temperature=temperature, provider=provider, model=model)
+    
+    if provider == "openai":
+        return llm.with_structured_output(schema, method="json_schema", strict=True)
+    if provider == "anthropic":
+        return llm.with_structured_output(schema, method="function_calling")
+    return llm.with_structured_output(schema, method="json_schema")
+
+
+# Error class names (across provider SDKs) worth retrying; matched by name so
+# optional SDKs don't have to be imported here.
+_TRANSIENT_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "ServiceUnavailableError",
+    "ConnectError",
+    "ReadTimeout",
+}
+
+
+# HTTP statuses worth retrying, for SDK errors that carry a status_code
+_TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# After a 429, hold all LLM calls in this process for this long
+RATE_LIMIT_COOLDOWN_S = 60.0
+
+_cooldown_until = 0.0
+
+# Retry distribution: "attempt_<n>" counts retries after the n-th attempt failed,
+# "rate_limited" counts 429s. Read it for monitoring; reset with .clear().
+RETRY_STATS: Counter = Counter()
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Return True for network/rate-limit errors that may succeed on retry."""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES:
+        return True
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True for provider 429 / rate-limit errors."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return any(cls.__name__ == "RateLimitError" for cls in type(error).__mro__)
+
+
+def cooldown_remaining() -> float:
+    """Seconds left in the current rate-limit cooldown (0.0 if none)."""
+    return max(0.0, _cooldown_until - time.monotonic())
+
+
+def _record_retry(error: BaseException, attempt: int) -> None:
+    """Count a retry and start the rate-limit cooldown on 429s."""
+    global _cooldown_until
+    
+    RETRY_STATS[f"attempt_{attempt + 1}"] += 1
+    if is_rate_limit_error(error):
+        RETRY_STATS["rate_limited"] += 1
+        _cooldown_until = max(_cooldown_until, time.monotonic() + RATE_LIMIT_COOLDOWN_S)
+
+
+def backoff_delay(attempt: int, initial: float = 0.25, max_delay: float = 4.0) -> float:
+    """Exponential backoff with jitter for the given 0-based retry attempt."""
+    return min(max_delay, initial * 2 ** attempt) + random.uniform(0, initial)
+
+
+def call_with_backoff(call: Callable[[], T], max_attempts: int = 3) -> T:
+    """Run `call`, retrying transient errors with exponential backoff + jitter.
+    
+    Non-transient errors (auth, schema mismatch, bad request) are raised
+    immediately instead of being retried. A 429 starts a process-wide
+    cooldown; every call waits it out before sending another request.
+    
+    Args:
+        call: Zero-arg function making the LLM request
+        max_attempts: Total attempts including the first one
+        
+    Returns:
+        Result of the first successful call
+    
+    Examples:
+        evaluation = call_with_backoff(lambda: chain.invoke(inputs))
+    """
+    for attempt in range(max_attempts):
+        wait = cooldown_remaining()
+        if wait:
+            time.sleep(wait)
+        try:
+            return call()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient_error(e):
+                raise
+            _record_retry(e, attempt)
+            delay = backoff_delay(attempt)
+            logger.warning("Transient LLM error (attempt %d/%d), retrying in %.2fs: %s", attempt + 1, max_attempts, delay, e)
+            time.sleep(delay)
+
+
+async def acall_with_backoff(call: Callable[[], Awaitable[T]], max_attempts: int = 3) -> T:
+    """Async variant of call_with_backoff for coroutine-producing calls."""
+    for attempt in range(max_attempts):
+        wait = cooldown_remaining()
+        if wait:
+            await asyncio.sleep(wait)
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient_error(e):
+                raise
+            _record_retry(e, attempt)
+            delay = backoff_delay(attempt)
+            logger.warning("Transient LLM error (attempt %d/%d), retrying in %.2fs: %s", attempt + 1, max_attempts, delay, e)
+            await asyncio.sleep(delay)
+
+
+def invoke_with_retry(chain: Runnable, inputs: dict, max_retries: int = 3) -> Any:
+    """Invoke a chain with call_with_backoff retry semantics."""
+    return call_with_backoff(lambda: chain.invoke(inputs), max_attempts=max_retries)
+
+
+async def ainvoke_with_retry(chain: Runnable, inputs: dict, max_retries: int = 3) -> Any:
+    """Async variant of invoke_with_retry."""
+    return await acall_with_backoff(lambda: chain.ainvoke(inputs), max_attempts=max_retries)
+
+
+def cacheable_system_message(text: str, provider: Optional[LLMProvider] = None) -> SystemMessage:
+    """Build a static system message that providers can serve from prompt cache.
+    
+    Keep it first in the prompt and byte-identical across calls. Anthropic
+    needs an explicit cache_control marker; OpenAI and Gemini cache matching
+    prefixes automatically, so they get plain content.
+    
+    Args:
+        text: Fully rendered system prompt (no template variables)
+        provider: Provider the message will be sent to (None: auto-detected,
+            as get_llm does)
+        
+    Returns:
+        SystemMessage to use as a literal in ChatPromptTemplate.from_messages
+    """
+    if provider is None:
+        try:
+            provider = _detect_provider()
+        except ValueError:
+            pass
+    if provider == "anthropic":
+        return SystemMessage(content=[
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}},
+        ])
+    return SystemMessage(content=text)
 
 
 class LLMConfig:
@@ -127,23 +393,99 @@ class LLMConfig:
         "temperature": 0.3,
     }
     
-    # Router - needs fast, consistent decisions
-    ROUTER = {
+    # Evaluators - can use cheaper models
+    EVALUATORS = {
         "provider": "openai",
-        "model": "gpt-4",
+        "model": "gpt-4o-mini",  # Supports strict json_schema output
         "temperature": 0.0,
     }
     
-    # Evaluators - can use cheaper models
-    EVALUATORS = {
+    # Light evaluator - smaller, faster model for low-stakes validations
+    # (no failed checks, sources agree); the risk and sentiment evaluators
+    # re-run rejections and low-confidence verdicts on EVALUATORS
+    EVALUATORS_LIGHT = {
         "provider": "openai",
-        "model": "gpt-3.5-turbo",
+        "model": "gpt-4.1-nano",
         "temperature": 0.0,
     }
     
+    # Draft evaluator - small local model tried before EVALUATORS; the big
+    # model only runs when the draft is unsure. Opt in with EVALUATOR_DRAFT_MODEL.
+    EVALUATORS_DRAFT = {
+        "provider": "ollama",
+        "model": os.getenv("EVALUATOR_DRAFT_MODEL"),
+        "temperature": 0.0,
+    } if os.getenv("EVALUATOR_DRAFT_MODEL") else None
+    
     # Final aggregator - needs best reasoning
     AGGREGATOR = {
         "provider": "openai",
         "model": "gpt-4",
         "temperature": 0.1,
     }
+
+
+def _partial_field(chunk: Any, name: str) -> Any:
+    """Read a field from a streamed structured-output chunk (model or partial dict)."""
+    if isinstance(chunk, dict):
+        return chunk.get(name)
+    return getattr(chunk, name, None)
+
+
+class DraftVerifyLLM(Runnable):
+    """Try a cheap draft evaluator first; escalate to the main one when unsure.
+    
+    Draft results are accepted only when they are valid with confidence above
+    `min_confidence`. Anything else (including draft errors) goes to the main
+    evaluator, so output quality is bounded by the main model. The async
+    path streams the draft and escalates as soon as it reports is_valid=false.
+    """
+    
+    def __init__(self, draft: Runnable, main: Runnable, min_confidence: float = 0.85):
+        self.draft = draft
+        self.main = main
+        self.min_confidence = min_confidence
+    
+    def _accept(self, result: Any) -> bool:
+        return bool(getattr(result, "is_valid", False)) and getattr(result, "confidence", 0.0) > self.min_confidence
+    
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        try:
+            result = self.draft.invoke(input, config, **kwargs)
+            if self._accept(result):
+                return result
+        except Exception as e:
+            logger.warning("Draft evaluator failed, escalating: %s", e)
+        return self.main.invoke(input, config, **kwargs)
+    
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        try:
+            # Stream the draft so a rejection escalates as soon as is_valid=false
+            # is decoded, instead of waiting for the rest of the draft's tokens
+            result = None
+            async for chunk in self.draft.astream(input, config, **kwargs):
+                result = chunk
+                if _partial_field(chunk, "is_valid") is False:
+                    break
+            if result is not None and self._accept(result):
+                return result
+        except Exception as e:
+            logger.warning("Draft evaluator failed, escalating: %s", e)
+        return await self.main.ainvoke(input, config, **kwargs)
+
+
+def get_evaluator_llm(schema: type[BaseModel]) -> Runnable:
+    """Get the structured evaluator LLM for `schema`.
+    
+    Uses LLMConfig.EVALUATORS, fronted by LLMConfig.EVALUATORS_DRAFT when a
+    draft model is configured; DraftVerifyLLM streams the draft and
+    escalates on an early rejection.
+    
+    Examples:
+        chain = prompt | get_evaluator_llm(MarketEvaluation)
+    """
+    llm = get_llm_structured(schema, **LLMConfig.EVALUATORS)
+    if not LLMConfig.EVALUATORS_DRAFT:
+        return llm
+    draft = get_llm_structured(schema, **LLMConfig.EVALUATORS_DRAFT)
+    return DraftVerifyLLM(draft, llm)
@@ -1,9 +1,47 @@
-"""Logging utilities for the AI Decision Engine."""
+"""Logging utilities for the AI Decision Engine.
 
+Loggers hand records to a QueueHandler, which formats the message (and any
+traceback) in the calling thread and enqueues it; a background QueueListener
+per destination does the blocking stream/file writes, so log calls on the
+graph's hot path do not wait on I/O. Formatting stays with the caller so
+mutable arguments are rendered as they were when logged.
+"""
+
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# One queue + listener thread per destination (None = stdout), shared by all loggers
+_queue_handlers: dict[Optional[str], QueueHandler] = {}
+_queue_lock = threading.Lock()
+
+
+def _get_queue_handler(log_file: Optional[str] = None) -> QueueHandler:
+    """Return the process-wide queue handler feeding stdout or log_file."""
+    with _queue_lock:
+        handler = _queue_handlers.get(log_file)
+        if handler is None:
+            target = logging.StreamHandler(sys.stdout) if log_file is None else logging.FileHandler(log_file)
+            target.setFormatter(_FORMATTER)
+            
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, target)
+            listener.start()
+            # Flush queued records on interpreter exit
+            atexit.register(listener.stop)
+            
+            handler = QueueHandler(log_queue)
+            _queue_handlers[log_file] = handler
+        return handler
+
 
 def get_logger(
     name: str = "ai_engine",
@@ -27,22 +65,23 @@ def get_logger(
     if logger.handlers:
         return logger
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Console output (via the shared background listener)
+    logger.addHandler(_get_queue_handler())
     
-    # File handler (optional)
+    # File output (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_get_queue_handler(log_file))
     
     return logger
+
+
+def debug_exc_info(logger: logging.Logger) -> bool:
+    """exc_info for recoverable errors: attach the traceback only at DEBUG level.
+    
+    Capturing and formatting a traceback is the expensive part of logging an
+    error; branches that fall back to a safe default don't need it normally.
+    
+    Examples:
+        logger.error("Market worker error: %s", e, exc_info=debug_exc_info(logger))
+    """
+    return logger.isEnabledFor(logging.DEBUG)
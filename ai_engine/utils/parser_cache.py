@@ -0,0 +1,30 @@
+"""Parser cache - one output parser and format-instructions string per schema.
+
+`get_format_instructions()` serializes the Pydantic JSON schema every time it
+is called; agents share the parser and the rendered instructions instead of
+rebuilding them per invocation.
+"""
+
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from .resilient_parser import ResilientPydanticParser
+
+
+@lru_cache(maxsize=None)
+def get_parser(model_cls: type[BaseModel]) -> tuple[ResilientPydanticParser, str]:
+    """Get the shared parser and precomputed format instructions for a schema.
+    
+    Args:
+        model_cls: Pydantic model the LLM output is parsed into
+        
+    Returns:
+        (parser, format_instructions)
+    
+    Examples:
+        parser, format_instructions = get_parser(RiskEvaluation)
+        chain = prompt.partial(format_instructions=format_instructions) | llm | parser
+    """
+    parser = ResilientPydanticParser(pydantic_object=model_cls)
+    return parser, parser.get_format_instructions()
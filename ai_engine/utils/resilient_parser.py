@@ -0,0 +1,164 @@
+"""Resilient output parser shared by the LLM agents."""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import ValidationError
+
+from .json_fixer import fix_json_string
+
+# Precompiled once; normalize() runs on every LLM response
+_FENCED_BLOCK = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_THINK_BLOCK = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
+def normalize_llm_json(text: str) -> str:
+    """Normalize common LLM JSON quirks in a single pass.
+    
+    Drops <think>...</think> reasoning blocks, slices out a markdown code
+    fence (```json ... ```) when present and strips trailing commas before
+    closing braces/brackets.
+    
+    Args:
+        text: Raw LLM output
+        
+    Returns:
+        Normalized JSON text
+    """
+    if "<think>" in text:
+        text = _THINK_BLOCK.sub("", text)
+    
+    if text.lstrip().startswith("```") or "```json" in text:
+        match = _FENCED_BLOCK.search(text)
+        if match:
+            text = match.group(1)
+    
+    return _TRAILING_COMMA.sub(r"\1", text)
+
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def extract_json_object(text: str, opener: str = "{") -> Optional[str]:
+    """Slice out the first balanced JSON object, closing it if truncated.
+    
+    Single scan that tracks string literals and nesting, so braces inside
+    strings are ignored. When the text ends mid-object (e.g. the LLM hit its
+    token limit), an open string is terminated and the missing closing
+    brackets are appended.
+    
+    Args:
+        text: Text containing a JSON object somewhere
+        opener: "{" for an object, "[" for a top-level array
+        
+    Returns:
+        JSON text, or None if `opener` does not occur
+    """
+    start = text.find(opener)
+    if start < 0:
+        return None
+    
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return text[start:i + 1]
+    
+    tail = text[start:].rstrip()
+    if in_string:
+        tail += '"'
+    return _TRAILING_COMMA.sub(r"\1", tail.rstrip(",") + "".join(reversed(stack)))
+
+
+def _recover_json(text: str) -> Any:
+    """Staged recovery of a JSON value from malformed LLM output.
+    
+    Balanced-object extraction (closing truncated objects), then Python
+    literals and comments fixed up. Raises json.JSONDecodeError if nothing
+    parses.
+    """
+    opener = "[" if text.lstrip().startswith("[") else "{"
+    candidate = extract_json_object(text, opener) or text
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        return json.loads(fix_json_string(candidate))
+
+
+@lru_cache(maxsize=None)
+def _format_instructions_for(model_cls: type) -> str:
+    """Render format instructions (JSON schema walk) once per schema class."""
+    return PydanticOutputParser(pydantic_object=model_cls).get_format_instructions()
+
+
+class ResilientPydanticParser(PydanticOutputParser):
+    """Pydantic parser that normalizes common JSON issues before parsing."""
+    
+    def get_format_instructions(self) -> str:
+        """Return the format instructions, memoized per schema class."""
+        return _format_instructions_for(self.pydantic_object)
+    
+    def _validate_json(self, text: str):
+        """Parse and validate JSON text in one pydantic-core pass.
+        
+        Returns None when the text is not valid JSON, so recovery can take
+        over. Well-formed JSON that fails the schema will not recover and
+        raises OutputParserException.
+        """
+        try:
+            return self.pydantic_object.model_validate_json(text)
+        except ValidationError as e:
+            if e.errors()[0]["type"] == "json_invalid":
+                return None
+            raise OutputParserException(
+                f"Failed to parse {self.pydantic_object.__name__}: {e}", llm_output=text
+            ) from e
+    
+    def parse(self, text: str):
+        """Parse and validate the text, normalizing it only when needed.
+        
+        Bare JSON (the common case) is validated as-is, without the
+        normalization rewrite. Otherwise the text is normalized (code fences,
+        trailing commas) and retried; only still-malformed JSON goes through
+        the recovery stages (balanced-object extraction, closing truncated
+        output, literal fixes), and the recovered dict is validated once.
+        Failures raise OutputParserException.
+        """
+        stripped = text.strip()
+        if stripped.startswith(("{", "[")):
+            result = self._validate_json(stripped)
+            if result is not None:
+                return result
+        
+        normalized = normalize_llm_json(text)
+        if normalized != stripped and normalized.lstrip().startswith(("{", "[")):
+            result = self._validate_json(normalized)
+            if result is not None:
+                return result
+        
+        try:
+            return self.pydantic_object.model_validate(_recover_json(normalized))
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise OutputParserException(
+                f"Failed to parse {self.pydantic_object.__name__}: {e}", llm_output=text
+            ) from e
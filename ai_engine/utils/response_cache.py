@@ -0,0 +1,136 @@
+"""LLM response cache - skip repeated deterministic LLM calls.
+
+At temperature 0 the same prompt to the same model gives (near) identical
+replies, so the reply text is stored under a hash of the model and the
+full message list. Only use it for temperature-0 calls; sampled replies
+are meant to vary.
+
+Tiers:
+- In-process LRU (always on)
+- Disk via diskcache (optional, when installed; survives restarts)
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from .eval_cache import LRUCache
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = "~/.cache/rule_enrichment"
+
+
+def _open_disk_cache(directory: str):
+    """Return a diskcache.Cache for directory, or None if diskcache is missing."""
+    try:
+        import diskcache
+    except ImportError:
+        logger.debug("diskcache not installed, LLM response cache is in-process only. Run: poetry add diskcache")
+        return None
+    return diskcache.Cache(os.path.expanduser(directory))
+
+
+class ResponseCache:
+    """Cache of LLM reply text keyed by (node, model, prompt) hash.
+
+    Examples:
+        cache = ResponseCache(directory="~/.cache/rule_enrichment")
+        response = cache.invoke("parse_intent", llm, messages)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        maxsize: int = 256,
+        ttl_seconds: int = 86400,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: diskcache directory for the disk tier (None: in-process only)
+            maxsize: Max entries in the in-process tier
+            ttl_seconds: Expiry for entries in the disk tier
+        """
+        self.ttl_seconds = ttl_seconds
+        self._memory = LRUCache(maxsize)
+        self._disk = _open_disk_cache(directory) if directory else None
+
+    @staticmethod
+    def make_key(node: str, llm: Any, messages: list[BaseMessage]) -> str:
+        """Hash the calling node, the model and the full message list."""
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        payload = [node, str(model), [(message.type, message.content) for message in messages]]
+        return hashlib.sha256(json.dumps(payload, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up cached reply text by key."""
+        content = self._memory.get(key)
+        if content is None and self._disk is not None:
+            try:
+                content = self._disk.get(key)
+            except Exception as e:
+                logger.warning("LLM response cache disk read failed: %s", e)
+                content = None
+            if content is not None:
+                self._memory.set(key, content)
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        """Store reply text under key."""
+        self._memory.set(key, content)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, content, expire=self.ttl_seconds)
+            except Exception as e:
+                logger.warning("LLM response cache disk write failed: %s", e)
+
+    def invoke(self, node: str, llm: Any, messages: list[BaseMessage]) -> BaseMessage:
+        """Return the cached reply for messages, or call llm and store it.
+
+        Args:
+            node: Name of the calling node (part of the key)
+            llm: Chat model (temperature 0)
+            messages: Prompt messages
+
+        Returns:
+            The model's reply message (an AIMessage on a cache hit)
+        """
+        key = self.make_key(node, llm, messages)
+        content = self.get(key)
+        if content is not None:
+            logger.debug("LLM response cache hit for %s", node)
+            return AIMessage(content=content)
+
+        response = llm.invoke(messages)
+        if isinstance(response.content, str):
+            self.set(key, response.content)
+        return response
+
+    async def ainvoke(self, node: str, llm: Any, messages: list[BaseMessage]) -> BaseMessage:
+        """Async variant of invoke (awaits llm.ainvoke on a miss)."""
+        key = self.make_key(node, llm, messages)
+        content = self.get(key)
+        if content is not None:
+            logger.debug("LLM response cache hit for %s", node)
+            return AIMessage(content=content)
+
+        response = await llm.ainvoke(messages)
+        if isinstance(response.content, str):
+            self.set(key, response.content)
+        return response
+
+    def clear(self) -> None:
+        """Drop all in-process entries."""
+        self._memory.clear()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Process-wide response cache (disk tier in LLM_RESPONSE_CACHE_DIR)."""
+    return ResponseCache(directory=os.getenv("LLM_RESPONSE_CACHE_DIR", DEFAULT_CACHE_DIR))
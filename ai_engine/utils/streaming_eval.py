@@ -0,0 +1,111 @@
+"""Streaming evaluator calls that stop once the verdict is settled.
+
+Evaluator replies put the verdict first (is_valid, confidence, quality_score,
+issues) and spend most of their tokens on free-text summary and
+recommendation fields. Streaming the reply and parsing it incrementally lets
+the caller close the stream as soon as the fields it needs are final:
+
+- is_valid=true: stop once confidence and quality_score are final
+- is_valid=false: keep going until the issues list is final, then stop
+
+Free-text fields that were not generated are filled with a placeholder.
+If the reply ends before that point, it is parsed in full as usual.
+"""
+
+from contextlib import aclosing
+from typing import Any, Optional
+
+from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_partial_json
+from pydantic import BaseModel, ValidationError
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+VERDICT_FIELDS = ("is_valid", "confidence", "quality_score")
+
+NOT_GENERATED = "(not generated: evaluation stopped after the verdict)"
+
+# Re-parse the buffer every N chunks rather than on every token
+_PARSE_EVERY = 4
+
+
+def settled_fields(text: str) -> dict[str, Any]:
+    """Parse a partial JSON reply, keeping only fields whose values are final.
+    
+    A field is settled once a later key has started, so its value can no
+    longer grow (a number mid-stream like 0.8 may still become 0.85).
+    """
+    start = text.find("{")
+    if start < 0:
+        return {}
+    
+    partial = parse_partial_json(text[start:])
+    if not isinstance(partial, dict) or not partial:
+        return {}
+    
+    keys = list(partial)
+    return {key: partial[key] for key in keys[:-1]}
+
+
+def _early_result(schema: type[BaseModel], settled: dict[str, Any]) -> Optional[BaseModel]:
+    """Build the evaluation from settled fields if the verdict allows stopping."""
+    if not all(field in settled for field in VERDICT_FIELDS):
+        return None
+    if settled["is_valid"] is not True and "issues" not in settled:
+        return None
+    
+    values = dict(settled)
+    for name, field in schema.model_fields.items():
+        if name in values or not field.is_required():
+            continue
+        # Unfinished free text (half a sentence is worse than a marker)
+        values[name] = NOT_GENERATED
+    
+    try:
+        return schema.model_validate(values)
+    except ValidationError:
+        return None
+
+
+async def astream_evaluation(
+    chain: Runnable,
+    inputs: dict[str, Any],
+    schema: type[BaseModel],
+    parser: BaseOutputParser,
+) -> BaseModel:
+    """Stream an evaluator reply and stop as soon as the verdict is settled.
+    
+    Args:
+        chain: prompt | llm, producing message chunks (no output parser)
+        inputs: Prompt variables
+        schema: Evaluation model the reply conforms to
+        parser: Parser used when the reply completes before an early stop
+    
+    Returns:
+        Evaluation instance
+    
+    Examples:
+        evaluation = await astream_evaluation(prompt | llm, inputs, RiskEvaluation, parser)
+    """
+    buffer = ""
+    chunks = 0
+    
+    async with aclosing(chain.astream(inputs)) as stream:
+        async for chunk in stream:
+            content = getattr(chunk, "content", chunk)
+            if isinstance(content, str):
+                buffer += content
+            
+            chunks += 1
+            if chunks % _PARSE_EVERY:
+                continue
+            
+            evaluation = _early_result(schema, settled_fields(buffer))
+            if evaluation is not None:
+                logger.debug("Evaluator stream stopped early after %d chunks", chunks)
+                return evaluation
+    
+    return parser.parse(buffer)
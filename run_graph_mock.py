@@ -1,7 +1,7 @@
 """Run the hierarchical graph with mock data - no real integrations needed.
 
 This demonstrates the complete flow:
-  Supervisor → Router → Agents (market/sentiment/ml/risk) → Final Decision
+  Supervisor → Agents (market ∥ sentiment, then risk) → Final Decision
 
 All workers use mock data, but the graph execution is REAL.
 """
@@ -49,7 +49,7 @@ def run_mock_trading_decision():
     # Run the decision workflow
     print("🔄 Executing Hierarchical Graph...")
     print()
-    print("   Flow: Supervisor → Router → Agents → Aggregator")
+    print("   Flow: Supervisor → Agents → Aggregator")
     print()
     
     try:
@@ -175,7 +175,7 @@ if __name__ == "__main__":
         print()
         print("What happened:")
         print("  1. ✅ Supervisor analyzed request and generated plan")
-        print("  2. ✅ Router dynamically decided execution order")
+        print("  2. ✅ Plan selected which agent subgraphs to run")
         print("  3. ✅ Each agent subgraph executed (worker → evaluator)")
         print("  4. ✅ Aggregator synthesized final decision")
         print()
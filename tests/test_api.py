@@ -1,7 +1,12 @@
 """Tests for the FastAPI service."""
 
+import base64
+
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from ai_engine.api.models import DecisionRequest
 from ai_engine.api.server import app
 
 client = TestClient(app)
@@ -63,3 +68,52 @@ def test_decide_endpoint_validation():
     
     response = client.post("/ai/decide", json=request_data)
     assert response.status_code == 422  # Validation error
+
+
+def _b64(values, dtype):
+    """Base64 of values as a little-endian dtype buffer."""
+    return base64.b64encode(np.asarray(values, dtype=np.dtype(dtype).newbyteorder("<")).tobytes()).decode()
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_decision_request_decodes_b64_series(dtype):
+    """Test that base64 buffers round-trip into float64 arrays."""
+    prices = [50000.5, 50100.25, 50200.0]
+    volumes = [1000.0, 1100.5, 1050.25]
+    
+    request = DecisionRequest(
+        symbol="BTC/USD",
+        prices_b64=_b64(prices, dtype),
+        volumes_b64=_b64(volumes, dtype),
+        series_dtype=dtype,
+    )
+    
+    assert request.price_array.dtype == np.float64
+    np.testing.assert_array_equal(request.price_array, np.asarray(prices, dtype=dtype))
+    np.testing.assert_array_equal(request.volume_array, np.asarray(volumes, dtype=dtype))
+
+
+@pytest.mark.parametrize("encoded", [
+    "not base64!",
+    "",
+    base64.b64encode(b"\x00" * 6).decode(),  # not a whole number of float32 values
+])
+def test_decision_request_rejects_bad_b64_series(encoded):
+    """Test that invalid, empty or odd-length buffers fail validation."""
+    with pytest.raises(ValidationError):
+        DecisionRequest(symbol="BTC/USD", prices_b64=encoded, volumes=[1000.0])
+
+
+def test_decision_request_prefers_b64_over_list():
+    """Test that the base64 buffer wins when both formats are sent."""
+    request = DecisionRequest(
+        symbol="BTC/USD",
+        prices=[1.0, 2.0],
+        prices_b64=_b64([50000.0, 50100.0, 50200.0], "float64"),
+        volumes=[1.0, 2.0],
+        volumes_b64=_b64([1000.0, 1100.0, 1050.0], "float64"),
+        series_dtype="float64",
+    )
+    
+    assert request.price_array.tolist() == [50000.0, 50100.0, 50200.0]
+    assert request.volume_array.tolist() == [1000.0, 1100.0, 1050.0]
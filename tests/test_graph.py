@@ -1,8 +1,29 @@
 """Tests for the LangGraph workflow."""
 
+import asyncio
+
 import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableGenerator, RunnableLambda
+from langgraph.graph import END
 from ai_engine.graph import DecisionEngine
 from ai_engine.context.builder import ContextBuilder
+from ai_engine.graph import hierarchical_graph
+from ai_engine.graph.hierarchical_graph import FinalTradingDecision, dispatch_data_subgraphs
+import ai_engine.agents.market.evaluator as market_evaluator_module
+import ai_engine.agents.ml.evaluator as ml_evaluator_module
+from ai_engine.agents.ml.schema import MLEvaluation
+from ai_engine.agents.market.schema import MarketEvaluation
+import ai_engine.agents.risk.evaluator as risk_evaluator_module
+from ai_engine.agents.risk.evaluator import risk_evaluator
+from ai_engine.agents.risk.graph import should_retry_worker
+from ai_engine.agents.risk.schema import RiskEvaluation, RiskSubgraphStateInternal, RiskWorkerOutput
+import ai_engine.agents.supervisor.agent as supervisor_agent_module
+from ai_engine.context.schema import DecisionContext, SupervisorPlan
+from ai_engine.graph import rule_enrichment_graph
+from ai_engine.graph.rule_enrichment_graph import RuleEnrichmentState, fast_parse_intent
+from ai_engine.utils.eval_cache import EvaluationCache
+from ai_engine.utils.response_cache import ResponseCache
 
 
 def test_context_builder():
@@ -70,3 +91,268 @@ def test_decision_engine_with_rules():
     
     assert decision is not None
     assert "action" in decision
+
+
+def test_final_decision_dict_matches_model_dump():
+    """Test that the flat final decision's __dict__ copy equals model_dump()."""
+    decision = FinalTradingDecision(
+        action="buy",
+        confidence=0.7,
+        quantity=2,
+        reasoning="Bullish signals",
+        risk_approved=True,
+        stop_loss=95.0,
+    )
+    
+    assert dict(decision.__dict__) == decision.model_dump()
+
+
+def test_fast_parse_intent_only_matches_specific_queries():
+    """Test that explicit thresholds skip the LLM and vague queries do not."""
+    parsed = fast_parse_intent("buy ETH when RSI < 30 with $1000, stop loss 5%")
+    
+    assert parsed["action"] == "buy"
+    assert parsed["rule_conditions"] == [{"field": "market.rsi", "operator": "lt", "value": 30}]
+    assert parsed["position_size"] == "$1000" and parsed["stop_loss"] == "5%"
+    assert fast_parse_intent("buy ETH when RSI is low") is None
+
+
+def test_parse_intent_batches_concurrent_queries(monkeypatch):
+    """Test that concurrent parse_intent calls share one LLM request."""
+    calls = []
+    
+    def reply(messages):
+        calls.append(messages[-1].content)
+        return AIMessage(content='[{"action": "buy"}, {"action": "sell"}]')
+    
+    cache = ResponseCache()
+    monkeypatch.setattr(rule_enrichment_graph, "get_llm", lambda temperature: RunnableLambda(reply))
+    monkeypatch.setattr(rule_enrichment_graph, "get_response_cache", lambda: cache)
+    
+    async def run():
+        return await asyncio.gather(*[
+            rule_enrichment_graph.aparse_intent_node(RuleEnrichmentState(user_query=query))
+            for query in ("buy ETH when RSI is low", "sell BTC when the trend turns")
+        ])
+    
+    updates = asyncio.run(run())
+    
+    assert [update["parsed_intent"]["action"] for update in updates] == ["buy", "sell"]
+    assert len(calls) == 1 and "2) \"sell BTC" in calls[0]
+
+
+def test_risk_evaluator_evaluates_last_retry():
+    """Test that a valid output on the final retry is evaluated and accepted."""
+    state = RiskSubgraphStateInternal(
+        symbol="BTC/USD",
+        current_price=50000.0,
+        retry_count=2,
+        max_retries=2,
+        worker_output=RiskWorkerOutput(
+            stop_loss_check=True,
+            stop_loss_message="ok",
+            position_size_check=True,
+            position_size_message="ok",
+            exposure_check=True,
+            exposure_message="ok",
+            all_checks_passed=True,
+            risk_level="low",
+        ),
+    )
+    
+    evaluated = risk_evaluator(state)
+    
+    assert evaluated.evaluation.is_valid
+    assert should_retry_worker(evaluated) == END
+
+
+# Supervisor plans (required subgraphs) returned by the fake LLM, per request
+PLANS = {
+    "focus on the chart": ["market", "risk"],
+    "just the risk checks": ["risk"],
+}
+
+PLAN_FIELDS = {
+    "trading_rules": ["Use all available data"],
+    "execution_strategy": "Run all subgraphs in parallel where possible",
+    "reasoning": "fake plan",
+}
+
+PRICES = [100 + (i % 7) - 3 + i * 0.1 for i in range(60)]
+VOLUMES = [1000.0 + (i % 5) * 50 for i in range(60)]
+
+
+@pytest.fixture
+def fake_llms(monkeypatch):
+    """Replace every LLM chain on the decision path with canned replies.
+    
+    The supervisor plans from PLANS (keyed by user request). The sentiment
+    subgraph is stubbed out too (its worker makes HTTP requests), recording
+    its calls. Returns the list of stages called, in call order.
+    """
+    calls = []
+    
+    def plan(inputs):
+        calls.append("supervisor")
+        return SupervisorPlan(**PLAN_FIELDS, required_subgraphs=PLANS[inputs["user_request"]])
+    
+    async def stream_plan(chunks):
+        async for inputs in chunks:
+            calls.append("supervisor_stream")
+            yield {"reasoning": "fake"}
+            yield {**PLAN_FIELDS, "required_subgraphs": PLANS[inputs["user_request"]]}
+    
+    def market_eval(inputs):
+        calls.append("market")
+        return MarketEvaluation(is_valid=True, confidence=0.8, quality_score=0.8, summary="ok", recommendation="ok")
+    
+    def risk_eval(inputs):
+        calls.append("risk")
+        return AIMessage(content=RiskEvaluation(
+            is_valid=True, confidence=0.8, quality_score=0.8, summary="ok", recommendation="ok",
+        ).model_dump_json())
+    
+    def final_decision(inputs):
+        calls.append("final_decision")
+        return FinalTradingDecision(action="hold", confidence=0.5, quantity=0, reasoning="fake", risk_approved=True)
+    
+    def sentiment_subgraph(state):
+        calls.append("sentiment_subgraph")
+        return {}
+    
+    monkeypatch.setattr(supervisor_agent_module, "_PLAN_CACHE", EvaluationCache(SupervisorPlan))
+    monkeypatch.setattr(supervisor_agent_module, "_get_chain", lambda: RunnableLambda(plan))
+    monkeypatch.setattr(supervisor_agent_module, "_get_stream_chain", lambda: RunnableGenerator(stream_plan))
+    monkeypatch.setattr(market_evaluator_module, "_EVAL_CACHE", EvaluationCache(MarketEvaluation))
+    monkeypatch.setattr(market_evaluator_module, "_get_chain", lambda: RunnableLambda(market_eval))
+    monkeypatch.setattr(risk_evaluator_module, "_EVAL_CACHE", EvaluationCache(RiskEvaluation))
+    monkeypatch.setattr(
+        risk_evaluator_module,
+        "_get_chains",
+        lambda light=False: (RunnableLambda(risk_eval), RunnableLambda(risk_eval) | risk_evaluator_module._PARSER),
+    )
+    monkeypatch.setattr(hierarchical_graph, "_get_final_decision_chain", lambda: RunnableLambda(final_decision))
+    monkeypatch.setattr(hierarchical_graph, "create_sentiment_subgraph", lambda: RunnableLambda(sentiment_subgraph))
+    return calls
+
+
+def test_graph_skips_unplanned_sentiment(fake_llms):
+    """Test that a market+risk plan runs market and risk but never sentiment."""
+    engine = DecisionEngine()
+    
+    decision = asyncio.run(engine.decide_async("BTC/USD", PRICES, VOLUMES, "focus on the chart"))
+    
+    assert decision["supervisor_plan"]["required_subgraphs"] == ["market", "risk"]
+    assert "market" in fake_llms and "sentiment_subgraph" not in fake_llms
+    assert fake_llms[0] == "supervisor" and fake_llms[-1] == "final_decision"
+
+
+def test_dispatch_goes_to_risk_without_data_subgraphs():
+    """Test that a plan with no data subgraph dispatches straight to risk."""
+    context = DecisionContext(symbol="BTC/USD", prices=PRICES, volumes=VOLUMES, request_id="r")
+    context.supervisor_plan = SupervisorPlan(
+        trading_rules=[],
+        required_subgraphs=["risk"],
+        execution_strategy="risk only",
+        reasoning="no data needed",
+    )
+    
+    assert dispatch_data_subgraphs(context.to_state()) == "risk_subgraph"
+    
+    context.supervisor_plan.required_subgraphs = ["market", "risk"]
+    sends = dispatch_data_subgraphs(context.to_state())
+    assert [send.node for send in sends] == ["market_subgraph"]
+
+
+def test_decide_batch_isolates_failing_entry(fake_llms, monkeypatch):
+    """Test that one run raising inside the graph only fails its own entry."""
+    plan_requires = hierarchical_graph._plan_requires
+    
+    def failing_plan_requires(context, subgraph):
+        if context.symbol == "BAD/USD":
+            raise RuntimeError("dispatch failed")
+        return plan_requires(context, subgraph)
+    
+    monkeypatch.setattr(hierarchical_graph, "_plan_requires", failing_plan_requires)
+    engine = DecisionEngine()
+    
+    decisions = asyncio.run(engine.decide_batch([
+        {"symbol": "BTC/USD", "prices": PRICES, "volumes": VOLUMES, "user_request": "just the risk checks"},
+        {"symbol": "BAD/USD", "prices": PRICES, "volumes": VOLUMES, "user_request": "just the risk checks"},
+        {"symbol": "ETH/USD", "prices": PRICES, "volumes": VOLUMES, "user_request": "focus on the chart"},
+    ]))
+    
+    assert [d.get("symbol") for d in decisions] == ["BTC/USD", None, "ETH/USD"]
+    assert "dispatch failed" in decisions[1]["error"]
+    assert decisions[0]["reasoning"] == "fake" and decisions[2]["reasoning"] == "fake"
+
+
+def test_decide_stream_emits_stages_then_one_decision(fake_llms):
+    """Test that decide_stream yields plan and stage events, then one decision."""
+    engine = DecisionEngine()
+    
+    async def collect():
+        return [event async for event in engine.decide_stream("BTC/USD", PRICES, VOLUMES, "focus on the chart")]
+    
+    events = asyncio.run(collect())
+    kinds = [kind for kind, _ in events]
+    stages = [payload["stage"] for kind, payload in events if kind == "stage"]
+    
+    assert kinds[0] == "plan"
+    assert kinds.count("decision") == 1 and kinds[-1] == "decision"
+    assert stages == ["supervisor", "market_subgraph", "risk_subgraph"]
+    assert events[-1][1]["action"] == "hold" and events[-1][1]["symbol"] == "BTC/USD"
+    # The streamed plan was cached, so the graph's supervisor did not replan
+    assert fake_llms.count("supervisor_stream") == 1 and "supervisor" not in fake_llms
+
+
+def test_risk_light_evaluation_escalates_when_unsure(monkeypatch):
+    """Test that a low-confidence light-model verdict is re-run on the main model."""
+    calls = []
+    
+    def chains(light=False):
+        def reply(inputs):
+            calls.append("light" if light else "main")
+            return AIMessage(content=RiskEvaluation(
+                is_valid=True,
+                confidence=0.6 if light else 0.9,
+                quality_score=0.8,
+                summary="ok",
+                recommendation="ok",
+            ).model_dump_json())
+        return RunnableLambda(reply), RunnableLambda(reply) | risk_evaluator_module._PARSER
+    
+    monkeypatch.setattr(risk_evaluator_module, "_EVAL_CACHE", EvaluationCache(RiskEvaluation))
+    monkeypatch.setattr(risk_evaluator_module, "_get_chains", chains)
+    state = RiskSubgraphStateInternal(
+        symbol="BTC/USD",
+        current_price=50000.0,
+        worker_output=RiskWorkerOutput(
+            stop_loss_check=True,
+            stop_loss_message="ok",
+            position_size_check=True,
+            position_size_message="ok",
+            exposure_check=True,
+            exposure_message="ok",
+            all_checks_passed=True,
+            risk_level="medium",
+        ),
+    )
+    
+    evaluated = risk_evaluator(state)
+    
+    assert calls == ["light", "main"]
+    assert evaluated.evaluation.confidence == 0.9
+
+
+def test_ml_subgraph_node_runs_ml_subgraph(monkeypatch):
+    """Test that the (not yet wired) ML node builds its state and runs the subgraph."""
+    evaluation = MLEvaluation(is_valid=True, confidence=0.9, quality_score=0.9, summary="ok", recommendation="ok")
+    monkeypatch.setattr(ml_evaluator_module, "_EVAL_CACHE", EvaluationCache(MLEvaluation))
+    monkeypatch.setattr(ml_evaluator_module, "_get_chain", lambda: RunnableLambda(lambda inputs: evaluation))
+    context = DecisionContext(symbol="BTC/USD", prices=PRICES, volumes=VOLUMES, request_id="r")
+    
+    output = asyncio.run(hierarchical_graph.aml_subgraph_node(context))["ml_agent_output"]
+    
+    assert "error" not in output
+    assert output["predicted_direction"] in ("up", "down", "neutral")
@@ -86,3 +86,16 @@ def test_risk_constraints():
     assert "all_checks_passed" in result
     assert "risk_signal" in result
     assert result["risk_signal"] in ["proceed", "block"]
+
+
+def test_market_indicators_accept_arrays():
+    """Test that list and numpy inputs give the same indicators."""
+    import numpy as np
+    
+    prices = [100 + (i % 7) - 3 * (i % 3) for i in range(60)]
+    volumes = [1000 + 10 * i for i in range(60)]
+    
+    from_lists = get_market_indicators("BTC/USD", prices, volumes)
+    from_arrays = get_market_indicators("BTC/USD", np.array(prices), np.array(volumes))
+    
+    assert from_lists == pytest.approx(from_arrays)
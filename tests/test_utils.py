@@ -0,0 +1,269 @@
+"""Tests for the utils layer."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableGenerator, RunnableLambda
+from pydantic import BaseModel
+
+from ai_engine.utils.eval_cache import EvaluationCache, series_digest
+from ai_engine.utils import llm_v2
+from ai_engine.utils.llm_v2 import DraftVerifyLLM, call_with_backoff
+from ai_engine.utils.resilient_parser import ResilientPydanticParser
+from ai_engine.utils.response_cache import ResponseCache
+from ai_engine.utils.streaming_eval import NOT_GENERATED, astream_evaluation
+
+
+class DummyStreamedEvaluation(BaseModel):
+    """Evaluation model with free-text fields for streaming tests."""
+    
+    is_valid: bool
+    confidence: float
+    quality_score: float
+    issues: list[str] = []
+    summary: str
+    recommendation: str
+
+
+class DummyEvaluation(BaseModel):
+    """Minimal evaluation model for cache tests."""
+    
+    is_valid: bool
+    confidence: float
+
+
+def test_evaluation_cache_quantizes_inputs():
+    """Test that nearby inputs share one cached evaluation."""
+    cache = EvaluationCache(DummyEvaluation, quantize={"rsi": 1.0})
+    calls = []
+    
+    def call():
+        calls.append(1)
+        return DummyEvaluation(is_valid=True, confidence=0.8)
+    
+    first = cache.get_or_call({"symbol": "BTC", "rsi": 41.2}, call)
+    second = cache.get_or_call({"symbol": "BTC", "rsi": 40.9}, call)
+    
+    assert len(calls) == 1
+    assert first == second
+
+
+def test_evaluation_cache_distinguishes_signals():
+    """Test that categorical inputs are part of the key."""
+    cache = EvaluationCache(DummyEvaluation, quantize={"rsi": 1.0})
+    
+    cache.get_or_call({"rsi": 41.0, "signal": "bullish"}, lambda: DummyEvaluation(is_valid=True, confidence=0.8))
+    result = cache.get_or_call({"rsi": 41.0, "signal": "bearish"}, lambda: DummyEvaluation(is_valid=False, confidence=0.2))
+    
+    assert result.is_valid is False
+
+
+def test_evaluation_cache_skips_rejections():
+    """Test that a rejection is re-evaluated instead of served from cache."""
+    cache = EvaluationCache(DummyEvaluation)
+    results = iter([DummyEvaluation(is_valid=False, confidence=0.3), DummyEvaluation(is_valid=True, confidence=0.9)])
+    
+    first = cache.get_or_call({"rsi": 41.0}, lambda: next(results))
+    second = cache.get_or_call({"rsi": 41.0}, lambda: next(results))
+    
+    assert first.is_valid is False
+    assert second.is_valid is True
+
+
+def test_evaluation_cache_relative_bins_scale_with_price():
+    """Test that relative bins collapse nearby BTC-scale EMAs but not distant ones."""
+    cache = EvaluationCache(DummyEvaluation, relative={"ema_short": 0.0005})
+    
+    assert cache.make_key({"ema_short": 50000.0}) == cache.make_key({"ema_short": 50004.0})
+    assert cache.make_key({"ema_short": 50000.0}) != cache.make_key({"ema_short": 50500.0})
+
+
+def test_series_digest_matches_lists_and_arrays():
+    """Test that the content hash ignores container type but not values."""
+    import numpy as np
+    
+    prices = [100.0, 101.5, 99.25]
+    volumes = [10.0, 12.0, 9.0]
+    
+    assert series_digest(prices, volumes) == series_digest(np.array(prices), np.array(volumes))
+    assert series_digest(prices, volumes) != series_digest(volumes, prices)
+
+
+def test_draft_verify_llm_escalates_only_when_unsure():
+    """Test that confident draft results skip the main evaluator."""
+    main_calls = []
+    
+    def main(inputs):
+        main_calls.append(inputs)
+        return DummyEvaluation(is_valid=True, confidence=0.99)
+    
+    def draft(inputs):
+        return DummyEvaluation(is_valid=True, confidence=inputs["draft_confidence"])
+    
+    llm = DraftVerifyLLM(RunnableLambda(draft), RunnableLambda(main), min_confidence=0.85)
+    
+    assert llm.invoke({"draft_confidence": 0.9}).confidence == 0.9
+    assert main_calls == []
+    
+    assert llm.invoke({"draft_confidence": 0.5}).confidence == 0.99
+    assert len(main_calls) == 1
+
+
+def test_draft_verify_llm_stops_streaming_on_rejection():
+    """Test that the async path escalates as soon as the draft says invalid."""
+    streamed = []
+    
+    async def draft(inputs):
+        async for _ in inputs:
+            pass
+        for chunk in ({}, {"is_valid": False}, {"is_valid": False, "confidence": 0.1}):
+            streamed.append(chunk)
+            yield chunk
+    
+    main = RunnableLambda(lambda x: DummyEvaluation(is_valid=True, confidence=0.99))
+    llm = DraftVerifyLLM(RunnableGenerator(draft), main)
+    
+    assert asyncio.run(llm.ainvoke({})).confidence == 0.99
+    assert len(streamed) == 2
+
+
+def test_evaluator_llm_streams_the_draft(monkeypatch):
+    """Test that the wired-up draft evaluator streams, not one batched chunk."""
+    streamed = []
+    
+    async def draft(inputs):
+        async for _ in inputs:
+            pass
+        for chunk in ({}, {"is_valid": False}, {"is_valid": False, "confidence": 0.1}):
+            streamed.append(chunk)
+            yield chunk
+    
+    main = RunnableLambda(lambda x: DummyEvaluation(is_valid=True, confidence=0.99))
+    monkeypatch.setattr(llm_v2.LLMConfig, "EVALUATORS_DRAFT", {"provider": "ollama", "model": "draft"})
+    monkeypatch.setattr(
+        llm_v2, "get_llm_structured",
+        lambda schema, **kwargs: RunnableGenerator(draft) if kwargs["model"] == "draft" else main,
+    )
+    
+    llm = llm_v2.get_evaluator_llm(DummyEvaluation)
+    
+    assert asyncio.run(llm.ainvoke({})).confidence == 0.99
+    assert len(streamed) == 2
+
+
+def test_call_with_backoff_retries_only_transient_errors(monkeypatch):
+    """Test that transient errors are retried and others raise immediately."""
+    monkeypatch.setattr(llm_v2.time, "sleep", lambda seconds: None)
+    calls = []
+    
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TimeoutError("slow provider")
+        return "ok"
+    
+    def unauthorized():
+        calls.append(1)
+        raise ValueError("invalid api key")
+    
+    assert call_with_backoff(flaky) == "ok"
+    assert len(calls) == 3
+    
+    calls.clear()
+    with pytest.raises(ValueError):
+        call_with_backoff(unauthorized)
+    assert len(calls) == 1
+
+
+def test_rate_limit_starts_cooldown(monkeypatch):
+    """Test that a 429 is counted and holds the next request for the cooldown."""
+    sleeps = []
+    monkeypatch.setattr(llm_v2.time, "sleep", sleeps.append)
+    monkeypatch.setattr(llm_v2, "_cooldown_until", 0.0)
+    llm_v2.RETRY_STATS.clear()
+    
+    class RateLimitError(Exception):
+        pass
+    
+    calls = []
+    
+    def limited():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RateLimitError("429 Too Many Requests")
+        return "ok"
+    
+    assert call_with_backoff(limited) == "ok"
+    assert llm_v2.RETRY_STATS["rate_limited"] == 1
+    assert llm_v2.RETRY_STATS["attempt_1"] == 1
+    assert max(sleeps) > llm_v2.RATE_LIMIT_COOLDOWN_S - 1
+
+
+def test_resilient_parser_normalizes_fences_and_trailing_commas():
+    """Test that fenced JSON with trailing commas parses in one pass."""
+    parser = ResilientPydanticParser(pydantic_object=DummyEvaluation)
+    
+    text = '```json\n{"is_valid": true, "confidence": 0.7,}\n```'
+    
+    assert parser.parse(text) == DummyEvaluation(is_valid=True, confidence=0.7)
+
+
+def test_astream_evaluation_stops_after_valid_verdict():
+    """Test that a valid verdict closes the stream before the free text."""
+    reply = (
+        '{"is_valid": true, "confidence": 0.85, "quality_score": 0.9, '
+        '"issues": [], "summary": "a long summary", "recommendation": "a long recommendation"}'
+    )
+    tokens = [reply[i:i + 8] for i in range(0, len(reply), 8)]
+    streamed = []
+    
+    async def llm(inputs):
+        async for _ in inputs:
+            pass
+        for token in tokens:
+            streamed.append(token)
+            yield token
+    
+    parser = ResilientPydanticParser(pydantic_object=DummyStreamedEvaluation)
+    evaluation = asyncio.run(
+        astream_evaluation(RunnableGenerator(llm), {}, DummyStreamedEvaluation, parser)
+    )
+    
+    assert evaluation.is_valid and evaluation.confidence == 0.85
+    assert evaluation.summary == NOT_GENERATED
+    assert len(streamed) < len(tokens)
+
+
+def test_resilient_parser_recovers_truncated_output():
+    """Test that prose-wrapped, truncated JSON is closed and validated once."""
+    parser = ResilientPydanticParser(pydantic_object=DummyStreamedEvaluation)
+    
+    text = (
+        'Here is the evaluation: {"is_valid": True, "confidence": 0.8, "quality_score": 0.7, '
+        '"issues": ["rsi {edge}"], "summary": "ok", "recommendation": "cut off'
+    )
+    evaluation = parser.parse(text)
+    
+    assert evaluation.is_valid and evaluation.issues == ["rsi {edge}"]
+    assert evaluation.recommendation == "cut off"
+
+
+def test_response_cache_skips_repeated_prompts():
+    """Test that an identical prompt is answered from cache, a new one is not."""
+    cache = ResponseCache()
+    calls = []
+    
+    def reply(messages):
+        calls.append(messages)
+        return AIMessage(content=f"reply {len(calls)}")
+    
+    llm = RunnableLambda(reply)
+    prompt = [SystemMessage(content="Parse the query"), HumanMessage(content="buy ETH when RSI is low")]
+    
+    first = cache.invoke("parse_intent", llm, prompt)
+    second = cache.invoke("parse_intent", llm, list(prompt))
+    other = cache.invoke("parse_intent", llm, prompt[:1] + [HumanMessage(content="sell BTC")])
+    
+    assert first.content == second.content == "reply 1"
+    assert other.content == "reply 2"
@@ -88,7 +88,6 @@ def save_mermaid_diagram():
             <h3>Architecture Flow:</h3>
             <ul>
                 <li><strong>Supervisor Agent</strong>: Analyzes user request and generates execution plan (LCEL)</li>
-                <li><strong>Router</strong>: LLM dynamically decides which subgraph to execute next</li>
                 <li><strong>Agent Subgraphs</strong>: Each runs worker → evaluator pattern
                     <ul>
                         <li>Market Agent: Technical analysis (RSI, EMA, volume)</li>
@@ -126,34 +125,22 @@ def print_graph_structure():
     supervisor (Supervisor Agent)
       - Generates execution plan
       - Extracts trading rules
+      (market worker prefetches meanwhile)
       ↓
-    [Router decides next action]
-      ↓
+    Send fan-out (parallel, planned subgraphs only)
     ├─→ market_subgraph
     │     - Worker: Technical analysis (deterministic)
     │     - Evaluator: Validates quality (LCEL)
-    │     ↓
-    │   [Router decides next]
-    │
-    ├─→ sentiment_subgraph
-    │     - Worker: Social sentiment (deterministic)
-    │     - Evaluator: Checks reliability (LCEL)
-    │     ↓
-    │   [Router decides next]
-    │
-    ├─→ ml_subgraph
-    │     - Worker: ML predictions (deterministic)
-    │     - Evaluator: Judges confidence (LCEL)
-    │     ↓
-    │   [Router decides next]
     │
-    ├─→ risk_subgraph
-    │     - Worker: Risk validation (deterministic)
-    │     - Evaluator: Reviews risk management (LCEL)
-    │     ↓
-    │   [Router decides next]
-    │
-    └─→ final_decision
+    └─→ sentiment_subgraph
+          - Worker: Social sentiment (deterministic)
+          - Evaluator: Checks reliability (LCEL)
+      ↓
+    risk_subgraph
+      - Worker: Risk validation (deterministic)
+      - Evaluator: Reviews risk management (LCEL)
+      ↓
+    final_decision
           - Aggregates all subgraph outputs
           - Applies trading rules
           - Generates final decision (LCEL)
@@ -162,7 +149,7 @@ def print_graph_structure():
     """)
     
     print("\nKey Features:")
-    print("  • Dynamic Routing: LLM decides execution flow (not hardcoded)")
+    print("  • Static DAG: supervisor plan decides which subgraphs do work")
     print("  • Each Agent = Subgraph: Self-contained worker → evaluator")
     print("  • LCEL Everywhere: All LLM calls use prompt | llm | parser")
     print("  • Model-Agnostic: Can use Claude, GPT, or Gemini per agent")